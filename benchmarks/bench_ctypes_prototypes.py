@@ -0,0 +1,62 @@
+"""
+Per-call overhead of the ctypes wrappers: prototypes bound once in setup_library() compared to looking up the symbol
+and assigning restype/argtypes on every call, as the wrappers did before.
+"""
+import ctypes
+
+from pykinect_azure.k4a import _k4a
+from pykinect_azure.k4a._k4atypes import k4a_capture_t, k4a_device_t, k4a_image_t
+from pykinect_azure.k4abt import _k4abt
+from pykinect_azure.k4abt._k4abtTypes import k4abt_frame_t, k4abt_skeleton_t
+
+
+def legacy_get_capture(dll, device_handle, capture_handle, timeout):
+    _k4a_device_get_capture = dll.k4a_device_get_capture
+    _k4a_device_get_capture.restype = ctypes.c_int
+    _k4a_device_get_capture.argtypes = (k4a_device_t, ctypes.POINTER(k4a_capture_t), ctypes.c_int32)
+
+    return _k4a_device_get_capture(device_handle, capture_handle, timeout)
+
+
+def legacy_get_buffer(dll, image_handle):
+    _k4a_image_get_buffer = dll.k4a_image_get_buffer
+    _k4a_image_get_buffer.restype = ctypes.POINTER(ctypes.c_uint8)
+    _k4a_image_get_buffer.argtypes = (k4a_image_t,)
+
+    return _k4a_image_get_buffer(image_handle)
+
+
+def legacy_get_body_skeleton(dll, body_frame_handle, index, skeleton):
+    _k4abt_frame_get_body_skeleton = dll.k4abt_frame_get_body_skeleton
+    _k4abt_frame_get_body_skeleton.restype = ctypes.c_int
+    _k4abt_frame_get_body_skeleton.argtypes = (k4abt_frame_t, ctypes.c_uint32, ctypes.POINTER(k4abt_skeleton_t))
+
+    return _k4abt_frame_get_body_skeleton(body_frame_handle, index, skeleton)
+
+
+def bench_get_capture_bound(benchmark, stub_sdk):
+    capture = k4a_capture_t()
+    assert benchmark(_k4a.k4a_device_get_capture, k4a_device_t(), capture, 0) == 0
+
+
+def bench_get_capture_per_call(benchmark, stub_sdk):
+    capture = k4a_capture_t()
+    assert benchmark(legacy_get_capture, stub_sdk, k4a_device_t(), capture, 0) == 0
+
+
+def bench_get_buffer_bound(benchmark, stub_sdk):
+    assert benchmark(_k4a.k4a_image_get_buffer, k4a_image_t())
+
+
+def bench_get_buffer_per_call(benchmark, stub_sdk):
+    assert benchmark(legacy_get_buffer, stub_sdk, k4a_image_t())
+
+
+def bench_get_body_skeleton_bound(benchmark, stub_sdk):
+    skeleton = k4abt_skeleton_t()
+    assert benchmark(_k4abt.k4abt_frame_get_body_skeleton, k4abt_frame_t(), 0, skeleton) == 0
+
+
+def bench_get_body_skeleton_per_call(benchmark, stub_sdk):
+    skeleton = k4abt_skeleton_t()
+    assert benchmark(legacy_get_body_skeleton, stub_sdk, k4abt_frame_t(), 0, skeleton) == 0
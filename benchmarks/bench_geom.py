@@ -0,0 +1,22 @@
+"""
+Geometry computed for each pointer in each frame: intersections with the screen plane and, in fine pointing mode, the
+pointing sphere, and the deviation of the hand from its path during selection detection
+"""
+from geom import Line, Point3D, Spehre3D
+from screen import SCREEN_SINGLE_ABOVE_FHD
+
+
+def bench_plane_intersect_line(benchmark, pointer):
+    plane = SCREEN_SINGLE_ABOVE_FHD[0].screen_plain
+    _, behind = benchmark(plane.intersect_line, pointer)
+    assert not behind
+
+
+def bench_sphere_intersect_line(benchmark, pointer):
+    sphere = Spehre3D(Point3D(-180, -410, 2010), 2000)
+    assert len(benchmark(sphere.intersect_line, pointer)) == 2
+
+
+def bench_line_orthogonal_vector_to_point(benchmark):
+    line = Line.from_points(Point3D(-160, 0, 1450), Point3D(-110, 0, 0))
+    assert benchmark(line.get_orthogonal_vector_to_point, Point3D(-150, 0, 1420)).get_magnitude() > 0
@@ -0,0 +1,25 @@
+"""
+Interaction stage of the camera loop for one frame of a scripted session: histories, pointing, operation detection
+and touch injection
+"""
+import itertools
+
+import touchcontrol as tc
+
+
+def bench_process_bodyresult(benchmark, interaction_controller, workload_frames):
+    from cameracontrol import BodyResult
+
+    bodyresults = [BodyResult(*frame.get_bodyresult_args()) for frame in workload_frames]
+    message = {"centercross": False, "timestamp_usec": None,
+               "right": {"present": False, "fine": False, "position": {"x": 0, "y": 0}},
+               "left": {"present": False, "fine": False, "position": {"x": 0, "y": 0}}}
+    frame_numbers = itertools.count()
+
+    def process_next_frame():
+        index = next(frame_numbers) % len(bodyresults)
+        with tc.touch_frame(workload_frames[index].timestamp_usec):
+            interaction_controller.fill_histories(bodyresults[index])
+            interaction_controller.process_bodyresult(bodyresults[index], message)
+
+    benchmark(process_next_frame)
@@ -0,0 +1,23 @@
+"""
+Metrics: recording a stage duration on the camera thread, and rendering all metrics on the thread serving a scrape
+"""
+import pytest
+
+from utils import LatencyWindow, DURATION_BUCKETS
+
+
+@pytest.mark.parametrize("histogram_bounds", [(), DURATION_BUCKETS], ids=["window", "window+histogram"])
+def bench_record_duration(benchmark, histogram_bounds):
+    window = LatencyWindow(256, histogram_bounds)
+    benchmark(window.add, 0.012)
+
+
+def bench_render_metrics(benchmark, interaction_controller, workload_frames):
+    from cameracontrol import BodyResult
+
+    for frame in workload_frames[:90]:
+        interaction_controller.fill_histories(BodyResult(*frame.get_bodyresult_args()))
+        interaction_controller.stage_timer.record("frame", 0.03)
+
+    text = benchmark(interaction_controller.metrics.render)
+    assert 'mgc_stage_duration_seconds_count{stage="frame"} 90' in text
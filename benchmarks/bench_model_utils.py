@@ -0,0 +1,29 @@
+"""
+Preprocessing of the hand landmarks detected by mediapipe, before the hand state is classified
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+model = pytest.importorskip("model")  # also loads the keypoint classifier, which needs tensorflow
+
+IMAGE = np.zeros((540, 960, 3), dtype=np.uint8)
+
+# 21 landmarks of a hand, in normalized image coordinates as mediapipe reports them
+LANDMARKS = SimpleNamespace(landmark=[SimpleNamespace(x=0.4 + 0.005 * (index % 5), y=0.5 - 0.01 * index, z=0.0)
+                                      for index in range(21)])
+
+
+def bench_calc_bounding_rect(benchmark):
+    x1, y1, x2, y2 = benchmark(model.calc_bounding_rect, IMAGE, LANDMARKS)
+    assert x1 < x2 and y1 < y2
+
+
+def bench_calc_landmark_list(benchmark):
+    assert len(benchmark(model.calc_landmark_list, IMAGE, LANDMARKS)) == 21
+
+
+def bench_pre_process_landmark(benchmark):
+    landmark_list = model.calc_landmark_list(IMAGE, LANDMARKS)
+    assert len(benchmark(model.pre_process_landmark, landmark_list)) == 42
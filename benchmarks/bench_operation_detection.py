@@ -0,0 +1,106 @@
+"""
+Accuracy of the operation detection on scripted sessions, compared to the operation the operator intends to perform.
+Selections are scored per push: detect_*_selection() fires once per push, so a push counts as detected if its
+selection is detected in any frame of it. All other operations are scored per frame, leaving out the frames while
+moving from one gesture to the next, where the intended operation is ambiguous. Each operation must reach its recall
+threshold, so that rare operations are checked as well as frequent ones. Run with --accuracy-sessions 2000 for a
+thorough check.
+"""
+from collections import Counter
+
+from constants import Operation
+from gesture_workload import generate_sessions
+
+SELECT_OPERATIONS = (Operation.SELECT_LEFTHAND, Operation.SELECT_RIGHTHAND)
+
+
+def detect_operations(interaction_controller, sessions) -> tuple[Counter, Counter]:
+    """
+    Runs the interaction stage over the frames of sessions
+    :param interaction_controller: The controller, its histories are cleared before each session
+    :param sessions: The sessions, as GestureWorkload
+    :return: Tuple (confusion matrix as Counter (intended operation, detected operation) -> frames, outside of pushes;
+    pushes as Counter (select operation, whether it was detected) -> pushes)
+    """
+    from cameracontrol import BodyResult
+
+    message = {"centercross": False, "timestamp_usec": None,
+               "right": {"present": False, "fine": False, "position": {"x": 0, "y": 0}},
+               "left": {"present": False, "fine": False, "position": {"x": 0, "y": 0}}}
+    confusion = Counter()
+    pushes = Counter()
+    for session in sessions:
+        for history in (interaction_controller.left_hand_coords_history, interaction_controller.right_hand_coords_history,
+                        interaction_controller.chest_coordinate_history, interaction_controller.left_hand_state_history,
+                        interaction_controller.right_hand_state_history):
+            history.clear()
+
+        push, push_detected = None, False  # select operation of the push in progress
+        for frame in session.frames():
+            bodyresult = BodyResult(*frame.get_bodyresult_args())
+            interaction_controller.fill_histories(bodyresult)
+            interaction_controller.process_bodyresult(bodyresult, message)
+            detected = interaction_controller.current_operation
+
+            if push is not None and frame.operation != push:
+                pushes[push, push_detected] += 1
+                push = None
+            if frame.operation in SELECT_OPERATIONS:
+                if push is None:
+                    push, push_detected = frame.operation, False
+                push_detected = push_detected or detected == push
+            elif frame.gesture != "transition":
+                confusion[frame.operation, detected] += 1
+        if push is not None:
+            pushes[push, push_detected] += 1
+    return confusion, pushes
+
+
+def parse_thresholds(value: str) -> dict[Operation, float]:
+    """
+    :param value: Thresholds as "OPERATION:recall" separated by spaces, e.g. "IDLE:0.95 ZOOM:0.9"
+    :return: Dict operation -> recall threshold
+    """
+    thresholds = {}
+    for item in value.split():
+        name, threshold = item.split(":")
+        thresholds[Operation[name]] = float(threshold)
+    return thresholds
+
+
+def bench_operation_detection_accuracy(benchmark, interaction_controller, request):
+    interaction_controller.touch_control_enabled = False  # detection only, touches would pile up in the backend
+    session_count = request.config.getoption("accuracy_sessions")
+    thresholds = parse_thresholds(request.config.getini("operation_recall_thresholds"))
+
+    sessions = list(generate_sessions(session_count, seed=0))
+    confusion, pushes = benchmark.pedantic(detect_operations, args=(interaction_controller, sessions),
+                                           rounds=1, iterations=1)
+
+    # recall of each operation: frames, or pushes for selections, in which the intended operation was detected
+    recalls = {}
+    for operation in Operation:
+        if operation in SELECT_OPERATIONS:
+            detected, total = pushes[operation, True], pushes[operation, True] + pushes[operation, False]
+        else:
+            detected = confusion[operation, operation]
+            total = sum(count for (intended, _), count in confusion.items() if intended == operation)
+        if total:
+            recalls[operation] = (detected / total, total)
+
+    benchmark.extra_info["recall"] = {operation.name: round(recall, 4) for operation, (recall, _) in recalls.items()}
+    benchmark.extra_info["confusion"] = {f"{intended.name} -> {detected.name}": count
+                                         for (intended, detected), count in confusion.most_common()}
+
+    failures = []
+    for operation, threshold in thresholds.items():
+        unit = "pushes" if operation in SELECT_OPERATIONS else "frames"
+        if operation not in recalls:
+            failures.append(f"  {operation.name}: no {unit} in the sessions")
+        elif recalls[operation][0] < threshold:
+            recall, total = recalls[operation]
+            failures.append(f"  {operation.name}: {recall:.1%} of {total} {unit}, below {threshold:.0%}")
+    mismatches = "\n".join(f"  {intended.name} detected as {detected.name}: {count}"
+                           for (intended, detected), count in confusion.most_common() if intended != detected)
+    assert not failures, "Operations detected below their recall threshold:\n" + "\n".join(failures) + \
+                         "\nFrames outside of pushes detected as another operation:\n" + mismatches
@@ -0,0 +1,23 @@
+"""
+Mapping of pointers to screen pixels, for each built-in screen layout
+"""
+import pytest
+
+import screen as screen_layouts
+
+# All built-in layouts, the pointer fixture points at a screen of each
+LAYOUTS = list(screen_layouts.SCREEN_ENVIRONMENTS)
+
+
+def bench_coords_to_px(benchmark, pointer):
+    screen = screen_layouts.SCREEN_SINGLE_ABOVE_FHD[0]
+    point, _ = screen.screen_plain.intersect_line(pointer)
+    x, y = benchmark(screen.coords_to_px, point)
+    assert 0 <= x < screen.px_width and 0 <= y < screen.px_height
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def bench_get_screen_intersection(benchmark, interaction_controller, pointer, layout):
+    interaction_controller.set_screen_environment(screen_layouts.SCREEN_ENVIRONMENTS[layout])
+    _, x, y, _ = benchmark(interaction_controller.get_screen_intersection, pointer)
+    assert x != -1 and y != -1
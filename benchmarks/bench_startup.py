@@ -0,0 +1,48 @@
+"""
+Startup: importing the modules the window (or the headless service) needs before it starts, in a fresh interpreter with
+-X importtime. The import times of the slowest modules are saved with the benchmark (extra_info), to see what a
+regression was caused by.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+# Dependencies that must only be imported once the camera starts or in the warm-up
+DEFERRED_IMPORTS = ("mediapipe", "tensorflow")
+
+
+def import_times(module_name: str) -> dict[str, tuple[int, int]]:
+    """
+    Imports a module in a new interpreter
+    :param module_name: Name of the module
+    :return: Dictionary module name: (self, cumulative) import time in microseconds, of all modules that were imported
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                            cwd=SRC, capture_output=True, text=True)
+    if result.returncode != 0:
+        pytest.skip(f"cannot import {module_name}: {result.stderr.strip().splitlines()[-1]}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, indented by nesting
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+
+@pytest.mark.parametrize("module_name", ["interaction_controller", "service", "gui"])
+def bench_import(benchmark, module_name):
+    import_times(module_name)  # skips if the module cannot be imported here, and fills the file system cache
+    times = benchmark.pedantic(import_times, args=(module_name,), rounds=5, iterations=1)
+
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:15]
+    benchmark.extra_info["import_time_usec"] = times[module_name][1]
+    benchmark.extra_info["slowest_imports_usec"] = {name: self_time for name, (self_time, _) in slowest}
+
+    assert not [name for name in times if name.split(".")[0] in DEFERRED_IMPORTS]
@@ -0,0 +1,26 @@
+"""
+Processing of the operator's skeleton in TrackerController after each body tracker frame
+"""
+import itertools
+import math
+
+
+def bench_filter_body_coordinates(benchmark, tracker_controller, workload_frames):
+    bodies = [frame.get_body() for frame in workload_frames]
+    frame_period = tracker_controller.frame_period
+    tracker_controller.initialize_filters(bodies[0], 0)
+    frame_numbers = itertools.count(1)
+
+    def filter_next_body():
+        # device time keeps increasing while the session repeats, as for a camera
+        frame_number = next(frame_numbers)
+        tracker_controller.filter_body_coordinates(bodies[frame_number % len(bodies)], frame_number * frame_period)
+
+    benchmark(filter_next_body)
+    assert tracker_controller.dropped_frames == 0
+
+
+def bench_correct_roll_pitch(benchmark, tracker_controller, workload_frames):
+    tracker_controller.pitch = 2 * math.pi / 180
+    tracker_controller.roll = -1 * math.pi / 180
+    benchmark(tracker_controller.correct_roll_pitch, workload_frames[0].get_body())
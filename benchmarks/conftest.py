@@ -0,0 +1,115 @@
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+STUB_SOURCE = os.path.join(os.path.dirname(__file__), "stub_k4a.c")
+
+# Saved runs (--benchmark-save, --benchmark-autosave) are kept here, wherever pytest is started from, so that the
+# baselines can be committed
+BASELINE_STORAGE = os.path.join(os.path.dirname(__file__), "baselines")
+DEFAULT_STORAGE = "file://./.benchmarks"  # pytest-benchmark's default
+
+
+def pytest_addoption(parser):
+    parser.addini("benchmark_regression_threshold",
+                  "Regression against the compared run that fails the benchmarks, e.g. median:15%",
+                  default="median:15%")
+    parser.addini("operation_recall_thresholds",
+                  "Recall each operation must reach on scripted sessions, e.g. IDLE:0.95 SELECT_LEFTHAND:0.9",
+                  default="IDLE:0.95 PAN_LEFTHAND:0.95 PAN_RIGHTHAND:0.95 ZOOM:0.9 SELECT_LEFTHAND:0.9 "
+                          "SELECT_RIGHTHAND:0.9")
+    parser.addoption("--accuracy-sessions", type=int, default=10, metavar="N",
+                     help="scripted sessions of 60 s the operation detection accuracy is checked on (default: 10)")
+
+
+def pytest_configure(config):
+    # runs before pytest-benchmark sets up its session, so the options below are picked up
+    if config.getoption("benchmark_storage") == DEFAULT_STORAGE:
+        config.option.benchmark_storage = "file://" + BASELINE_STORAGE
+
+    # comparing to a baseline fails on regressions beyond the threshold, unless --benchmark-compare-fail is given
+    if config.getoption("benchmark_compare") and not config.getoption("benchmark_compare_fail"):
+        threshold = config.getini("benchmark_regression_threshold")
+        config.option.benchmark_compare_fail = [parse_compare_fail(check) for check in threshold.split()]
+
+
+@pytest.fixture(scope="session")
+def stub_library_path(tmp_path_factory) -> str:
+    """
+    Builds the stub SDK library from stub_k4a.c with the C compiler on the path
+    :return: Path of the shared library
+    """
+    compiler = shutil.which(os.environ.get("CC", "cc"))
+    if compiler is None:
+        pytest.skip("no C compiler to build the stub SDK library")
+
+    library_name = "stub_k4a.dll" if sys.platform == "win32" else "libstub_k4a.so"
+    library_path = str(tmp_path_factory.mktemp("stub") / library_name)
+    subprocess.run([compiler, "-shared", "-fPIC", "-O2", "-o", library_path, STUB_SOURCE], check=True)
+    return library_path
+
+
+@pytest.fixture(scope="session")
+def stub_sdk(stub_library_path) -> ctypes.CDLL:
+    """
+    Loads the stub library as Sensor SDK and Body Tracking SDK
+    :return: The loaded library
+    """
+    from pykinect_azure.k4a import _k4a
+    from pykinect_azure.k4abt import _k4abt
+
+    _k4a.setup_library(stub_library_path)
+    # _k4abt.setup_library() would also load the ONNX runtime, only the function table is needed
+    _k4abt.k4abt_dll = ctypes.CDLL(stub_library_path)
+    _k4abt._functions.bind(_k4abt.k4abt_dll)
+    return _k4a.k4a_dll
+
+
+@pytest.fixture(scope="session")
+def pointer():
+    """
+    :return: Pointer of a right arm stretched out towards a screen of each built-in layout, as geom.Line
+    """
+    from geom import Line, Point3D
+
+    return Line.from_points(Point3D(-180, -410, 2010), Point3D(-160, -500, 1450))
+
+
+@pytest.fixture(scope="session")
+def workload_frames() -> list:
+    """
+    Frames of a scripted session of 20 seconds with two bystanders, the same in every run
+    :return: List of gesture_workload.WorkloadFrame
+    """
+    from gesture_workload import generate_sessions
+
+    return list(next(generate_sessions(1, seed=0, duration=20, bystanders=2)).frames())
+
+
+@pytest.fixture
+def tracker_controller():
+    """
+    :return: A cameracontrol.TrackerController, without camera. Skips if its dependencies are missing.
+    """
+    cameracontrol = pytest.importorskip("cameracontrol")
+    return cameracontrol.TrackerController(visualize=False)
+
+
+@pytest.fixture
+def interaction_controller():
+    """
+    :return: An InteractionController without GUI, injecting touches into a RecordingTouchBackend. Skips if its
+    dependencies are missing.
+    """
+    module = pytest.importorskip("interaction_controller")
+    import touchcontrol as tc
+
+    tc.set_backend(tc.RecordingTouchBackend())
+    controller = module.InteractionController(guicontext=None, infodata={})
+    controller.touch_control_enabled = True
+    return controller
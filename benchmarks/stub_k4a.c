@@ -0,0 +1,45 @@
+/*
+ * Minimal stand-in for the Azure Kinect Sensor and Body Tracking SDKs. Exports a few hot-path functions with the
+ * SDKs' signatures that return immediately, so benchmarks measure the Python side of the calls only.
+ */
+#include <stdint.h>
+#include <string.h>
+
+#define K4A_RESULT_SUCCEEDED 0
+#define K4A_WAIT_RESULT_SUCCEEDED 0
+
+static uint8_t image_buffer[64];
+static int handle;
+
+uint32_t k4a_device_get_installed_count(void) { return 1; }
+
+int k4a_device_get_capture(void *device, void **capture, int32_t timeout_in_ms)
+{
+    *capture = &handle;
+    return K4A_WAIT_RESULT_SUCCEEDED;
+}
+
+void k4a_capture_release(void *capture) {}
+
+void *k4a_capture_get_color_image(void *capture) { return &handle; }
+
+uint8_t *k4a_image_get_buffer(void *image) { return image_buffer; }
+
+size_t k4a_image_get_size(void *image) { return sizeof(image_buffer); }
+
+void k4a_image_release(void *image) {}
+
+int k4abt_tracker_pop_result(void *tracker, void **body_frame, int32_t timeout_in_ms)
+{
+    *body_frame = &handle;
+    return K4A_WAIT_RESULT_SUCCEEDED;
+}
+
+uint32_t k4abt_frame_get_num_bodies(void *body_frame) { return 1; }
+
+int k4abt_frame_get_body_skeleton(void *body_frame, uint32_t index, void *skeleton)
+{
+    /* k4abt_skeleton_t: 32 joints of position (3 floats), orientation (4 floats) and confidence level (int) */
+    memset(skeleton, 0, 32 * 8 * 4);
+    return K4A_RESULT_SUCCEEDED;
+}
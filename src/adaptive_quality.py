@@ -0,0 +1,103 @@
+"""
+Adaptive quality: steps down through a ladder of degradations while the camera loop cannot keep up with the camera,
+and back up once there is headroom again.
+"""
+from time import perf_counter
+from typing import Callable, Union
+
+from utils import LatencyWindow
+
+
+class Degradation:
+    """
+    One step of the quality ladder
+    """
+    def __init__(self, name: str, apply: Callable[[bool], None]):
+        """
+        :param name: Name of the step, shown in the GUI
+        :param apply: Function enabling (True) or disabling (False) the degradation
+        """
+        self.name: str = name
+        self.apply: Callable[[bool], None] = apply
+
+
+class AdaptiveQualityController:
+    """
+    Watches processing times and capture backlog of the camera loop and enables degradations one after another
+    while the loop is overloaded. Degradations are disabled again in reverse order when there is headroom.
+    Must be updated from the camera loop thread, as degradations may reconfigure camera and tracker.
+    """
+    def __init__(self, degradations: list[Degradation], frame_budget: float, max_backlog: float,
+                 window: int = 30, headroom: float = 0.6, cooldown: float = 2, recover_after: float = 5):
+        """
+        :param degradations: Quality ladder, cheapest degradation first
+        :param frame_budget: Seconds one iteration of the camera loop may take, usually the camera frame period
+        :param max_backlog: Seconds captures may wait before being processed
+        :param window: Number of frames the decision is based on
+        :param headroom: Share of the frame budget the loop must stay below to step back up
+        :param cooldown: Minimum seconds between two steps down
+        :param recover_after: Seconds without overload until a step back up
+        """
+        self.degradations: list[Degradation] = degradations
+        self.frame_budget: float = frame_budget
+        self.max_backlog: float = max_backlog
+        self.headroom: float = headroom
+        self.cooldown: float = cooldown
+        self.recover_after: float = recover_after
+
+        self.level: int = 0  # number of enabled degradations
+        self.__window_size = window
+        self.__busy_times = LatencyWindow(window)
+        self.__backlogs = LatencyWindow(window)
+        self.__samples_since_change = 0
+        self.__last_change: Union[float, None] = None  # set on the first update
+        self.__last_overload: float = 0
+
+    @property
+    def level_name(self) -> str:
+        return "full" if self.level == 0 else self.degradations[self.level - 1].name
+
+    def update(self, busy_time: float, backlog: float, now: Union[float, None] = None) -> bool:
+        """
+        Feeds the measurements of one frame and steps the quality if necessary
+        :param busy_time: Seconds the last iteration of the camera loop took, without waiting for the capture
+        :param backlog: Seconds the last capture waited before being processed
+        :param now: perf_counter() time, now if None
+        :return: True if the quality level changed
+        """
+        now = perf_counter() if now is None else now
+        if self.__last_change is None:
+            self.__changed(now)
+            self.__last_overload = now
+        self.__busy_times.add(busy_time)
+        self.__backlogs.add(backlog)
+        self.__samples_since_change += 1
+
+        if self.__samples_since_change < self.__window_size:
+            return False  # decide only on frames processed at the current level
+
+        busy_p95, = self.__busy_times.percentiles((95,))
+        backlog_p50, = self.__backlogs.percentiles((50,))
+
+        if busy_p95 > self.frame_budget or backlog_p50 > self.max_backlog:
+            self.__last_overload = now
+            if self.level < len(self.degradations) and now - self.__last_change >= self.cooldown:
+                self.degradations[self.level].apply(True)
+                self.level += 1
+                self.__changed(now)
+                return True
+
+        elif self.level > 0 and busy_p95 < self.frame_budget * self.headroom \
+                and now - self.__last_overload >= self.recover_after:
+            self.level -= 1
+            self.degradations[self.level].apply(False)
+            self.__changed(now)
+            # the restored step must prove itself for a full recovery period before the next one is restored
+            self.__last_overload = now
+            return True
+
+        return False
+
+    def __changed(self, now: float):
+        self.__last_change = now
+        self.__samples_since_change = 0
@@ -1,13 +1,85 @@
+import argparse
+import signal
+
 import wx
 from gui import MainWindow
+from metrics_server import MetricsServer
+from utils import event_log
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Map gesture controller")
+    parser.add_argument("--simulate", nargs="?", const="", default=None, metavar="RECORDING",
+                        help="run without a camera on a simulated Azure Kinect, "
+                             "replaying skeletons of a recording (.npz) if given")
+    parser.add_argument("--no-warm-up", dest="warm_up", action="store_false",
+                        help="do not prepare the hand tracking models in the background once the window shows, "
+                             "but when the camera starts")
+    parser.add_argument("--metrics-port", type=int, default=None, metavar="PORT",
+                        help="serve metrics in the Prometheus format on http://HOST:PORT/metrics")
+    parser.add_argument("--metrics-host", default="localhost", metavar="HOST",
+                        help="host name or address the metrics are served on, 0.0.0.0 for all interfaces "
+                             "(default: localhost)")
+    parser.add_argument("--event-log", default=None, metavar="PATH",
+                        help="append interaction events (operations, taps, ...) to a rotating JSON lines file")
+    parser.add_argument("--sensor-delay", type=float, default=0, metavar="SECONDS",
+                        help="seconds from exposure to the arrival of an image at the host, added to the measured "
+                             "output latencies (default: 0, latencies from the arrival)")
+    parser.add_argument("--profile-seconds", type=float, default=30, metavar="SECONDS",
+                        help="duration of profiles recorded on SIGUSR1 (not on Windows), default: 30")
+    return parser.parse_args()
+
+
+def create_simulated_camera(recording: str):
+    from pykinect_azure.simulator import SimulatedSdk, RecordedSkeletonSource
+
+    skeleton_source = RecordedSkeletonSource(recording) if recording else None
+    return SimulatedSdk(skeleton_source=skeleton_source)
+
+
+def start_profiling(interaction_controller, duration: float):
+    try:
+        path = interaction_controller.start_profiling(duration)
+        print(f"Profiling for {duration:g} s, writing {path}")
+    except (ValueError, RuntimeError) as e:
+        print(f"Cannot profile: {e}")
 
 
 def main():
+    arguments = parse_arguments()
+
+    if arguments.event_log is not None:
+        event_log.start_writer(arguments.event_log)
+
     app = wx.App()
     gui = MainWindow(None)
+    if arguments.simulate is not None:
+        gui.interaction_controller.set_simulated_camera(create_simulated_camera(arguments.simulate))
+    gui.interaction_controller.latency_tracker.sensor_delay = arguments.sensor_delay
     gui.Show()
+    if arguments.warm_up:
+        wx.CallAfter(gui.interaction_controller.warm_up)  # after the window was drawn
+
+    metrics_server = None
+    if arguments.metrics_port is not None:
+        controller = gui.interaction_controller
+        metrics_server = MetricsServer(controller.get_status, controller.is_camera_running,
+                                       host=arguments.metrics_host, port=arguments.metrics_port,
+                                       get_metrics=controller.metrics.render,
+                                       start_profiling=controller.start_profiling,
+                                       get_events=event_log.recent)
+        metrics_server.open_server()
+
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: start_profiling(gui.interaction_controller,
+                                                                             arguments.profile_seconds))
+
     app.MainLoop()
 
+    if metrics_server is not None:
+        metrics_server.close_server()
+    event_log.stop_writer()
+
 
 if __name__ == "__main__":
     main()
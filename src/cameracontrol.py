@@ -1,17 +1,25 @@
 import math
 import pykinect_azure as pykinect
-import mediapipe as mp
 import numpy as np
 import cv2 as cv
-from utils import CvFpsCalc, OneEuroFilter
-from time import time
+from utils import CvFpsCalc, OneEuroFilter, StageTimer, LatencyTracker, BufferPool, bgra_to_mirrored_rgb, \
+    MjpgDecodePool, LazyModule, Preloader, event_log
+from time import time, perf_counter
 from model import *
 import threading
-from typing import Union
+from typing import Callable, Union, TYPE_CHECKING
 import geom
 from constants import HandState, Handednes
+from adaptive_quality import Degradation
 from numbers import Real
 
+# mediapipe and TensorFlow take seconds to import and are only needed for hand tracking. They are imported on first
+# use, usually when TrackerController.preload_hand_models() creates the models in the background.
+mp = LazyModule("mediapipe")
+
+if TYPE_CHECKING:
+    from pykinect_azure.simulator import SimulatedSdk  # test double, not imported on the camera path
+
 
 class BodyResult:
     def __init__(self, body: pykinect.Body, left_hand_state: HandState, right_hand_state: HandState):
@@ -72,31 +80,66 @@ class TrackerController:
     """
     Class to perform Processing of Azure Kinect Imagery
     """
-    def __init__(self, visualize=True):
+    def __init__(self, visualize=True, stage_timer: Union[StageTimer, None] = None,
+                 latency_tracker: Union[LatencyTracker, None] = None):
 
         self.__k4a_path: str = pykinect.get_k4a_module_path()
         self.__k4a_bt_path: str = pykinect.get_k4abt_module_path()
         self.__gpu_id = 0  # gpu id for azure kinect body tracking
 
+        # Simulation replacing the Azure Kinect SDKs, for runs without a camera. Read when the libraries are loaded.
+        self.simulated_sdk: Union["SimulatedSdk", None] = None
+
         self.camera_running = False
         self.fps: float = 0
         self.visualize: bool = visualize
         self.color_image_rgb: Union[np.ndarray, None] = None
         self.number_tracked_bodies = 0
+        self.__body_id: Union[int, None] = None  # id of the tracked body, to log when it changes
 
-        # pitch and roll
+        # pitch and roll, from the low-pass filtered acceleration (gravity) of all IMU samples
         self.pitch = 0
         self.roll = 0
+        self.gravity_time_constant: float = 0.5  # seconds
+        self.gravity: Union[np.ndarray, None] = None
+        self.__gravity_time: float = 0  # device time of the last filtered IMU sample in seconds
+        self.__imu_buffer = pykinect.ImuRingBuffer()
 
         # for 1Euro filter
         self.minCutoff = 1
         self.beta = 0
+        self.frame_period: float = 1 / 30  # seconds between two frames of the device, see startCamera()
+        self.max_extrapolated_frames: int = 5  # longer gaps reinitialize the filters
+        self.dropped_frames: int = 0  # frames of the device never processed since the camera started
+        self.__frame_time_usec: Union[int, None] = None  # device timestamp of the previous body frame
+
+        # quality settings, lowered by the adaptive quality controller under load
+        self.color_resolution: int = pykinect.K4A_COLOR_RESOLUTION_1080P
+        self.lite_model: bool = False
+        self.visualize_interval: int = 1  # visualize every n-th frame
+        self.preview_width: int = 960  # width of the visualized image in pixels
+        self.hands_interval: int = 1  # start hand inference at most every n-th frame
+
+        # MJPG capture: the camera compresses, JPEGs are decoded at reduced size in a thread pool. Read on camera start.
+        self.color_format: int = pykinect.K4A_IMAGE_FORMAT_COLOR_BGRA32
+        self.mjpg_decode_workers: int = 2
+        self.mjpg_decode_reduction: int = 2  # decoded image is 1/n of the camera resolution
+        self.mjpg_decode_lag: int = 1  # frames the decoded image may lag behind the body frame
+        self.__mjpg_decoder: Union[MjpgDecodePool, None] = None
+
+        # frame skipping: captures that waited longer than max_capture_backlog are dropped in favour of newer ones
+        self.drop_stale_captures: bool = False
+        self.max_capture_backlog: float = 2 * self.frame_period
+        self.capture_backlog: float = 0  # seconds the latest capture waited in the queue before being processed
+        self.skipped_captures: int = 0
+        self.__frame_count: int = 0
 
         self.__device: Union[pykinect.Device, None] = None
         self.__tracker: Union[pykinect.Tracker, None] = None
 
         # Initialize list of 1-Euro-filters: Three filters per joint, one for each coordinate
         self.__filters_initialized = False
+        self.__filter_time: float = 0  # device time of the last filtered frame in seconds
         self.__one_euro_filters: list[list[OneEuroFilter]] = []
         for _ in range(pykinect.K4ABT_JOINT_COUNT):
             joint_filters: list[OneEuroFilter] = []
@@ -110,31 +153,85 @@ class TrackerController:
         self.__rightHand: Hand = Hand(Handednes.RIGHT)
 
         self.__handProcessThread = threading.Thread()
-        self.__mp_drawing = mp.solutions.drawing_utils
-        self.__mp_drawing_styles = mp.solutions.drawing_styles
         self.__hands: Union[mp.solutions.hands.Hands, None] = None
         self.__handresult = None
 
         self.__keypoint_classifier: Union[KeyPointClassifier, None] = None
+        self.__hand_models: Union[Preloader, None] = None  # models being created for the next initialize_tracking()
 
         self.__cvFpsCalc = CvFpsCalc(buffer_len=10)
 
+        # destination buffers of color conversion and flipping, reused once the hand thread and GUI released them
+        self.__buffer_pool = BufferPool()
+
+        # durations of the processing stages of each frame
+        self.stage_timer: StageTimer = stage_timer if stage_timer is not None else StageTimer()
+
+        # maps device timestamps to host time and measures sensor-to-output latency
+        self.latency_tracker: LatencyTracker = latency_tracker if latency_tracker is not None else LatencyTracker()
+        self.frame_timestamp_usec: Union[int, None] = None  # device timestamp of the latest body frame
+
     def initialize_k4a(self):
+        if self.simulated_sdk is not None:
+            pykinect.initialize_simulated_libraries(self.simulated_sdk, track_body=True)
+            return
         pykinect.initialize_libraries(module_k4a_path=self.__k4a_path,
                                       module_k4abt_path=self.__k4a_bt_path,
                                       track_body=True)
 
     def initialize_tracking(self):
+        hand_models = self.preload_hand_models()  # created while the device opens, unless preloaded already
+        self.gravity = None
+        if self.color_format == pykinect.K4A_IMAGE_FORMAT_COLOR_MJPG:
+            self.__mjpg_decoder = MjpgDecodePool(workers=self.mjpg_decode_workers,
+                                                 reduction=self.mjpg_decode_reduction,
+                                                 max_lag=self.mjpg_decode_lag)
         self.__device = self.startCamera()
         self.__tracker = self.startTracker()
-        self.__hands = mp.solutions.hands.Hands(
+        self.dropped_frames = 0
+        self.skipped_captures = 0
+        self.__frame_time_usec = None
+        self.__hand_models = None
+        self.__hands = hand_models.take("hands")
+        self.__keypoint_classifier = hand_models.take("keypoint_classifier")
+        self.camera_running = True
+
+    def preload_hand_models(self, on_state_change: Union[Callable[[str], None], None] = None) -> Preloader:
+        """
+        Starts creating the hand tracking models in background threads, for the next start of the camera.
+        Does nothing if they are being created already.
+        :param on_state_change: Called with the state of the models: Preloader.LOADING, READY or FAILED
+        :return: Preloader of the models
+        """
+        if self.__hand_models is None:
+            self.__hand_models = Preloader({"hands": self.create_hands,
+                                            "keypoint_classifier": self.create_keypoint_classifier},
+                                           on_state_change)
+        return self.__hand_models
+
+    def create_hands(self) -> "mp.solutions.hands.Hands":
+        """
+        Creates the mediapipe hand landmark graph and runs it on an empty image, as its first run initializes it
+        :return: The graph
+        """
+        hands = mp.solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=2,
             model_complexity=1,
             min_detection_confidence=0.2,
             min_tracking_confidence=0.3)
-        self.__keypoint_classifier = KeyPointClassifier()
-        self.camera_running = True
+        width, height = pykinect.COLOR_RESOLUTIONS[self.color_resolution]
+        hands.process(np.zeros((height, width, 3), dtype=np.uint8))
+        return hands
+
+    def create_keypoint_classifier(self) -> KeyPointClassifier:
+        """
+        Creates the hand state classifier and runs it once, which allocates its tensors
+        :return: The classifier
+        """
+        keypoint_classifier = KeyPointClassifier()
+        keypoint_classifier([0.0] * 42)  # x and y of 21 landmarks
+        return keypoint_classifier
 
     def get_camera_count(self):
         return pykinect.Device.device_get_installed_count()
@@ -159,10 +256,10 @@ class TrackerController:
 
     def startCamera(self):
         device_config = pykinect.default_configuration
-        device_config.color_resolution = pykinect.K4A_COLOR_RESOLUTION_1080P
+        device_config.color_resolution = self.color_resolution
         device_config.depth_mode = pykinect.K4A_DEPTH_MODE_NFOV_2X2BINNED
         device_config.camera_fps = pykinect.K4A_FRAMES_PER_SECOND_30
-        device_config.color_format = pykinect.K4A_IMAGE_FORMAT_COLOR_BGRA32
+        device_config.color_format = self.color_format
         device_config.synchronized_images_only = True
 
         device = pykinect.start_device(config=device_config)
@@ -173,7 +270,8 @@ class TrackerController:
         tracker_config.tracker_processing_mode = pykinect.K4ABT_TRACKER_PROCESSING_MODE_GPU
         tracker_config.gpu_device_id = self.__gpu_id
 
-        bodytracker = pykinect.start_body_tracker(tracker_configuration=tracker_config)
+        model_type = pykinect.K4ABT_LITE_MODEL if self.lite_model else pykinect.K4ABT_DEFAULT_MODEL
+        bodytracker = pykinect.start_body_tracker(model_type=model_type, tracker_configuration=tracker_config)
         return bodytracker
 
     def stopDevice(self):
@@ -181,40 +279,164 @@ class TrackerController:
         self.__device = None
         self.__hands.close()
         self.__keypoint_classifier = None
+        if self.__mjpg_decoder is not None:
+            self.__mjpg_decoder.shutdown()
+            self.__mjpg_decoder = None
+        self.restore_full_quality()
 
-    def getBodyCaptureData(self):
+    def set_lite_model(self, lite: bool):
         """
-        Method to be performed each frame
-        :return: Result of body tracking, derived from hand gesture and skeleton
+        Switches the body tracker between the default and the lite model. Call from the camera loop thread.
+        :param lite: True for the lite model
+        :return: None
         """
-        self.fps = self.__cvFpsCalc.get()
+        if lite == self.lite_model:
+            return
+        self.lite_model = lite
+        if self.__tracker is not None:
+            self.__restart_tracker()
 
-        capture = self.__device.update()
+    def set_color_resolution(self, color_resolution: int):
+        """
+        Restarts the cameras with another color resolution. Call from the camera loop thread.
+        :param color_resolution: One of pykinect.K4A_COLOR_RESOLUTION_*
+        :return: None
+        """
+        if color_resolution == self.color_resolution:
+            return
+        self.color_resolution = color_resolution
+        if self.__device is None:
+            return
 
-        imu_sample = self.__device.update_imu()
+        device_config = self.__device.configuration
+        device_config.color_resolution = color_resolution
+        self.__restart_tracker(restart_cameras=True)
 
-        capture_time = time()
+    def restore_full_quality(self):
+        """ Resets all quality settings, takes effect on the next camera start """
+        self.color_resolution = pykinect.K4A_COLOR_RESOLUTION_1080P
+        self.lite_model = False
+        self.visualize_interval = 1
+        self.hands_interval = 1
 
-        # Get the color image from the capture
-        ret, color_image_bgra = capture.get_color_image()
+    def get_degradations(self) -> list[Degradation]:
+        """
+        Quality ladder for the adaptive quality controller, cheapest degradation first
+        :return: List of degradations
+        """
+        return [
+            Degradation("skip visualization", lambda on: setattr(self, "visualize_interval", 2 if on else 1)),
+            Degradation("hands 1/2", lambda on: setattr(self, "hands_interval", 2 if on else 1)),
+            Degradation("lite model", self.set_lite_model),
+            Degradation("720p", lambda on: self.set_color_resolution(
+                pykinect.K4A_COLOR_RESOLUTION_720P if on else pykinect.K4A_COLOR_RESOLUTION_1080P))
+        ]
+
+    def __restart_tracker(self, restart_cameras: bool = False):
+        self.__tracker.shutdown()
+        self.__tracker = None  # release the old tracker before the new one allocates its resources
+
+        if restart_cameras:
+            self.__device.stop_cameras()
+            self.__device.start_cameras(self.__device.configuration)  # updates the calibration
+            pykinect.Device.capture = None  # created again with the new calibration
+            self.__buffer_pool.clear()  # frame size changed
+            if self.__mjpg_decoder is not None:
+                self.__mjpg_decoder.clear()
 
-        if not ret:
-            return
+        self.__tracker = self.startTracker()
+        self.__filters_initialized = False
 
-        color_image_rgb = cv.cvtColor(color_image_bgra, cv.COLOR_BGR2RGB)
+    def __drop_stale_captures(self, capture: pykinect.Capture):
+        """ Replaces the current capture by newer ones from the queue while it is older than max_capture_backlog """
+        while self.__capture_age(capture) > self.max_capture_backlog and self.__device.try_update(0):
+            self.skipped_captures += 1
 
-        self.__body_frame = self.__tracker.update()
+    @staticmethod
+    def __capture_age(capture: pykinect.Capture) -> float:
+        """
+        Seconds since the color image of a capture arrived at the host.
+        The system timestamp is taken from the same monotonic clock as perf_counter().
+        """
+        system_timestamp_nsec = capture.get_color_image_object().system_timestamp_nsec
+        return perf_counter() - system_timestamp_nsec / 1e9 if system_timestamp_nsec else 0
 
-        self.calc_roll_pitch(imu_sample)
+    def getBodyCaptureData(self):
+        """
+        Method to be performed each frame
+        :return: Result of body tracking, derived from hand gesture and skeleton
+        """
+        self.fps = self.__cvFpsCalc.get()
+
+        timer = self.stage_timer
+
+        latency = self.latency_tracker
+
+        self.__frame_count += 1
+
+        with timer.measure("capture"):
+            capture = self.__device.update()
+            if self.drop_stale_captures:
+                self.__drop_stale_captures(capture)
+        capture_host_time = perf_counter()
+
+        with timer.measure("imu"):
+            imu_count = self.__device.drain_imu(self.__imu_buffer)
+            if imu_count:
+                imu_samples = self.__imu_buffer.latest(imu_count)
+                self.update_gravity(imu_samples)
+
+        with timer.measure("color"):
+            # Get the color image from the capture
+            color_image_object = capture.get_color_image_object()
+            if not color_image_object.is_valid():
+                return
+
+            # The system timestamp is the arrival at the host, so queueing in the SDK counts towards the latency
+            system_timestamp_nsec = color_image_object.system_timestamp_nsec
+            arrival_time = system_timestamp_nsec / 1e9 if system_timestamp_nsec else capture_host_time
+            latency.observe(color_image_object.device_timestamp_usec, arrival_time)
+            self.capture_backlog = capture_host_time - arrival_time
+
+            if self.__mjpg_decoder is not None:
+                # decoded in the background while the body tracker runs, the view keeps the image alive until then
+                jpeg = np.frombuffer(color_image_object.get_buffer_view(), dtype=np.uint8)
+                self.__mjpg_decoder.submit(jpeg, color_image_object.device_timestamp_usec)
+                color_image_rgb = None
+            else:
+                color_image_bgra = color_image_object.to_numpy(copy=False)[1]  # view, conversion below copies
+
+                # One conversion serves hand inference and preview: RGB, mirrored so the preview acts like a mirror
+                height, width = color_image_bgra.shape[:2]
+                color_image_rgb = bgra_to_mirrored_rgb(color_image_bgra,
+                                                       self.__buffer_pool.acquire((height, width, 3)))
+
+        with timer.measure("tracker"):
+            self.__body_frame = self.__tracker.update()
+        self.frame_timestamp_usec = self.__body_frame.get_device_timestamp_usec()
+        self.__count_dropped_frames(self.frame_timestamp_usec)
+
+        # Scale of the color image relative to the color camera resolution the skeleton is projected to
+        image_scale = 1.0
+        if self.__mjpg_decoder is not None:
+            with timer.measure("decode"):
+                color_image_rgb = self.__mjpg_decoder.get()[1]
+            image_scale = 1 / self.__mjpg_decoder.reduction
+
+        if self.gravity is not None:
+            self.calc_roll_pitch(self.gravity)
 
         self.number_tracked_bodies = self.__body_frame.get_num_bodies()
 
-        if not self.__handProcessThread.is_alive():
-            self.__handProcessThread = threading.Thread(target=self.process_hands, args=(cv.flip(color_image_rgb, 1),))
+        if color_image_rgb is not None and self.__frame_count % self.hands_interval == 0 \
+                and not self.__handProcessThread.is_alive():
+            self.__handProcessThread = threading.Thread(target=self.process_hands, args=(color_image_rgb,),
+                                                      name="hands")
             self.__handProcessThread.start()
 
-        if self.visualize:
-            self.visualizeImage(color_image_rgb)
+        if color_image_rgb is not None and self.visualize and self.__frame_count % self.visualize_interval == 0:
+            with timer.measure("visualize"):
+                self.visualizeImage(color_image_rgb, image_scale)
 
         # get number of detected bodies in frame
         num_bodies = self.__body_frame.get_num_bodies()
@@ -222,6 +444,7 @@ class TrackerController:
         # End procesing when no bodies are detected
         if num_bodies < 1:
             self.__filters_initialized = False
+            self.__set_body_id(None, num_bodies)
             return None
 
         # ----- code below only executes if bodies were detected
@@ -230,31 +453,61 @@ class TrackerController:
             body = self.__body_frame.get_body(0)
         else:
             body: pykinect.Body = self.get_closest_body(num_bodies)
+        self.__set_body_id(body.handle().id, num_bodies)
 
         # on first frame where body is detected: initialize filters
         if not self.__filters_initialized:
-            self.initialize_filters(body, capture_time)
+            self.initialize_filters(body, self.frame_timestamp_usec / 1e6)
             self.__filters_initialized = True
             return None
 
-        # Filter coordinates
-        self.filter_body_coordinates(body, capture_time)
+        with timer.measure("filter"):
+            # Filter coordinates, on device time of the body frame to be free of host scheduling jitter
+            self.filter_body_coordinates(body, self.frame_timestamp_usec / 1e6)
 
-        # Rotate coordinates to correct for camera pitch
-        self.correct_roll_pitch(body)
+            # Rotate coordinates to correct for camera pitch
+            self.correct_roll_pitch(body)
 
         result = BodyResult(body, self.__leftHand.handstate, self.__rightHand.handstate)
         return result
 
-    def calc_roll_pitch(self, imu_sample: pykinect.ImuSample):
+    def __set_body_id(self, body_id: Union[int, None], number_bodies: int):
+        """ Logs when the tracked body changes to another one or is lost. """
+        if body_id != self.__body_id:
+            event_log.record("body_switch", previous=self.__body_id, current=body_id, bodies=number_bodies)
+            self.__body_id = body_id
+
+    def update_gravity(self, imu_samples: np.ndarray):
+        """
+        Low-pass filters the acceleration of new IMU samples into the gravity vector, using an exponential moving
+        average with time constant gravity_time_constant
+        :param imu_samples: New samples as pykinect.imu_sample_dtype array, oldest first
+        :return: None
+        """
+        acc = imu_samples["acc"].astype(np.float64)
+        times = imu_samples["acc_timestamp_usec"] / 1e6
+        if self.gravity is None:
+            self.gravity = acc[0]
+            self.__gravity_time = times[0]
+
+        dt = np.maximum(np.diff(times, prepend=self.__gravity_time), 0)
+        alpha = dt / (self.gravity_time_constant + dt)
+
+        # closed form of g = g + alpha * (acc - g) over all samples: weight of each sample is its alpha times the
+        # decay by all later samples
+        decay = np.cumprod((1 - alpha)[::-1])[::-1]
+        weights = alpha * np.append(decay[1:], 1)
+        self.gravity = decay[0] * self.gravity + weights @ acc
+        self.__gravity_time = times[-1]
+
+    def calc_roll_pitch(self, acc_sample):
         """
         Calculate devices roll (rotation around device´s z-axis) and pitch (rotation around devices x-axis) angles
-        from IMU gyroscope measures
-        :param imu_sample: Sample of IMU measuremnts
+        from the gravity measured by the IMU accelerometer
+        :param acc_sample: Acceleration (x, y, z), ideally low-pass filtered
         :return: None
         """
 
-        acc_sample = imu_sample.acc
         acc_x = acc_sample[0]
         acc_y = acc_sample[1]
         acc_z = acc_sample[2]
@@ -301,6 +554,11 @@ class TrackerController:
             jointfilterset[2].x_prev = joint.position.z
             jointfilterset[2].t_prev = t0
 
+            for coord_filter in jointfilterset:
+                coord_filter.dx_prev = 0
+
+        self.__filter_time = t0
+
     def tune_filters(self, min_cutoff: float, beta: float):
         """
         Method to adjust 1-Euro-filter parameters
@@ -317,14 +575,38 @@ class TrackerController:
                 coord_filter.min_cutoff = min_cutoff
                 coord_filter.beta = beta
 
+    def __count_dropped_frames(self, timestamp_usec: int):
+        """ Counts the frames missing between the previous and this body frame, dropped by the device or tracker """
+        if self.__frame_time_usec is not None and timestamp_usec > self.__frame_time_usec:
+            missed_frames = round((timestamp_usec - self.__frame_time_usec) / 1e6 / self.frame_period) - 1
+            if missed_frames > 0:
+                self.dropped_frames += missed_frames
+        self.__frame_time_usec = timestamp_usec
+
     def filter_body_coordinates(self, body: pykinect.Body, t: float):
         """
-        Method to perform 1-Euro-filtering on Body joint coordinates
+        Method to perform 1-Euro-filtering on Body joint coordinates.
+        Filters are extrapolated over frames dropped by the device or tracker, and reinitialized after long gaps.
         :param body: Tracked body object whose joints should be filtered
-        :param t: Timestamp at which body was tracked in seconds
+        :param t: Device timestamp at which body was tracked in seconds
         :return: None
         """
 
+        missed_frames = round((t - self.__filter_time) / self.frame_period) - 1
+        if missed_frames > 0:
+            if missed_frames > self.max_extrapolated_frames:
+                # state is too old to be extrapolated: start over from this frame
+                self.initialize_filters(body, t)
+                return
+
+            # advance filters to the last missed frame, so the measurement is blended with the expected position
+            t_missed = t - self.frame_period
+            for jointfilterset in self.__one_euro_filters:
+                for coord_filter in jointfilterset:
+                    coord_filter.extrapolate(t_missed)
+
+        self.__filter_time = max(t, self.__filter_time)
+
         for jointfilterset, joint in zip(self.__one_euro_filters, body.joints):
             joint.position.x = jointfilterset[0](t, joint.position.x)
             joint.position.y = jointfilterset[1](t, joint.position.y)
@@ -374,24 +656,31 @@ class TrackerController:
             joint.position.y = transformed[1]
             joint.position.z = transformed[2]
 
-    def visualizeImage(self, color_image):
+    def visualizeImage(self, color_image, image_scale: float = 1.0):
         """
         Generaet a cv2 image that can be displayed
-        :param color_image: The color image taken by the camera (BGR color format), as np.ndarray
+        :param color_image: The mirrored color image taken by the camera (RGB color format), as np.ndarray
+        :param image_scale: Size of color_image relative to the color camera resolution
         :return: nothing
         """
-        self.__body_frame.draw_bodies(color_image, pykinect.K4A_CALIBRATION_TYPE_COLOR)
+        # Overlays are drawn on a downscaled copy, the full size image is shared with hand inference
+        height, width = color_image.shape[:2]
+        scale = self.preview_width / width
+        preview_size = (self.preview_width, round(height * scale))
+        color_image = cv.resize(color_image, preview_size,
+                                dst=self.__buffer_pool.acquire((preview_size[1], preview_size[0], 3)))
 
-        color_image = cv.flip(color_image, 1)
+        self.__body_frame.draw_bodies(color_image, pykinect.K4A_CALIBRATION_TYPE_COLOR,
+                                      scale=scale * image_scale, mirror=True)
 
         if self.__leftHand.handstate != HandState.UNTRACKED:
-            self.draw_info_text(color_image, self.__leftHand)
+            self.draw_info_text(color_image, self.__leftHand, scale)
         if self.__rightHand.handstate != HandState.UNTRACKED:
-            self.draw_info_text(color_image, self.__rightHand)
+            self.draw_info_text(color_image, self.__rightHand, scale)
 
         if self.__handresult is not None and self.__handresult.multi_hand_landmarks:
             for landmark in self.__handresult.multi_hand_landmarks:
-                self.__mp_drawing.draw_landmarks(
+                mp.solutions.drawing_utils.draw_landmarks(
                     color_image,
                     landmark,
                     mp.solutions.hands.HAND_CONNECTIONS,
@@ -408,6 +697,10 @@ class TrackerController:
         :param color_image_bgr: the image from camera
         :return: nothing
         """
+        with self.stage_timer.measure("hands"):
+            self.__process_hands(color_image_rgb)
+
+    def __process_hands(self, color_image_rgb):
         color_image_rgb.flags.writeable = False
         self.__handresult = self.__hands.process(color_image_rgb)
         right_hand_detected = False
@@ -440,14 +733,15 @@ class TrackerController:
         if not right_hand_detected:
             self.__rightHand.handstate = HandState.UNTRACKED
 
-    def draw_info_text(self, image, hand: Hand):
+    def draw_info_text(self, image, hand: Hand, scale: float = 1.0):
         """
         Add info text to image for visualization.
         :param image: Color image
         :param hand: Hand Inforrmation
+        :param scale: Size of image relative to the image the hand was detected in
         :return: nothing
         """
-        brect = hand.bbox
+        brect = [round(coordinate * scale) for coordinate in hand.bbox]
 
         info_text = hand.handednes.name
         if hand.handstate != HandState.UNTRACKED:
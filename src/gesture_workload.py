@@ -0,0 +1,531 @@
+"""
+Synthetic gesture workload: scripted sessions of an operator pointing, panning, zooming, selecting and walking in front
+of the screens, optionally with bystanders behind them. Each camera frame of a session yields the skeletons and hand
+states the interaction layer gets from the camera, together with the operation the operator intends to perform.
+Drives throughput benchmarks and accuracy checks of the operation detection, and can be replayed by the simulated SDK.
+"""
+import bisect
+from typing import Iterator, Union
+
+import numpy as np
+
+import pykinect_azure as pykinect
+from pykinect_azure.simulator import SkeletonSource, REST_POSE, joints_from_positions
+from constants import HandState, Handednes, Operation
+from screen import Screen, SCREEN_SINGLE_ABOVE_FHD
+
+
+# Joints of an arm: shoulder, elbow, wrist, hand, hand tip, thumb
+ARM_JOINTS = {
+    Handednes.LEFT: (pykinect.K4ABT_JOINT_SHOULDER_LEFT, pykinect.K4ABT_JOINT_ELBOW_LEFT,
+                     pykinect.K4ABT_JOINT_WRIST_LEFT, pykinect.K4ABT_JOINT_HAND_LEFT,
+                     pykinect.K4ABT_JOINT_HANDTIP_LEFT, pykinect.K4ABT_JOINT_THUMB_LEFT),
+    Handednes.RIGHT: (pykinect.K4ABT_JOINT_SHOULDER_RIGHT, pykinect.K4ABT_JOINT_ELBOW_RIGHT,
+                      pykinect.K4ABT_JOINT_WRIST_RIGHT, pykinect.K4ABT_JOINT_HAND_RIGHT,
+                      pykinect.K4ABT_JOINT_HANDTIP_RIGHT, pykinect.K4ABT_JOINT_THUMB_RIGHT),
+}
+
+# Lengths of the arm segments of REST_POSE in millimeters
+UPPER_ARM, FOREARM, WRIST_TO_HAND, HAND_TO_TIP = np.linalg.norm(
+    np.diff(REST_POSE[list(ARM_JOINTS[Handednes.LEFT][:5])], axis=0), axis=1)
+
+# Height of the floor below the pelvis of REST_POSE, which the feet of taller or smaller people stand on as well
+FLOOR_HEIGHT = REST_POSE[pykinect.K4ABT_JOINT_FOOT_LEFT][1]
+
+
+def screen_point(screen: Screen, u: float, v: float) -> np.ndarray:
+    """
+    Point on a screen
+    :param screen: The screen
+    :param u: Horizontal position from the screen's left (0) to its right edge (1), as seen by the operator
+    :param v: Vertical position from the screen's top (0) to its bottom edge (1)
+    :return: The point in depth camera coordinates (millimeters)
+    """
+    upper_left = np.array((screen.upper_left_corner.x, screen.upper_left_corner.y, screen.upper_left_corner.z))
+    lower_right = np.array((screen.lower_right_corner.x, screen.lower_right_corner.y, screen.lower_right_corner.z))
+    return upper_left + np.array((u, v, u)) * (lower_right - upper_left)
+
+
+def place_arm(positions: np.ndarray, hand: Handednes, hand_position: np.ndarray, scale: float = 1.0):
+    """
+    Moves the joints of an arm so that the hand is at a position. The elbow bends downwards if the hand is closer to
+    the shoulder than the length of the arm.
+    :param positions: Joint positions (32 x 3, millimeters), changed in place
+    :param hand: The arm to move
+    :param hand_position: Position of the hand
+    :param scale: Size of the body relative to REST_POSE
+    :return: None
+    """
+    shoulder_idx, elbow_idx, wrist_idx, hand_idx, tip_idx, thumb_idx = ARM_JOINTS[hand]
+    shoulder = positions[shoulder_idx]
+    reach = hand_position - shoulder
+    direction = reach / np.linalg.norm(reach)
+
+    upper_arm = UPPER_ARM * scale
+    elbow = shoulder + reach * (UPPER_ARM / (UPPER_ARM + FOREARM + WRIST_TO_HAND))
+    elbow[1] += np.sqrt(max(upper_arm * upper_arm - np.sum((elbow - shoulder) ** 2), 0))
+
+    # thumb sits on the side of the hand facing the body's center
+    inwards = -1 if hand == Handednes.LEFT else 1
+
+    positions[elbow_idx] = elbow
+    positions[wrist_idx] = hand_position - direction * (WRIST_TO_HAND * scale)
+    positions[hand_idx] = hand_position
+    positions[tip_idx] = hand_position + direction * (HAND_TO_TIP * scale)
+    positions[thumb_idx] = hand_position + direction * (0.4 * HAND_TO_TIP * scale) + (inwards * 30 * scale, 0, 0)
+
+
+def pointing_hand_position(positions: np.ndarray, hand: Handednes, target: np.ndarray, scale: float = 1.0,
+                           retract: float = 0.0) -> np.ndarray:
+    """
+    Position of the hand of an arm stretched out towards a target, as the interaction layer's pointer runs from the
+    shoulder through the hand
+    :param positions: Joint positions (32 x 3, millimeters)
+    :param hand: The pointing arm
+    :param target: Point that is pointed at
+    :param scale: Size of the body relative to REST_POSE
+    :param retract: Millimeters the hand is pulled back horizontally, towards the body
+    :return: The hand position
+    """
+    shoulder = positions[ARM_JOINTS[hand][0]]
+    direction = (target - shoulder) / np.linalg.norm(target - shoulder)
+    hand_position = shoulder + direction * (0.95 * (UPPER_ARM + FOREARM + WRIST_TO_HAND) * scale)
+    if retract:
+        horizontal = np.array((direction[0], 0, direction[2]))
+        hand_position -= horizontal / np.linalg.norm(horizontal) * retract
+    return hand_position
+
+
+def swing_arms(positions: np.ndarray, angle: float, scale: float = 1.0):
+    """
+    Swings both hanging arms in opposite directions, as when walking
+    :param positions: Joint positions (32 x 3, millimeters) with hanging arms, changed in place
+    :param angle: Angle of the left arm towards the front in radians, the right arm swings by -angle
+    :param scale: Size of the body relative to REST_POSE
+    :return: None
+    """
+    for hand, arm_angle in ((Handednes.LEFT, angle), (Handednes.RIGHT, -angle)):
+        shoulder_idx, hand_idx = ARM_JOINTS[hand][0], ARM_JOINTS[hand][3]
+        arm = positions[hand_idx] - positions[shoulder_idx]
+        cos, sin = np.cos(arm_angle), np.sin(arm_angle)
+        # rotate in the y-z plane, towards -z (the camera) for positive angles
+        swung = np.array((arm[0], cos * arm[1] + sin * arm[2], -sin * arm[1] + cos * arm[2]))
+        place_arm(positions, hand, positions[shoulder_idx] + swung, scale)
+
+
+class GestureSegment:
+    """
+    Part of a scripted session: what the operator does for duration seconds
+    """
+    name = "gesture"
+
+    def __init__(self, duration: float):
+        """
+        :param duration: Length of the segment in seconds
+        """
+        self.duration: float = duration
+
+    def displacement(self) -> np.ndarray:
+        """
+        :return: Distance (x, y, z) in millimeters the operator moves during the segment
+        """
+        return np.zeros(3)
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        """
+        Poses the operator
+        :param positions: Joint positions (32 x 3, millimeters) of the operator in rest pose, at their position at the
+        start of the segment. Changed in place.
+        :param time: Seconds since the start of the segment
+        :param scale: Size of the operator relative to REST_POSE
+        :return: Tuple (left hand state, right hand state, intended operation)
+        """
+        raise NotImplementedError
+
+
+class RestSegment(GestureSegment):
+    """
+    Operator stands with hanging arms
+    """
+    name = "rest"
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        return HandState.OPEN, HandState.OPEN, Operation.IDLE
+
+
+class PointSegment(GestureSegment):
+    """
+    Operator points at the screen with one hand, moving the pointer from one target to another
+    """
+    name = "point"
+
+    def __init__(self, duration: float, hand: Handednes, start_target: np.ndarray,
+                 end_target: Union[np.ndarray, None] = None):
+        """
+        :param duration: Length of the segment in seconds
+        :param hand: The pointing hand
+        :param start_target: Point pointed at at the start of the segment
+        :param end_target: Point pointed at at the end of the segment, None to keep pointing at start_target
+        """
+        super().__init__(duration)
+        self.hand: Handednes = hand
+        self.start_target: np.ndarray = np.asarray(start_target, dtype=np.float64)
+        self.end_target: np.ndarray = self.start_target if end_target is None \
+            else np.asarray(end_target, dtype=np.float64)
+
+    def target(self, time: float) -> np.ndarray:
+        progress = time / self.duration
+        return self.start_target + progress * (self.end_target - self.start_target)
+
+    def hand_states(self, state: HandState) -> tuple[HandState, HandState]:
+        return (state, HandState.OPEN) if self.hand == Handednes.LEFT else (HandState.OPEN, state)
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        place_arm(positions, self.hand, pointing_hand_position(positions, self.hand, self.target(time), scale), scale)
+        return *self.hand_states(HandState.POINTER), Operation.IDLE
+
+
+class PanSegment(PointSegment):
+    """
+    Operator drags the map with a closed hand pointing at the screen
+    """
+    name = "pan"
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        place_arm(positions, self.hand, pointing_hand_position(positions, self.hand, self.target(time), scale), scale)
+        operation = Operation.PAN_LEFTHAND if self.hand == Handednes.LEFT else Operation.PAN_RIGHTHAND
+        return *self.hand_states(HandState.CLOSED), operation
+
+
+class SelectSegment(PointSegment):
+    """
+    Operator points at a target and pushes the hand towards the screen to select it
+    """
+    name = "select"
+
+    def __init__(self, duration: float, hand: Handednes, target: np.ndarray, push_distance: float = 150,
+                 push_speed: float = 750, push_start: Union[float, None] = None):
+        """
+        :param duration: Length of the segment in seconds
+        :param hand: The selecting hand
+        :param target: Point to select
+        :param push_distance: Millimeters the hand moves towards the screen
+        :param push_speed: Speed of the push in millimeters per second
+        :param push_start: Seconds into the segment the push starts, None to center the push in the segment
+        """
+        super().__init__(duration, hand, target)
+        self.push_distance: float = push_distance
+        self.push_duration: float = push_distance / push_speed
+        self.push_start: float = (duration - self.push_duration) / 2 if push_start is None else push_start
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        progress = min(max((time - self.push_start) / self.push_duration, 0), 1)
+        hand_position = pointing_hand_position(positions, self.hand, self.start_target, scale,
+                                               retract=(1 - progress) * self.push_distance)
+        place_arm(positions, self.hand, hand_position, scale)
+
+        # only the push itself is the selection, pointing before and after it is not
+        operation = Operation.IDLE
+        if self.push_start <= time < self.push_start + self.push_duration:
+            operation = Operation.SELECT_LEFTHAND if self.hand == Handednes.LEFT else Operation.SELECT_RIGHTHAND
+        return *self.hand_states(HandState.POINTER), operation
+
+
+class ZoomSegment(GestureSegment):
+    """
+    Operator points at the screen with both hands closed and moves the pointers apart (zoom in) or together (zoom out)
+    """
+    name = "zoom"
+
+    def __init__(self, duration: float, center: np.ndarray, start_spread: float, end_spread: float):
+        """
+        :param duration: Length of the segment in seconds
+        :param center: Point in the middle between both pointers
+        :param start_spread: Horizontal distance between the pointers at the start, in millimeters
+        :param end_spread: Horizontal distance between the pointers at the end, in millimeters
+        """
+        super().__init__(duration)
+        self.center: np.ndarray = np.asarray(center, dtype=np.float64)
+        self.start_spread: float = start_spread
+        self.end_spread: float = end_spread
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        spread = self.start_spread + time / self.duration * (self.end_spread - self.start_spread)
+        # the operator's left is +x
+        for hand, offset in ((Handednes.LEFT, spread / 2), (Handednes.RIGHT, -spread / 2)):
+            target = self.center + (offset, 0, 0)
+            place_arm(positions, hand, pointing_hand_position(positions, hand, target, scale), scale)
+        return HandState.CLOSED, HandState.CLOSED, Operation.ZOOM
+
+
+class WalkSegment(GestureSegment):
+    """
+    Operator walks to another position, swinging the arms
+    """
+    name = "walk"
+
+    def __init__(self, duration: float, distance: np.ndarray, step_period: float = 1.1, swing: float = 0.35):
+        """
+        :param duration: Length of the segment in seconds
+        :param distance: Distance (x, y, z) in millimeters to walk
+        :param step_period: Seconds of two steps, one arm swing back and forth
+        :param swing: Amplitude of the arm swing in radians
+        """
+        super().__init__(duration)
+        self.distance: np.ndarray = np.asarray(distance, dtype=np.float64)
+        self.step_period: float = step_period
+        self.swing: float = swing
+
+    def displacement(self) -> np.ndarray:
+        return self.distance
+
+    def pose(self, positions: np.ndarray, time: float, scale: float) -> tuple[HandState, HandState, Operation]:
+        phase = 2 * np.pi * time / self.step_period
+        positions += self.distance * (time / self.duration)
+        positions[:, 1] -= 15 * scale * abs(np.sin(phase))  # body rises with each step
+        swing_arms(positions, self.swing * np.sin(phase), scale)
+        return HandState.OPEN, HandState.OPEN, Operation.IDLE
+
+
+class Bystander:
+    """
+    Person behind the operator who stands or walks back and forth along the x-axis, arms hanging
+    """
+    def __init__(self, position: np.ndarray, speed: float = 0.0, walk_range: tuple[float, float] = (-2000, 2000),
+                 scale: float = 1.0, body_id: int = 2):
+        """
+        :param position: Position of the pelvis at time 0 in millimeters, depth camera coordinates
+        :param speed: Walking speed in millimeters per second, 0 for standing
+        :param walk_range: Range of x the bystander walks in
+        :param scale: Size of the body relative to REST_POSE
+        :param body_id: Id the body tracker reports for the bystander
+        """
+        self.position: np.ndarray = np.asarray(position, dtype=np.float64)
+        self.speed: float = speed
+        self.walk_range: tuple[float, float] = walk_range
+        self.scale: float = scale
+        self.body_id: int = body_id
+
+    def pose(self, time: float) -> np.ndarray:
+        """
+        :param time: Seconds since the start of the session
+        :return: Joint positions (32 x 3, millimeters)
+        """
+        positions = REST_POSE * self.scale + self.position
+        if self.speed:
+            low, high = self.walk_range
+            span = high - low
+            walked = (self.position[0] - low + self.speed * time) % (2 * span)
+            positions[:, 0] += low + (walked if walked < span else 2 * span - walked) - self.position[0]
+            swing_arms(positions, 0.35 * np.sin(2 * np.pi * time / 1.1), self.scale)
+        return positions
+
+
+class WorkloadFrame:
+    """
+    Input of the interaction layer at one camera frame, with the ground truth
+    """
+    def __init__(self, time: float, bodies: list[tuple[int, np.ndarray]], left_hand_state: HandState,
+                 right_hand_state: HandState, operation: Operation, gesture: str):
+        """
+        :param time: Seconds since the start of the session
+        :param bodies: Tracked bodies as (body id, joint_dtype array of the 32 joints), the operator first
+        :param left_hand_state: State of the operator's left hand, as the hand classifier reports it
+        :param right_hand_state: State of the operator's right hand, as the hand classifier reports it
+        :param operation: Operation the operator intends to perform
+        :param gesture: Name of the session segment, "transition" while moving from one segment to the next
+        """
+        self.time: float = time
+        self.bodies: list[tuple[int, np.ndarray]] = bodies
+        self.left_hand_state: HandState = left_hand_state
+        self.right_hand_state: HandState = right_hand_state
+        self.operation: Operation = operation
+        self.gesture: str = gesture
+
+    @property
+    def timestamp_usec(self) -> int:
+        return int(round(self.time * 1e6))
+
+    def get_body(self, index: int = 0) -> pykinect.Body:
+        """
+        :param index: Index of the body in bodies, 0 for the operator
+        :return: The body as the body tracker returns it
+        """
+        body_id, joints = self.bodies[index]
+        handle = pykinect.k4abt_body_t(body_id)
+        handle.skeleton = pykinect.k4abt_skeleton_t.from_buffer_copy(np.ascontiguousarray(joints))
+        return pykinect.Body(handle)
+
+    def get_bodyresult_args(self) -> tuple[pykinect.Body, HandState, HandState]:
+        """
+        :return: Arguments of cameracontrol.BodyResult for the operator: (body, left hand state, right hand state)
+        """
+        return self.get_body(), self.left_hand_state, self.right_hand_state
+
+
+class GestureWorkload(SkeletonSource):
+    """
+    A scripted session of one operator, with optional bystanders. Provides the frames of the session for benchmarks
+    and accuracy checks, and is a SkeletonSource for the simulated SDK (looping the session). The simulated color
+    images show no hands, so hand states only reach the interaction layer through the frames.
+    """
+    def __init__(self, segments: list[GestureSegment], position: tuple[float, float, float] = (0, 0, 2000),
+                 scale: float = 1.0, fps: float = 30, transition: float = 0.3, bystanders: tuple[Bystander, ...] = (),
+                 joint_noise: float = 0.0, hand_state_error: float = 0.0,
+                 seed: Union[int, np.random.Generator, None] = None, body_id: int = 1):
+        """
+        :param segments: What the operator does, in order
+        :param position: Position of the operator's pelvis at the start in millimeters, depth camera coordinates
+        :param scale: Size of the operator relative to REST_POSE
+        :param fps: Camera frame rate
+        :param transition: Seconds the operator takes to change from the pose of one segment to the next one
+        :param bystanders: People in the background
+        :param joint_noise: Standard deviation of the noise added to each joint position, in millimeters
+        :param hand_state_error: Probability that a hand state is misclassified
+        :param seed: Seed of the noise
+        :param body_id: Id the body tracker reports for the operator
+        """
+        self.segments: list[GestureSegment] = segments
+        self.scale: float = scale
+        self.fps: float = fps
+        self.transition: float = transition
+        self.bystanders: tuple[Bystander, ...] = bystanders
+        self.joint_noise: float = joint_noise
+        self.hand_state_error: float = hand_state_error
+        self.body_id: int = body_id
+        self.__rng = np.random.default_rng(seed)
+        self.__rest_pose = REST_POSE * scale
+
+        # start time and operator position at the start of each segment
+        self.__starts = np.cumsum([0] + [segment.duration for segment in segments[:-1]]).tolist()
+        self.__origins = np.asarray(position, dtype=np.float64) + np.cumsum(
+            [np.zeros(3)] + [segment.displacement() for segment in segments[:-1]], axis=0)
+        self.duration: float = float(sum(segment.duration for segment in segments))
+
+    def __len__(self) -> int:
+        return int(self.duration * self.fps)
+
+    def frames(self) -> Iterator[WorkloadFrame]:
+        """
+        :return: Iterator over the frames of the session at the camera frame rate
+        """
+        for index in range(len(self)):
+            yield self.frame_at(index / self.fps)
+
+    def frame_at(self, time: float) -> WorkloadFrame:
+        """
+        :param time: Seconds since the start of the session
+        :return: The frame at that time
+        """
+        index = min(max(bisect.bisect_right(self.__starts, time) - 1, 0), len(self.segments) - 1)
+        segment_time = time - self.__starts[index]
+        positions, left_hand_state, right_hand_state, operation = self.__pose(index, segment_time)
+        gesture = self.segments[index].name
+
+        if index > 0 and segment_time < self.transition:
+            previous = self.__pose(index - 1, self.segments[index - 1].duration)
+            progress = segment_time / self.transition
+            weight = progress * progress * (3 - 2 * progress)
+            positions = previous[0] + weight * (positions - previous[0])
+            if weight < 0.5:
+                left_hand_state, right_hand_state = previous[1], previous[2]
+            operation = Operation.IDLE
+            gesture = "transition"
+
+        bodies = [(self.body_id, self.__joints(positions))]
+        bodies += [(bystander.body_id, self.__joints(bystander.pose(time))) for bystander in self.bystanders]
+
+        return WorkloadFrame(time, bodies, self.__misclassify(left_hand_state), self.__misclassify(right_hand_state),
+                             operation, gesture)
+
+    def get_bodies(self, time: float) -> list[tuple[int, np.ndarray]]:
+        return self.frame_at(time % self.duration).bodies
+
+    def __pose(self, index: int, time: float) -> tuple[np.ndarray, HandState, HandState, Operation]:
+        positions = self.__rest_pose + self.__origins[index]
+        return positions, *self.segments[index].pose(positions, time, self.scale)
+
+    def __joints(self, positions: np.ndarray) -> np.ndarray:
+        if self.joint_noise:
+            positions = positions + self.__rng.normal(0, self.joint_noise, positions.shape)
+        return joints_from_positions(positions)
+
+    def __misclassify(self, hand_state: HandState) -> HandState:
+        if self.hand_state_error and self.__rng.random() < self.hand_state_error:
+            states = [state for state in HandState if state != hand_state]
+            return states[self.__rng.integers(len(states))]
+        return hand_state
+
+
+# Relative frequency of the segments in random sessions
+SEGMENT_WEIGHTS = {RestSegment: 0.15, PointSegment: 0.2, PanSegment: 0.2, ZoomSegment: 0.15, SelectSegment: 0.2,
+                   WalkSegment: 0.1}
+
+
+def random_session(rng: np.random.Generator, duration: float = 60, screens: tuple[Screen, ...] = SCREEN_SINGLE_ABOVE_FHD,
+                   bystanders: int = 0, area: tuple[tuple[float, float], tuple[float, float]] = ((-800, 800), (1500, 2800)),
+                   **kwargs) -> GestureWorkload:
+    """
+    Scripts a session of random gestures at random targets, performed by an operator of random size
+    :param rng: Random number generator the session is drawn from
+    :param duration: Minimum length of the session in seconds
+    :param screens: Screens the operator points at
+    :param bystanders: Number of bystanders, who walk or stand behind the area
+    :param area: Ranges of x and z in millimeters the operator stands and walks in
+    :param kwargs: Further arguments of GestureWorkload, e.g. fps, joint_noise or hand_state_error
+    :return: The session
+    """
+    (min_x, max_x), (min_z, max_z) = area
+    scale = rng.uniform(0.9, 1.1)
+    start = np.array((rng.uniform(min_x, max_x), FLOOR_HEIGHT * (1 - scale), rng.uniform(min_z, max_z)))
+    position = start.copy()
+
+    def random_target() -> np.ndarray:
+        return screen_point(screens[rng.integers(len(screens))], rng.uniform(0.1, 0.9), rng.uniform(0.1, 0.9))
+
+    kinds = list(SEGMENT_WEIGHTS)
+    weights = np.array(list(SEGMENT_WEIGHTS.values()))
+    segments = []
+    total = 0
+    while total < duration:
+        kind = kinds[rng.choice(len(kinds), p=weights / weights.sum())]
+        hand = Handednes.LEFT if rng.random() < 0.5 else Handednes.RIGHT
+        if kind is RestSegment:
+            segment = RestSegment(rng.uniform(0.5, 2))
+        elif kind is PointSegment or kind is PanSegment:
+            segment = kind(rng.uniform(1, 3), hand, random_target(), random_target())
+        elif kind is ZoomSegment:
+            zoom_in = rng.random() < 0.5
+            near, far = rng.uniform(100, 300), rng.uniform(600, 1200)
+            segment = ZoomSegment(rng.uniform(1, 2.5), random_target(), *((near, far) if zoom_in else (far, near)))
+        elif kind is SelectSegment:
+            segment = SelectSegment(rng.uniform(1, 2), hand, random_target(), push_speed=rng.uniform(600, 1000))
+        else:
+            destination = np.array((rng.uniform(min_x, max_x), position[1], rng.uniform(min_z, max_z)))
+            distance = destination - position
+            segment = WalkSegment(max(np.linalg.norm(distance) / rng.uniform(600, 1200), 0.5), distance)
+            position = destination
+        segments.append(segment)
+        total += segment.duration
+
+    people = []
+    for index in range(bystanders):
+        bystander_scale = rng.uniform(0.9, 1.1)
+        people.append(Bystander((rng.uniform(-2000, 2000), FLOOR_HEIGHT * (1 - bystander_scale),
+                                 rng.uniform(max_z + 300, max_z + 1500)),
+                                speed=rng.uniform(300, 1200) if rng.random() < 0.7 else 0,
+                                scale=bystander_scale, body_id=2 + index))
+
+    return GestureWorkload(segments, position=tuple(start), scale=scale, bystanders=tuple(people), seed=rng, **kwargs)
+
+
+def generate_sessions(count: int, seed: int = 0, **kwargs) -> Iterator[GestureWorkload]:
+    """
+    Scripts random sessions. A session depends only on the seed and its index, not on how many sessions are generated.
+    :param count: Number of sessions
+    :param seed: Seed of the sessions
+    :param kwargs: Arguments of random_session()
+    :return: Iterator over the sessions
+    """
+    for index in range(count):
+        yield random_session(np.random.default_rng((seed, index)), **kwargs)
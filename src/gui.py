@@ -45,7 +45,9 @@ class MainWindow(GuibaseExtended):
 
         dlg = SettingsDialogWindow(self,
                                    k4a_path, k4abt_path, gpuid,
-                                   k4a_path_setfunction, k4a_bt_path_setfunction, gpuid_setfunction)
+                                   k4a_path_setfunction, k4a_bt_path_setfunction, gpuid_setfunction,
+                                   self.interaction_controller.is_camera_running(),
+                                   self.interaction_controller.start_profiling)
         dlg.ShowModal()
 
     def on_tgl_show(self, event):
@@ -104,7 +106,13 @@ class MainWindow(GuibaseExtended):
              "right": HandState.UNTRACKED.name,
              "operation": Operation.IDLE.name,
              "cut": 0,
-             "beta": 0}
+             "beta": 0,
+             "clients": 0,
+             "ws lag": 0,
+             "dropped": 0,
+             "skipped": 0,
+             "backlog": 0,
+             "quality": "full"}
         return d
 
 
@@ -128,7 +136,8 @@ class CalibrateDialogWindow(CalibrateDialogExtended):
 
 class SettingsDialogWindow(SettingsDialogExtended):
     def __init__(self, parent, k4apath: str, k4abtpath: str, gpuid: int,
-                 k4apath_setfunction, k4abtpath_setfunction, gpuid_setfunction):
+                 k4apath_setfunction, k4abtpath_setfunction, gpuid_setfunction,
+                 camera_running: bool, profile_function):
         SettingsDialogExtended.__init__(self, parent)
 
         self.k4a_path.SetValue(k4apath)
@@ -138,6 +147,25 @@ class SettingsDialogWindow(SettingsDialogExtended):
         self.set_k4a_path = k4apath_setfunction
         self.set_k4abt_bt_path = k4abtpath_setfunction
         self.set_gpu_id = gpuid_setfunction
+        self.start_profiling = profile_function
+
+        # SDK settings only take effect when the camera starts, profiling needs the running camera
+        self.k4a_path.Enable(not camera_running)
+        self.k4a_btpath.Enable(not camera_running)
+        self.gpu_id.Enable(not camera_running)
+        self.profile_seconds.Enable(camera_running)
+        self.profile_button.Enable(camera_running)
+
+    def on_profile(self, event):
+        seconds = self.profile_seconds.GetValue()
+        try:
+            path = self.start_profiling(seconds)
+        except (ValueError, RuntimeError) as e:
+            wx.MessageDialog(self, str(e), style=wx.ICON_ERROR).ShowModal()
+            return
+        self.profile_button.Enable(False)
+        wx.MessageDialog(self, f"Profiling for {seconds} seconds, the profile is written to\n{path}",
+                         style=wx.ICON_INFORMATION).ShowModal()
 
     def on_ok( self, event ):
         self.set_k4a_path(self.k4a_path.GetValue())
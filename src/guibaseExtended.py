@@ -3,6 +3,7 @@ from cv2 import resize,cvtColor, COLOR_BGR2RGB
 import numpy as np
 
 from guibase import Guibase, CalibrateDialog, SettingsDialog
+from utils import LatestSlot
 
 
 class GuibaseExtended(Guibase):
@@ -20,9 +21,22 @@ class GuibaseExtended(Guibase):
 
         frame = np.zeros((self.image_width, self.image_height, 3))
         self.bmp = wx.Bitmap.FromBuffer(self.image_width, self.image_height, frame)
+        self.__preview_buffer = np.empty((self.image_height, self.image_width, 3), dtype=np.uint8)  # resize dst
         self.image_container.SetInactiveBitmap(self.bmp)
         self.image_container.SetBackgroundStyle(wx.BG_STYLE_PAINT)
 
+        # Other threads only publish frames and grid data into slots. A timer renders them on the UI thread.
+        self.preview_fps = 15
+        self.__frame_slot = LatestSlot()
+        self.__grid_slot = LatestSlot()
+        self.__rendered_frame = 0  # sequence number of the frame on screen
+        self.__rendered_grid = 0  # sequence number of the grid data on screen
+        self.__grid_values: dict = {}  # key -> (row, displayed value)
+
+        self.preview_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_preview_timer, self.preview_timer)
+        self.preview_timer.Start(int(1000 / self.preview_fps))
+
     def on_resize(self, event):
         pass
 
@@ -31,37 +45,74 @@ class GuibaseExtended(Guibase):
         self.tgl_btn_show_feed.Enable(btn_value)
         self.tgl_btn_touchcontrol.Enable(btn_value)
         self.calibrate_button.Enable(btn_value)
-        self.settings_button.Enable(not btn_value)
         if btn_value:
             self.tgl_btn_start_camera.SetLabelText("Stop Camera")
         else:
             self.tgl_btn_start_camera.SetLabelText("Start Camera")
 
     def on_close(self, event):
+        self.preview_timer.Stop()
         Guibase.on_close(self, event)
 
+    def on_preview_timer(self, event):
+        """ Renders the latest published frame and grid data, runs on the UI thread """
+        seq, _, frame = self.__frame_slot.get()
+        if seq != self.__rendered_frame:
+            self.__rendered_frame = seq
+            if frame is not None:
+                self.render_bitmap(frame)
+
+        seq, _, tabledata = self.__grid_slot.get()
+        if seq != self.__rendered_grid:
+            self.__rendered_grid = seq
+            self.render_datagrid_values(tabledata)
+
     def set_datagrid_values(self, tabledata: dict):
         """
-        Populates the datagrid with Key-Value pairs
+        Publishes Key-Value pairs to be shown in the datagrid with the next preview update. Can be called from any thread.
         :param tabledata: Data to be displayed in Datagrid. Must be dict.
         :return: None
         """
-        if self.infogrid.NumberRows != len(tabledata):
-            self.infogrid.AppendRows(len(tabledata), False)
+        self.__grid_slot.publish(dict(tabledata))
 
-        rowcount = 0
-        for idx, key in enumerate(tabledata):
-            self.infogrid.SetCellValue(idx, 0, key)
-            self.infogrid.SetCellValue(idx, 1, str(tabledata[key]))
-            rowcount += 1
+    def render_datagrid_values(self, tabledata: dict):
+        """
+        Populates the datagrid with Key-Value pairs. Only cells whose value changed are written. UI thread only.
+        :param tabledata: Data to be displayed in Datagrid. Must be dict.
+        :return: None
+        """
+        if self.infogrid.NumberRows < len(tabledata):
+            self.infogrid.AppendRows(len(tabledata) - self.infogrid.NumberRows, False)
+
+        for key, value in tabledata.items():
+            value = str(value)
+            shown = self.__grid_values.get(key)
+            if shown is None:
+                row = len(self.__grid_values)
+                self.infogrid.SetCellValue(row, 0, key)
+            elif shown[1] == value:
+                continue
+            else:
+                row = shown[0]
+            self.infogrid.SetCellValue(row, 1, value)
+            self.__grid_values[key] = (row, value)
 
     def set_bitmap(self, frame):
         """
-        Method to set the image on screen.
+        Publishes an image to be shown with the next preview update. Can be called from any thread.
+        Frames published faster than the preview rate are dropped.
+        :param frame: 2D numpy array containing the image, must not be modified afterwards
+        :return: None
+        """
+        self.__frame_slot.publish(frame)
+
+    def render_bitmap(self, frame):
+        """
+        Method to set the image on screen. UI thread only.
         :param frame: 2D numpy array containing the image
         :return: None
         """
-        frame_small_rgb = resize(frame.copy(), (self.image_width, self.image_height))
+        frame_small_rgb = resize(frame, (self.image_width, self.image_height), dst=self.__preview_buffer)
         self.bmp.CopyFromBuffer(frame_small_rgb)
         self.image_container.SetInactiveBitmap(self.bmp)
 
@@ -74,3 +125,26 @@ class CalibrateDialogExtended(CalibrateDialog):
 class SettingsDialogExtended(SettingsDialog):
     def __init__(self, parent):
         SettingsDialog.__init__(self, parent)
+
+        # Profiling row, inserted before the spacer and the Okay button
+        sizer: wx.FlexGridSizer = self.GetSizer()
+        sizer.SetRows(sizer.GetRows() + 2)
+        index = len(sizer.GetChildren()) - 2
+
+        self.profile_label = wx.StaticText(self, wx.ID_ANY, u"Profile (seconds)")
+        self.profile_seconds = wx.SpinCtrl(self, wx.ID_ANY, min=1, max=600, initial=30)
+        self.profile_button = wx.Button(self, wx.ID_ANY, u"Start Profiling")
+        profile_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        profile_sizer.Add(self.profile_seconds, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        profile_sizer.Add(self.profile_button, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+
+        sizer.Insert(index, wx.StaticLine(self, style=wx.LI_HORIZONTAL), 0, wx.EXPAND | wx.ALL, 5)
+        sizer.Insert(index + 1, wx.StaticLine(self, style=wx.LI_HORIZONTAL), 0, wx.EXPAND | wx.ALL, 5)
+        sizer.Insert(index + 2, self.profile_label, 0, wx.ALL | wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL, 5)
+        sizer.Insert(index + 3, profile_sizer, 0, wx.ALIGN_CENTER_VERTICAL, 5)
+        sizer.Fit(self)
+
+        self.profile_button.Bind(wx.EVT_BUTTON, self.on_profile)
+
+    def on_profile(self, event):
+        event.Skip()
@@ -2,15 +2,37 @@ from cameracontrol import *
 from screen import *
 import geom
 from websocketserver import Server
+from pointer_output import PointerOutputStage
+from adaptive_quality import AdaptiveQualityController
+from utils import StageTimer, LatencyTracker, Preloader, MetricsRegistry, DURATION_BUCKETS, SamplingProfiler, \
+    event_log
 from constants import *
 import touchcontrol as tc
 
 from model.keypoint_classifier.keypoint_classifier import KEYPOITN_CLASSIFIER_MODEL_PATH
 
-from os.path import isfile
+from os.path import isfile, join
+from time import perf_counter, strftime
 from collections import Counter
 import typing
 
+if typing.TYPE_CHECKING:
+    from pykinect_azure.simulator import SimulatedSdk
+
+
+# Stages of the camera loop whose durations are measured, in order of execution
+CAMERA_LOOP_STAGES = ("capture", "imu", "color", "tracker", "decode", "hands", "visualize", "filter",
+                      "interaction", "websocket", "gui", "frame")
+
+# Outputs whose latency from the sensor data they originate from is measured, see LatencyTracker
+LATENCY_OUTPUTS = ("websocket", "touch")
+
+# Name prefixes of the threads sampled by the profiler: camera loop, hand tracking and MJPG decoding
+PROFILED_THREADS = ("cameraloop", "hands", "mjpg-decode")
+
+# Longest profile that can be requested, in seconds
+MAX_PROFILE_DURATION = 600
+
 
 class CameraException(Exception):
     pass
@@ -21,7 +43,12 @@ class K4ANotFoundException(Exception):
 
 
 class InteractionController:
-    def __init__(self, guicontext, infodata):
+    def __init__(self, guicontext, infodata: dict):
+        """
+        :param guicontext: Window showing the camera feed (set_bitmap) and infodata (set_datagrid_values),
+        None to run headless
+        :param infodata: Dictionary the camera loop writes its status to
+        """
 
         self.cameraloop_thread: Union[threading.Thread, None] = None
 
@@ -33,6 +60,7 @@ class InteractionController:
 
         self.screen_total_height = max([screen.px_height for screen in self.screens])
         self.screen_total_width = sum([screen.px_width for screen in self.screens])
+        tc.set_screen_size(self.screen_total_width, self.screen_total_height)
 
         self.interaction_mechanism: InteractionMechanism = InteractionMechanism.SELECT_BOTH_PAN_BOTH
         self.pointing_mechanism: PointingMechanism = PointingMechanism.POINTER_TO_OBJECT
@@ -40,13 +68,53 @@ class InteractionController:
         self.touch_control_enabled = False
         self.show_camerafeed_enabled = False
 
-        self.__tracker_controller = TrackerController(visualize=self.show_camerafeed_enabled)
+        # Optional output stage extrapolating pointers between camera frames. Read when the camera starts.
+        self.pointer_prediction_enabled: bool = False
+        self.pointer_output_rate: int = 90  # Hz
+        self.pointer_latency_compensation: float = 0.05  # seconds
+        self.__pointer_output: Union[PointerOutputStage, None] = None
+
+        # Durations of the camera loop stages. Summary is shown in the GUI every timing_display_interval frames
+        # and appended to timing_dump_path (if set) every timing_dump_interval seconds while the camera runs.
+        self.stage_timer = StageTimer(CAMERA_LOOP_STAGES, histogram_bounds=DURATION_BUCKETS)
+        self.timing_display_interval: int = 15
+        self.timing_dump_path: Union[str, None] = None
+        self.timing_dump_interval: float = 10
+
+        # Frames taking longer than slow_frame_factor frame periods are logged with their stage durations
+        self.slow_frame_factor: float = 2
+
+        # Opt-in: drop stale captures and lower quality while the camera loop falls behind. Read when the camera starts.
+        self.adaptive_quality_enabled: bool = False
+        self.__adaptive_quality: Union[AdaptiveQualityController, None] = None
+
+        # Opt-in: capture MJPG instead of BGRA and decode it at half resolution on the host. Read when the camera starts.
+        self.mjpg_capture_enabled: bool = False
+
+        # Sensor-to-output latency based on device timestamps, shown in the GUI together with the stage durations.
+        # Measured from the arrival of the image at the host unless latency_tracker.sensor_delay is set.
+        self.latency_tracker = LatencyTracker(LATENCY_OUTPUTS, histogram_bounds=DURATION_BUCKETS)
+
+        # Sampling profiler of the camera threads, started on request while the camera runs
+        self.profiler = SamplingProfiler()
+        self.profile_directory: str = "profiles"
+
+        self.__tracker_controller = TrackerController(visualize=self.show_camerafeed_enabled,
+                                                      stage_timer=self.stage_timer,
+                                                      latency_tracker=self.latency_tracker)
 
         self.current_operation: Operation = Operation.IDLE  # Operation performed in the current frame
         self.previous_operation: Operation = Operation.IDLE  # Operation performed in the alst frame
 
         self.last_tap: float = 0  # indicates time when last tap happened
 
+        # Counted by the camera thread for the metrics. All keys exist from the start, so that the dicts can be read
+        # from other threads while they are updated.
+        self.hand_state_counts: dict[tuple[str, HandState], int] = {
+            (hand, state): 0 for hand in ("left", "right") for state in HandState}
+        self.operation_transition_counts: dict[tuple[Operation, Operation], int] = {
+            (previous, current): 0 for previous in Operation for current in Operation if previous != current}
+
         self.prev_lefthand_pointing = (-1, -1)
         self.left_hand_coords_history: list[Point3D] = []
         self.prev_righthand_pointing = (1, -1)
@@ -63,20 +131,146 @@ class InteractionController:
         self.reference_handpos_for_rel_pointing: Union[None, Point3D] = None
         self.reference_screen_for_rel_pointing: Union[None, Screen] = None
 
+        # Metrics exported in the Prometheus format, collected when they are scraped
+        self.metrics: MetricsRegistry = self.create_metrics_registry()
+
+    def create_metrics_registry(self) -> MetricsRegistry:
+        """
+        Creates the metrics of tracking and interaction. They are read from infodata, the stage timer, the latency
+        tracker and the counts of hand states and operation transitions, so the camera loop does no extra work.
+        :return: Registry of the metrics
+        """
+        infodata = self.infodata
+
+        def info_value(key: str, scale: float = 1) -> typing.Callable[[], Union[float, None]]:
+            def collect():
+                value = infodata.get(key)
+                return value * scale if isinstance(value, (int, float)) else None  # e.g. "n.a." before camera start
+            return collect
+
+        def labelled(counts: dict, names) -> typing.Callable[[], dict]:
+            return lambda: {names(key): count for key, count in counts.copy().items()}
+
+        registry = MetricsRegistry()
+        registry.gauge("mgc_camera_running", "Whether the camera loop runs", self.is_camera_running)
+        registry.gauge("mgc_fps", "Frames per second of body tracking", info_value("fps"))
+        registry.counter("mgc_frames_total", "Frames processed by the camera loop",
+                         lambda: self.stage_timer.get_window("frame").count)
+        registry.counter("mgc_dropped_frames_total",
+                         "Camera frames missing from the body frames since the camera started, dropped by the device, "
+                         "the body tracker or frame skipping", info_value("dropped"))
+        registry.counter("mgc_skipped_captures_total",
+                         "Captures skipped by frame skipping in favour of newer ones since the camera started",
+                         info_value("skipped"))
+        registry.gauge("mgc_capture_backlog_seconds", "Age of the last capture when it was taken",
+                       info_value("backlog", 1 / 1000))
+        registry.gauge("mgc_tracked_bodies", "Bodies tracked in the last frame", info_value("bodies"))
+        registry.gauge("mgc_camera_pitch_degrees", "Pitch of the camera", info_value("pitch"))
+        registry.gauge("mgc_camera_roll_degrees", "Roll of the camera", info_value("roll"))
+        registry.counter("mgc_hand_states_total", "Frames by classified state of each hand",
+                         labelled(self.hand_state_counts, lambda key: (key[0], key[1].name)), ("hand", "state"))
+        registry.counter("mgc_operation_transitions_total", "Changes of the performed operation",
+                         labelled(self.operation_transition_counts, lambda key: (key[0].name, key[1].name)),
+                         ("from", "to"))
+        registry.gauge("mgc_websocket_clients", "Connected websocket clients", info_value("clients"))
+        registry.gauge("mgc_websocket_lag_seconds", "Largest send lag of the websocket clients",
+                       info_value("ws lag", 1 / 1000))
+        registry.gauge("mgc_profiler_running", "Whether the sampling profiler runs", lambda: self.profiler.running)
+        registry.histogram("mgc_stage_duration_seconds", "Durations of the camera loop stages",
+                           lambda: {(stage,): histogram
+                                    for stage, histogram in self.stage_timer.get_histograms().items()},
+                           ("stage",))
+        registry.histogram("mgc_output_latency_seconds",
+                           "Latency of each output from the arrival of the image at the host plus the sensor delay",
+                           lambda: {(output,): histogram
+                                    for output, histogram in self.latency_tracker.get_histograms().items()},
+                           ("output",))
+        registry.gauge("mgc_latency_sensor_delay_seconds", "Sensor delay included in mgc_output_latency_seconds",
+                       lambda: self.latency_tracker.sensor_delay)
+        return registry
+
+    def get_status(self) -> dict:
+        """
+        Gets the status of the camera loop, e.g. to serve it while running headless
+        :return: Dict with infodata, stage timings and latencies in milliseconds
+        """
+        return {"info": self.infodata.copy(),
+                "stage_timings": self.get_stage_timings(),
+                "latencies": self.get_latencies()}
+
+    def is_camera_running(self) -> bool:
+        return self.cameraloop_thread is not None and self.cameraloop_thread.is_alive()
+
+    def get_configuration(self) -> dict:
+        """
+        Gets the settings that affect performance, e.g. to tag profiles with them
+        :return: Dict setting -> value
+        """
+        tracker_controller = self.__tracker_controller
+        screens = next((name for name, screens in SCREEN_ENVIRONMENTS.items() if screens is self.screens), "custom")
+        width, height = pykinect.COLOR_RESOLUTIONS[tracker_controller.color_resolution]
+        return {"screens": screens,
+                "color_resolution": f"{width}x{height}",
+                "color_format": "MJPG" if self.mjpg_capture_enabled else "BGRA32",
+                "interaction_mechanism": self.interaction_mechanism.name,
+                "pointing_mechanism": self.pointing_mechanism.name,
+                "touch_control": self.touch_control_enabled,
+                "show_camerafeed": self.show_camerafeed_enabled,
+                "pointer_prediction": self.pointer_prediction_enabled,
+                "adaptive_quality": self.adaptive_quality_enabled,
+                "quality": self.infodata.get("quality", "full"),
+                "simulated": self.get_simulated_camera() is not None}
+
+    def start_profiling(self, duration: float) -> str:
+        """
+        Samples the stacks of the camera loop, hand tracking and decoding threads for a while. Writes a collapsed stack
+        file for flame graphs to profile_directory, tagged with the configuration. infodata shows "recording" as
+        "profile", then the path.
+        :param duration: Seconds to profile for, up to MAX_PROFILE_DURATION
+        :return: Path of the file, written once done. Raises ValueError for an invalid duration, RuntimeError if the
+        camera does not run or a profile is being recorded already.
+        """
+        if not 0 < duration <= MAX_PROFILE_DURATION:
+            raise ValueError(f"Profile duration must be between 0 and {MAX_PROFILE_DURATION} seconds")
+        if not self.is_camera_running():
+            raise RuntimeError("Camera is not running")
+
+        def profile_written(written_path: str):
+            self.infodata["profile"] = written_path
+
+        path = join(self.profile_directory, f"profile-{strftime('%Y%m%d-%H%M%S')}.folded")
+        self.profiler.start(duration, path, PROFILED_THREADS, tags=self.get_configuration(), on_done=profile_written)
+        self.infodata["profile"] = "recording"
+        event_log.record("profile", path=path, duration=duration)
+        return path
+
     def check_required_files(self):
-        k4a_path, k4abt_path = self.get_k4a_paths()
-        if not isfile(k4a_path):
-            raise K4ANotFoundException("Couldnt not find Azure Kinect Sensor SDK.\n"
-                                       "If it is not installed, please install it on your system.\n"
-                                       "If it is installed, check the file path in Settings.")
-        if not isfile(k4abt_path):
-            raise K4ANotFoundException("Could not find Azure Kinect Body Tracing SDK.\n"
-                                       "If it is not installed, please install it on your system.\n"
-                                       "If it is installed, check the file path in Settings.")
+        if self.get_simulated_camera() is None:  # a simulation replaces the SDKs
+            k4a_path, k4abt_path = self.get_k4a_paths()
+            if not isfile(k4a_path):
+                raise K4ANotFoundException("Couldnt not find Azure Kinect Sensor SDK.\n"
+                                           "If it is not installed, please install it on your system.\n"
+                                           "If it is installed, check the file path in Settings.")
+            if not isfile(k4abt_path):
+                raise K4ANotFoundException("Could not find Azure Kinect Body Tracing SDK.\n"
+                                           "If it is not installed, please install it on your system.\n"
+                                           "If it is installed, check the file path in Settings.")
 
         if not isfile(KEYPOITN_CLASSIFIER_MODEL_PATH):
             raise FileNotFoundError(KEYPOITN_CLASSIFIER_MODEL_PATH)
 
+    def warm_up(self) -> Preloader:
+        """
+        Creates the hand tracking models in the background, e.g. once the GUI shows, so that starting the camera only
+        waits for the device. Their state is shown in the GUI.
+        :return: Preloader of the models
+        """
+        return self.__tracker_controller.preload_hand_models(self.__show_model_state)
+
+    def __show_model_state(self, state: str):
+        self.infodata["models"] = state
+        if self.guicontext is not None:
+            self.guicontext.set_datagrid_values(self.infodata)
 
     def start_camera(self):
         """
@@ -93,16 +287,21 @@ class InteractionController:
         if camera_numbers > 1:
             raise CameraException("Multiple cameras not supported")
 
-        self.cameraloop_thread = threading.Thread(target=self.cameraloop, daemon=True)
+        self.cameraloop_thread = threading.Thread(target=self.cameraloop, name="cameraloop", daemon=True)
+        self.__tracker_controller.color_format = pykinect.K4A_IMAGE_FORMAT_COLOR_MJPG if self.mjpg_capture_enabled \
+            else pykinect.K4A_IMAGE_FORMAT_COLOR_BGRA32
         self.__tracker_controller.initialize_tracking()
         self.cameraloop_thread.start()
+        event_log.record("camera_started", **self.get_configuration())
 
     def stop_camera(self):
         """ Stops the thread in which camera feed is processed. """
+        self.profiler.stop()  # writes what was sampled so far
         if self.__tracker_controller.camera_running:
             self.__tracker_controller.camera_running = False
             self.cameraloop_thread.join()  # wait for cameraloop thread to finnish its last iteratino
             self.__tracker_controller.stopDevice()
+            event_log.record("camera_stopped")
 
     def toggle_show_camerafeed(self, visualize: bool):
         """ Initiates the camerafeed showing on screen. """
@@ -114,6 +313,32 @@ class InteractionController:
         self.screens = screens
         self.screen_total_height = max([screen.px_height for screen in self.screens])
         self.screen_total_width = sum([screen.px_width for screen in self.screens])
+        tc.set_screen_size(self.screen_total_width, self.screen_total_height)
+
+    def get_stage_timings(self) -> dict:
+        """
+        Gets latency percentiles of the camera loop stages
+        :return: Dict stage -> dict with count, last, p50, p95, p99 and max duration in milliseconds
+        """
+        return self.stage_timer.get_summary()
+
+    def get_latencies(self) -> dict:
+        """
+        Gets percentiles of the latency of each output, from the arrival of the image at the host plus the sensor delay
+        :return: Dict output -> dict with count, last, p50, p95, p99 and max latency in milliseconds
+        """
+        return self.latency_tracker.get_summary()
+
+    def set_simulated_camera(self, simulated_sdk: Union["SimulatedSdk", None]):
+        """
+        Replaces the Azure Kinect SDKs by a simulation, so the application runs without a camera
+        :param simulated_sdk: The simulation, None to use the SDKs again. Takes effect on the next camera start.
+        :return: None
+        """
+        self.__tracker_controller.simulated_sdk = simulated_sdk
+
+    def get_simulated_camera(self) -> Union["SimulatedSdk", None]:
+        return self.__tracker_controller.simulated_sdk
 
     def get_k4a_paths(self) -> tuple[str, str]:
         return self.__tracker_controller.get_k4a_module_path(), self.__tracker_controller.get_k4a_bt_module_path()
@@ -146,9 +371,43 @@ class InteractionController:
         server = Server()
         server.open_server()
 
+        latency = self.latency_tracker
+
+        def publish(msg: dict):
+            server.send_json(msg)
+            latency.record_output("websocket", msg["timestamp_usec"])
+
+        def touch_injected(contacts: tuple[tc.TouchContact, ...]):
+            if contacts:
+                latency.record_output("touch", contacts[0].origin_usec)
+
+        # Touch latency is measured when the contacts are handed to the operating system
+        tc.set_injection_listener(touch_injected)
+
+        # Output stage publishes messages and moves touch contacts at a higher rate than the camera
+        if self.pointer_prediction_enabled:
+            self.__pointer_output = PointerOutputStage(publish,
+                                                       rate_hz=self.pointer_output_rate,
+                                                       latency_compensation=self.pointer_latency_compensation)
+            self.__pointer_output.start()
+
+        if self.timing_dump_path is not None:
+            self.stage_timer.start_dump(self.timing_dump_path, self.timing_dump_interval)
+
+        timer = self.stage_timer
+        frame_count = 0
+
+        tracker_controller = self.__tracker_controller
+        tracker_controller.drop_stale_captures = self.adaptive_quality_enabled
+        if self.adaptive_quality_enabled:
+            self.__adaptive_quality = AdaptiveQualityController(tracker_controller.get_degradations(),
+                                                                frame_budget=tracker_controller.frame_period,
+                                                                max_backlog=tracker_controller.max_capture_backlog)
+
         # Initialize message to be sent through websocket server
         message = {
             "centercross": True if self.pointing_mechanism == PointingMechanism.OBJECT_TO_POITNER else False,
+            "timestamp_usec": None,  # device timestamp of the camera frame the positions originate from
             "right": {
                 "present": False,
                 "fine": False,
@@ -169,46 +428,114 @@ class InteractionController:
 
         # Loop to continuously captuer camera feed
         while True:
+            frame_start = perf_counter()
 
             # update websocket message to display cross in center in feature-to-pointer method
             message["centercross"] = True if self.pointing_mechanism == PointingMechanism.OBJECT_TO_POITNER else False
 
             # Get result of body tracking
             bodyresult: BodyResult = self.__tracker_controller.getBodyCaptureData()
+            message["timestamp_usec"] = self.__tracker_controller.frame_timestamp_usec
 
             # Show camerafeed in GUI (if enabled)
-            if self.show_camerafeed_enabled:
+            gui_start = perf_counter()
+            if self.show_camerafeed_enabled and self.guicontext is not None:
                 self.guicontext.set_bitmap(self.__tracker_controller.color_image_rgb)
+            gui_time = perf_counter() - gui_start
 
             # Update infodata dictionary (will show in grid in GUI)
             self.infodata["fps"] = self.__tracker_controller.fps
             self.infodata["bodies"] = self.__tracker_controller.number_tracked_bodies
             self.infodata["pitch"] = round(self.__tracker_controller.pitch * (180 / math.pi), 1)
             self.infodata["roll"] = round(self.__tracker_controller.roll * (180 / math.pi), 1)
-
-            self.fill_histories(bodyresult)
-
-            if bodyresult is not None:
-                # Process results from body tracking
-                self.process_bodyresult(bodyresult, message)
-            else:
-                message["right"]["present"] = False
-                message["left"]["present"] = False
-                tc.finger_up()
+            self.infodata["dropped"] = self.__tracker_controller.dropped_frames
+            self.infodata["skipped"] = self.__tracker_controller.skipped_captures
+            self.infodata["backlog"] = round(self.__tracker_controller.capture_backlog * 1000, 1)
+
+            with timer.measure("interaction"):
+                previous_operation = self.current_operation
+                previous_fine_pointing = (self.left_hand_relative_pointing, self.right_hand_relative_pointing)
+                self.fill_histories(bodyresult)
+
+                # All touch events of this frame are injected together at the end of the with-block
+                with tc.touch_frame(message["timestamp_usec"]):
+                    if bodyresult is not None:
+                        # Process results from body tracking
+                        self.process_bodyresult(bodyresult, message)
+                    else:
+                        message["right"]["present"] = False
+                        message["left"]["present"] = False
+                        tc.finger_up()
 
             # update infodata dict
             self.infodata["operation"] = self.current_operation.name
-
-            server.send_json(message)  # send message through websocket
-            self.guicontext.set_datagrid_values(self.infodata)  # update datagrid in gui with info data
+            self.log_decisions(previous_operation, previous_fine_pointing)
+
+            with timer.measure("websocket"):
+                if self.__pointer_output is None:
+                    publish(message)  # publish message, websocket server sends it from its own thread
+                else:
+                    self.__pointer_output.update(message)
+
+            ws_stats = server.get_stats()
+            self.infodata["clients"] = len(ws_stats["clients"])
+            self.infodata["ws lag"] = max((client["lag_ms"] for client in ws_stats["clients"]), default=0)
+
+            frame_count += 1
+            if frame_count % self.timing_display_interval == 0:
+                self.infodata.update(timer.format_summary())
+                self.infodata.update(latency.format_summary())
+
+            gui_start = perf_counter()
+            if self.guicontext is not None:
+                self.guicontext.set_datagrid_values(self.infodata)  # update datagrid in gui with info data
+            timer.record("gui", gui_time + perf_counter() - gui_start)
+
+            frame_time = perf_counter() - frame_start
+            timer.record("frame", frame_time)
+            if frame_time > self.slow_frame_factor * tracker_controller.frame_period:
+                event_log.record("slow_frame", duration_ms=round(frame_time * 1000, 1),
+                                 stages_ms={stage: round(timer.get_window(stage).last * 1000, 1)
+                                            for stage in CAMERA_LOOP_STAGES[:-1]})
+
+            if self.__adaptive_quality is not None:
+                busy_time = frame_time - timer.get_window("capture").last  # without blocking for the next capture
+                self.__adaptive_quality.update(busy_time, tracker_controller.capture_backlog)
+                self.infodata["quality"] = self.__adaptive_quality.level_name
 
             # break cameraloop
             if not self.__tracker_controller.camera_running:
                 break
 
+        if self.__pointer_output is not None:
+            self.__pointer_output.stop()
+            self.__pointer_output = None
+
+        self.__adaptive_quality = None
+
+        self.stage_timer.stop_dump()
+        tc.set_injection_listener(None)
+
         # Close websocket server
         server.close_server()
 
+    def log_decisions(self, previous_operation: Operation, previous_fine_pointing: tuple[bool, bool]):
+        """
+        Counts and logs changes of the operation and of fine pointing in the current frame
+        :param previous_operation: Operation before the frame was processed
+        :param previous_fine_pointing: Whether the left and right hand were fine pointing before
+        :return: None
+        """
+        if self.current_operation != previous_operation:
+            self.operation_transition_counts[previous_operation, self.current_operation] += 1
+            event_log.record("operation", previous=previous_operation.name, current=self.current_operation.name,
+                             left=self.left_hand_state_history[-1].name, right=self.right_hand_state_history[-1].name)
+
+        fine_pointing = (self.left_hand_relative_pointing, self.right_hand_relative_pointing)
+        for hand, engaged, previously_engaged in zip(("left", "right"), fine_pointing, previous_fine_pointing):
+            if engaged != previously_engaged:
+                event_log.record("fine_pointing", hand=hand, engaged=engaged)
+
     def fill_histories(self, bodyresult: BodyResult):
         """
         Method to manage lists of bodyresult values from past frames
@@ -260,6 +587,9 @@ class InteractionController:
         except AttributeError:
             add_item_to_history(self.right_hand_state_history, HandState.UNTRACKED, hand_state_history_length)
 
+        self.hand_state_counts["left", self.left_hand_state_history[-1]] += 1
+        self.hand_state_counts["right", self.right_hand_state_history[-1]] += 1
+
     def process_bodyresult(self, bodyresult, message):
         """
         Method to process results of body tracking
@@ -952,27 +1282,40 @@ class InteractionController:
     def transition_to_panleft(self, x_left: int, y_left: int):
         """ Transitions to pan-left operation: Emulates fingerperss on tuoch screen. """
         tc.finger_down((x_left, y_left))
+        if self.__pointer_output is not None:
+            self.__pointer_output.bind_contact("left", 0, (x_left, y_left))
 
     def transition_from_panleft(self):
         """ Ends Pan-Left operation: Emulates lifting finger up from touch screen. """
+        if self.__pointer_output is not None:
+            self.__pointer_output.release_contacts()
         tc.finger_up()
         self.last_tap = time()
 
     def transition_to_panrigth(self, x_right: int, y_right: int):
         """ Transitions to pan-right operation: Emulates fingerperss on tuoch screen. """
         tc.finger_down((x_right, y_right))
+        if self.__pointer_output is not None:
+            self.__pointer_output.bind_contact("right", 0, (x_right, y_right))
 
     def transition_from_panright(self):
         """ Ends Pan-Left operation: Emulates lifting finger up from touch screen. """
+        if self.__pointer_output is not None:
+            self.__pointer_output.release_contacts()
         tc.finger_up()
         self.last_tap = time()
 
     def transition_from_zoom(self):
+        if self.__pointer_output is not None:
+            self.__pointer_output.release_contacts()
         tc.two_fingers_up()
         self.last_tap = time()
 
     def transition_to_zoom(self, x_left, y_left, x_right, y_right):
         tc.two_fingers_down((x_left, y_left), (x_right, y_right))
+        if self.__pointer_output is not None:
+            self.__pointer_output.bind_contact("left", 0, (x_left, y_left))
+            self.__pointer_output.bind_contact("right", 1, (x_right, y_right))
 
     def process_operation(self, x_left: int, y_left: int, x_right: int, y_right: int):
         if self.current_operation == Operation.SELECT_LEFTHAND:
@@ -998,9 +1341,11 @@ class InteractionController:
         if self.pointing_mechanism == PointingMechanism.POINTER_TO_OBJECT:
             x_prev, y_prev = self.prev_lefthand_pointing
             tc.tap((x_prev, y_prev))
+            self.log_tap("left", (x_prev, y_prev))
 
         if self.pointing_mechanism == PointingMechanism.OBJECT_TO_POITNER:
             tc.tap((int(self.screen_total_width / 2), int(self.screen_total_height/2)))
+            self.log_tap("left", (int(self.screen_total_width / 2), int(self.screen_total_height/2)))
 
         self.last_tap = time()
 
@@ -1012,19 +1357,39 @@ class InteractionController:
         if self.pointing_mechanism == PointingMechanism.POINTER_TO_OBJECT:
             x_prev, y_prev = self.prev_righthand_pointing
             tc.tap((x_prev, y_prev))
+            self.log_tap("right", (x_prev, y_prev))
 
         if self.pointing_mechanism == PointingMechanism.OBJECT_TO_POITNER:
             tc.tap((int(self.screen_total_width / 2), int(self.screen_total_height/2)))
+            self.log_tap("right", (int(self.screen_total_width / 2), int(self.screen_total_height/2)))
 
         self.last_tap = time()
 
+    def log_tap(self, hand: str, position: tuple[int, int]):
+        """
+        Logs a tap with the recent hand states and hand tip positions that led to it
+        :param hand: "left" or "right"
+        :param position: Tapped screen position in pixels
+        :return: None
+        """
+        if hand == "left":
+            states, tips = self.left_hand_state_history, self.left_hand_coords_history
+        else:
+            states, tips = self.right_hand_state_history, self.right_hand_coords_history
+        event_log.record("tap", hand=hand, x=position[0], y=position[1], pointing=self.pointing_mechanism.name,
+                         hand_states=[state.name for state in states],
+                         hand_tips=[(round(tip.x), round(tip.y), round(tip.z)) for tip in tips])
+
     def pan_righthand(self, x: int, y: int):
-        tc.move_finger((x-self.prev_righthand_pointing[0], y - self.prev_righthand_pointing[1]))
+        # with the pointer output stage, bound touch contacts are moved by the stage
+        if self.__pointer_output is None:
+            tc.move_finger((x-self.prev_righthand_pointing[0], y - self.prev_righthand_pointing[1]))
         self.prev_righthand_pointing = (x, y)
         self.last_tap = time()
 
     def pan_lefthand(self, x: int, y: int):
-        tc.move_finger((x-self.prev_lefthand_pointing[0], y-self.prev_lefthand_pointing[1]))
+        if self.__pointer_output is None:
+            tc.move_finger((x-self.prev_lefthand_pointing[0], y-self.prev_lefthand_pointing[1]))
         self.prev_lefthand_pointing = (x, y)
         self.last_tap = time()
 
@@ -1033,8 +1398,9 @@ class InteractionController:
             self.prev_lefthand_pointing = (x_left - self.screen_total_width, y_left)
         if self.prev_righthand_pointing is None:
             self.prev_righthand_pointing = (x_right - self.screen_total_width, y_right)
-        tc.move_two_fingers((x_left - self.prev_lefthand_pointing[0], y_left-self.prev_lefthand_pointing[1]),
-                            (x_right - self.prev_righthand_pointing[0], y_right - self.prev_righthand_pointing[1]))
+        if self.__pointer_output is None:
+            tc.move_two_fingers((x_left - self.prev_lefthand_pointing[0], y_left-self.prev_lefthand_pointing[1]),
+                                (x_right - self.prev_righthand_pointing[0], y_right - self.prev_righthand_pointing[1]))
         self.prev_lefthand_pointing = (x_left, y_left)
         self.prev_righthand_pointing = (x_right, y_right)
         self.last_tap = time()
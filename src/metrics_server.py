@@ -0,0 +1,130 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from typing import Callable, Union
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "_HTTPServer"
+
+    def do_GET(self):
+        metrics_server = self.server.metrics_server
+        url = urlsplit(self.path)
+        path = url.path
+
+        if path == "/metrics" and metrics_server.get_metrics is not None:
+            body = metrics_server.get_metrics().encode("utf-8")
+            self.__respond(200, "text/plain; version=0.0.4", body)
+        elif path == "/status":
+            body = json.dumps(metrics_server.get_status(), default=str).encode("utf-8")
+            self.__respond(200, "application/json", body)
+        elif path == "/events" and metrics_server.get_events is not None:
+            try:
+                count = int(parse_qs(url.query).get("count", ["100"])[0])
+            except ValueError as e:
+                self.__respond(400, "text/plain", f"{e}\n".encode("utf-8"))
+                return
+            body = json.dumps(metrics_server.get_events(count), default=str).encode("utf-8")
+            self.__respond(200, "application/json", body)
+        elif path == "/health":
+            healthy = metrics_server.is_healthy()
+            self.__respond(200 if healthy else 503, "text/plain", b"ok\n" if healthy else b"unhealthy\n")
+        else:
+            self.__respond(404, "text/plain", b"not found\n")
+
+    def do_POST(self):
+        metrics_server = self.server.metrics_server
+        url = urlsplit(self.path)
+
+        if url.path == "/profile" and metrics_server.start_profiling is not None:
+            try:
+                duration = float(parse_qs(url.query).get("seconds", ["10"])[0])
+                path = metrics_server.start_profiling(duration)
+            except ValueError as e:
+                self.__respond(400, "text/plain", f"{e}\n".encode("utf-8"))
+            except RuntimeError as e:
+                self.__respond(409, "text/plain", f"{e}\n".encode("utf-8"))
+            else:
+                body = json.dumps({"path": path, "seconds": duration}).encode("utf-8")
+                self.__respond(202, "application/json", body)
+        else:
+            self.__respond(404, "text/plain", b"not found\n")
+
+    def __respond(self, code: int, content_type: str, body: bytes):
+        self.send_response(code)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # polled every few seconds, would flood the output
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], metrics_server: "MetricsServer"):
+        super().__init__(address, _RequestHandler)
+        self.metrics_server = metrics_server
+
+
+class MetricsServer(object):
+    """
+    Serves the status of the application over HTTP from a daemon thread, replacing the data grid of the GUI when running
+    headless:
+    /metrics: Metrics in the Prometheus text format, if get_metrics is given
+    /status: JSON document of the status
+    /events?count=N: JSON list of the N (default 100) most recent events, if get_events is given
+    /health: 200 while the application is healthy, 503 otherwise, e.g. for supervisors
+    POST /profile?seconds=N: Starts profiling for N (default 10) seconds, if start_profiling is given. Responds 202 with
+    the path of the profile, 400 for an invalid duration, 409 if profiling is not possible.
+    """
+    def __init__(self, get_status: Callable[[], dict], is_healthy: Callable[[], bool],
+                 host: str = "localhost", port: int = 8766, get_metrics: Union[Callable[[], str], None] = None,
+                 start_profiling: Union[Callable[[float], str], None] = None,
+                 get_events: Union[Callable[[int], list], None] = None):
+        """
+        :param get_status: Gets the status, called from the thread serving the request
+        :param is_healthy: Gets whether the application is healthy, called from the thread serving the request
+        :param host: Host name or address to listen on
+        :param port: Port to listen on, 0 to pick a free one
+        :param get_metrics: Renders the metrics, e.g. MetricsRegistry.render, called from the thread serving the request
+        :param start_profiling: Starts profiling for a number of seconds and returns the path of the profile, raising
+        ValueError for invalid durations and RuntimeError if it cannot profile
+        :param get_events: Gets a number of the most recent events, e.g. EventLog.recent
+        """
+        self.get_status = get_status
+        self.is_healthy = is_healthy
+        self.get_metrics = get_metrics
+        self.start_profiling = start_profiling
+        self.get_events = get_events
+        self.host = host
+        self.port = port
+
+        self.__server: Union[_HTTPServer, None] = None
+        self.__thread: Union[threading.Thread, None] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """ Address the server listens on, the port is the one picked if 0 was given. """
+        if self.__server is None:
+            return self.host, self.port
+        return self.__server.server_address[:2]
+
+    def open_server(self):
+        """ Starts listening and serving requests in a new thread. """
+        self.__server = _HTTPServer((self.host, self.port), self)
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="metrics-server", daemon=True)
+        self.__thread.start()
+
+    def close_server(self):
+        """ Stops serving requests and closes the socket. """
+        if self.__server is None:
+            return
+        self.__server.shutdown()
+        self.__thread.join()
+        self.__server.server_close()
+        self.__server = None
+        self.__thread = None
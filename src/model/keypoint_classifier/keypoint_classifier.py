@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import numpy as np
-from tensorflow import lite
 
 
 KEYPOITN_CLASSIFIER_MODEL_PATH = './model/keypoint_classifier/keypoint_classifier.tflite'
@@ -13,6 +12,8 @@ class KeyPointClassifier(object):
         model_path=KEYPOITN_CLASSIFIER_MODEL_PATH,
         num_threads=1,
     ):
+        from tensorflow import lite  # takes seconds, so only once the classifier is needed
+
         self.interpreter = lite.Interpreter(model_path=model_path, num_threads=num_threads)
 
         self.interpreter.allocate_tensors()
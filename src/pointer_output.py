@@ -0,0 +1,177 @@
+"""
+Output stage that emits pointer positions at a higher rate than the camera delivers them.
+Positions are extrapolated with a constant-velocity alpha-beta predictor to compensate for pipeline latency.
+"""
+import copy
+import threading
+from time import perf_counter, sleep
+from typing import Callable, Union
+
+import touchcontrol as tc
+
+
+class AlphaBetaPredictor:
+    """
+    Constant-velocity alpha-beta filter for a single coordinate
+    """
+    def __init__(self, alpha: float = 0.85, beta: float = 0.3):
+        """
+        :param alpha: Weight of the position residual, between 0 and 1
+        :param beta: Weight of the velocity residual, between 0 and 2
+        """
+        self.alpha: float = alpha
+        self.beta: float = beta
+
+        self.x: float = 0  # estimated position
+        self.v: float = 0  # estimated velocity per second
+        self.t: Union[float, None] = None  # time of the last measurement
+
+    def reset(self):
+        self.x, self.v, self.t = 0, 0, None
+
+    def update(self, t: float, measurement: float):
+        """
+        Corrects the estimate with a new measurement
+        :param t: Time of the measurement in seconds
+        :param measurement: The measured value
+        :return: None
+        """
+        if self.t is None:
+            self.x, self.v, self.t = measurement, 0, t
+            return
+
+        dt = t - self.t
+        if dt <= 0:
+            self.x = measurement
+            return
+
+        x_pred = self.x + self.v * dt
+        residual = measurement - x_pred
+        self.x = x_pred + self.alpha * residual
+        self.v = self.v + (self.beta / dt) * residual
+        self.t = t
+
+    def predict(self, t: float) -> float:
+        """
+        Extrapolates the estimate to a point in time
+        :param t: Time in seconds
+        :return: Predicted value
+        """
+        if self.t is None:
+            return self.x
+        return self.x + self.v * (t - self.t)
+
+
+class PointerOutputStage:
+    """
+    Publishes pointer positions to the websocket and moves bound touch contacts at a fixed rate,
+    extrapolating between and beyond camera frames.
+    """
+    def __init__(self, publish: Callable[[dict], None], rate_hz: float = 90, latency_compensation: float = 0.05,
+                 max_extrapolation: float = 0.1):
+        """
+        :param publish: Function publishing a websocket message, e.g. Server.send_json
+        :param rate_hz: Output rate in Hz
+        :param latency_compensation: Seconds the pointer is predicted ahead of the latest measurement
+        :param max_extrapolation: Maximum seconds a pointer is extrapolated, prevents overshooting when tracking stalls
+        """
+        self.publish = publish
+        self.rate_hz: float = rate_hz
+        self.latency_compensation: float = latency_compensation
+        self.max_extrapolation: float = max_extrapolation
+
+        self.__predictors: dict[str, tuple[AlphaBetaPredictor, AlphaBetaPredictor]] = {
+            "left": (AlphaBetaPredictor(), AlphaBetaPredictor()),
+            "right": (AlphaBetaPredictor(), AlphaBetaPredictor())
+        }
+        self.__message: Union[dict, None] = None
+        self.__bound_contacts: dict[int, tuple[str, tuple[int, int]]] = {}  # contact idx -> (hand, offset)
+
+        self.__lock = threading.Lock()
+        self.__running = False
+        self.__thread: Union[threading.Thread, None] = None
+
+    def start(self):
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        self.__running = False
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def update(self, message: dict, t: Union[float, None] = None):
+        """
+        Passes the latest websocket message of the camera loop to the output stage
+        :param message: Websocket message with present flag and position of each hand
+        :param t: perf_counter() time the positions were measured at, now if None
+        :return: None
+        """
+        t = perf_counter() if t is None else t
+        with self.__lock:
+            for hand, (predictor_x, predictor_y) in self.__predictors.items():
+                if message[hand]["present"]:
+                    predictor_x.update(t, message[hand]["position"]["x"])
+                    predictor_y.update(t, message[hand]["position"]["y"])
+                else:
+                    predictor_x.reset()
+                    predictor_y.reset()
+            self.__message = copy.deepcopy(message)
+
+    def bind_contact(self, hand: str, idx: int, pointer_coords: tuple[int, int]):
+        """
+        Lets a touch contact follow the predicted pointer of a hand, keeping its current offset to the pointer
+        :param hand: "left" or "right"
+        :param idx: Index of the touch contact
+        :param pointer_coords: Pointer coordinates of the hand at the time the contact was put down
+        :return: None
+        """
+        contact_x, contact_y = tc.get_finger_position(idx)
+        offset = (contact_x - pointer_coords[0], contact_y - pointer_coords[1])
+        with self.__lock:
+            self.__bound_contacts[idx] = (hand, offset)
+
+    def release_contacts(self):
+        """ Stops moving touch contacts. Call before lifting them. """
+        with self.__lock:
+            self.__bound_contacts.clear()
+
+    def __run(self):
+        period = 1 / self.rate_hz
+        next_tick = perf_counter()
+        while self.__running:
+            self.__emit(perf_counter())
+
+            next_tick += period
+            delay = next_tick - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            else:
+                next_tick = perf_counter()  # fell behind, do not try to catch up
+
+    def __emit(self, now: float):
+        with self.__lock:
+            if self.__message is None:
+                return
+            message = copy.deepcopy(self.__message)
+            predicted = {}
+            for hand, (predictor_x, predictor_y) in self.__predictors.items():
+                if predictor_x.t is None or not message[hand]["present"]:
+                    continue
+                horizon = min(now - predictor_x.t + self.latency_compensation, self.max_extrapolation)
+                x = round(predictor_x.predict(predictor_x.t + horizon))
+                y = round(predictor_y.predict(predictor_y.t + horizon))
+                message[hand]["position"]["x"] = x
+                message[hand]["position"]["y"] = y
+                predicted[hand] = (x, y)
+            bound_contacts = list(self.__bound_contacts.items())
+
+        self.publish(message)
+
+        with tc.touch_frame(message.get("timestamp_usec")):
+            for idx, (hand, offset) in bound_contacts:
+                if hand in predicted:
+                    x, y = predicted[hand]
+                    tc.move_finger_to((x + offset[0], y + offset[1]), idx)
@@ -1,6 +1,6 @@
 from .pykinect import *
-from .k4a import Calibration, Capture, Configuration, default_configuration, Device, Image, ImuSample, Transformation
-from .k4abt import Body, Body2d, Frame, Joint, Joint2d, Tracker
+from .k4a import Calibration, Capture, Configuration, default_configuration, Device, Image, ImuSample, ImuRingBuffer, Transformation
+from .k4abt import Body, Body2d, Frame, Joint, Joint2d, SkeletonOverlay, Tracker
 from .k4arecord import Datablock, Record, Playback
 
 from .k4a._k4atypes import *
@@ -4,4 +4,5 @@ from .configuration import Configuration, default_configuration
 from .device import Device
 from .image import Image
 from .imu_sample import ImuSample
+from .imu_buffer import ImuRingBuffer, imu_sample_dtype
 from .transformation import Transformation
\ No newline at end of file
@@ -63,6 +63,14 @@ K4A_DEPTH_MODE_WFOV_2X2BINNED = 3
 K4A_DEPTH_MODE_WFOV_UNBINNED = 4
 K4A_DEPTH_MODE_PASSIVE_IR = 5
 
+# Width and height of the depth image of each depth mode in pixels
+DEPTH_RESOLUTIONS = {
+	K4A_DEPTH_MODE_NFOV_2X2BINNED: (320, 288),
+	K4A_DEPTH_MODE_NFOV_UNBINNED: (640, 576),
+	K4A_DEPTH_MODE_WFOV_2X2BINNED: (512, 512),
+	K4A_DEPTH_MODE_WFOV_UNBINNED: (1024, 1024),
+	K4A_DEPTH_MODE_PASSIVE_IR: (1024, 1024)}
+
 #class k4a_color_resolution_t(CtypeIntEnum):
 k4a_color_resolution_t = ctypes.c_int
 K4A_COLOR_RESOLUTION_OFF = 0
@@ -73,6 +81,15 @@ K4A_COLOR_RESOLUTION_1536P = 4
 K4A_COLOR_RESOLUTION_2160P = 5
 K4A_COLOR_RESOLUTION_3072P = 6
 
+# Width and height of the color image of each color resolution in pixels
+COLOR_RESOLUTIONS = {
+	K4A_COLOR_RESOLUTION_720P: (1280, 720),
+	K4A_COLOR_RESOLUTION_1080P: (1920, 1080),
+	K4A_COLOR_RESOLUTION_1440P: (2560, 1440),
+	K4A_COLOR_RESOLUTION_1536P: (2048, 1536),
+	K4A_COLOR_RESOLUTION_2160P: (3840, 2160),
+	K4A_COLOR_RESOLUTION_3072P: (4096, 3072)}
+
 #class k4a_image_format_t(CtypeIntEnum):
 k4a_image_format_t = ctypes.c_int
 K4A_IMAGE_FORMAT_COLOR_MJPG = 0
@@ -96,6 +113,9 @@ K4A_FRAMES_PER_SECOND_5 = 0
 K4A_FRAMES_PER_SECOND_15 = 1
 K4A_FRAMES_PER_SECOND_30 = 2
 
+# Frames per second of each frame rate setting
+FRAMES_PER_SECOND = {K4A_FRAMES_PER_SECOND_5: 5, K4A_FRAMES_PER_SECOND_15: 15, K4A_FRAMES_PER_SECOND_30: 30}
+
 #class k4a_color_control_command_t(CtypeIntEnum):
 k4a_color_control_command_t = ctypes.c_int
 K4A_COLOR_CONTROL_EXPOSURE_TIME_ABSOLUTE = 0
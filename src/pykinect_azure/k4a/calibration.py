@@ -1,5 +1,7 @@
 import ctypes
 
+import numpy as np
+
 from pykinect_azure.k4a import _k4a
 
 
@@ -47,6 +49,20 @@ class Calibration:
                     [0, self.depth_params.fy, self.depth_params.cy],
                     [0, 0, 1]]
 
+    def get_distortion(self, camera: _k4a.k4a_calibration_type_t) -> np.ndarray:
+        """Distortion coefficients of the Brown-Conrady model in OpenCV order (k1, k2, p1, p2, k3, k4, k5, k6)"""
+        params = self.color_params if camera == _k4a.K4A_CALIBRATION_TYPE_COLOR else self.depth_params
+        return np.array([params.k1, params.k2, params.p1, params.p2,
+                         params.k3, params.k4, params.k5, params.k6], dtype=np.float64)
+
+    def get_extrinsics(self, source_camera: _k4a.k4a_calibration_type_t,
+                       target_camera: _k4a.k4a_calibration_type_t) -> tuple[np.ndarray, np.ndarray]:
+        """Rotation matrix (3x3) and translation vector in millimeters from source to target camera coordinates"""
+        extrinsics = self._handle.extrinsics[source_camera][target_camera]
+        rotation = np.array(extrinsics.rotation, dtype=np.float64).reshape(3, 3)
+        translation = np.array(extrinsics.translation, dtype=np.float64)
+        return rotation, translation
+
     def is_valid(self):
         return self._handle
 
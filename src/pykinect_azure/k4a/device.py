@@ -68,6 +68,24 @@ class Device:
 			
 		return Device.capture
 
+	def try_update(self, timeout_in_ms=0):
+		# Get the next capture if one is available within the timeout, keep the current capture otherwise
+		capture_handle = _k4a.k4a_capture_t()
+		if _k4a.k4a_device_get_capture(self._handle, capture_handle, timeout_in_ms) != _k4a.K4A_WAIT_RESULT_SUCCEEDED:
+			return False
+
+		if self.is_capture_initialized():
+			Device.capture.release_handle()
+			Device.capture._handle = capture_handle
+		else :
+			Device.capture = Capture(capture_handle, Device.calibration)
+
+		# Write capture if recording
+		if self.recording:
+			self.record.write_capture(Device.capture.handle())
+
+		return True
+
 	def update_imu(self, timeout_in_ms=K4A_WAIT_INFINITE):
 		
 		# Get imu sample
@@ -92,6 +110,16 @@ class Device:
 			
 		return capture_handle
 
+	def drain_imu(self, imu_buffer, timeout_in_ms=0):
+		# Reads all queued IMU samples into an ImuRingBuffer, waiting at most timeout_in_ms for the first one.
+		# Returns the number of samples read
+		count = 0
+		while _k4a.k4a_device_get_imu_sample(self._handle, imu_buffer.next_slot(), timeout_in_ms) == _k4a.K4A_WAIT_RESULT_SUCCEEDED:
+			imu_buffer.commit()
+			count += 1
+			timeout_in_ms = 0
+		return count
+
 	def get_imu_sample(self, timeout_in_ms=_k4a.K4A_WAIT_INFINITE):
 
 		imu_sample = _k4a.k4a_imu_sample_t()
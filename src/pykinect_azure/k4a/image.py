@@ -1,3 +1,5 @@
+import ctypes
+
 import numpy as np
 import cv2
 
@@ -55,6 +57,14 @@ class Image:
 	def size(self):
 		return self.get_size()
 
+	@property
+	def device_timestamp_usec(self):
+		return self.get_device_timestamp_usec()
+
+	@property
+	def system_timestamp_nsec(self):
+		return self.get_system_timestamp_nsec()
+
 
 	def get_buffer(self):
 		if not self._handle:
@@ -62,6 +72,17 @@ class Image:
 
 		return _k4a.k4a_image_get_buffer(self._handle)
 		
+	def get_buffer_view(self):
+		# Buffer as ctypes array that holds a reference to this Image, so the image handle
+		# is not released while the array (or a numpy view of it) is alive
+		if not self.is_valid():
+			return None
+
+		buffer_view = (ctypes.c_uint8 * self.get_size()).from_address(ctypes.addressof(self.buffer_pointer.contents))
+		buffer_view._image = self
+
+		return buffer_view
+		
 	def get_size(self):
 		if not self.is_valid():
 			return None
@@ -89,7 +110,21 @@ class Image:
 	def get_stride_bytes(self):
 		return int(_k4a.k4a_image_get_stride_bytes(self._handle))
 
-	def to_numpy(self):
+	def get_device_timestamp_usec(self):
+		if not self.is_valid():
+			return None
+
+		return int(_k4a.k4a_image_get_device_timestamp_usec(self._handle))
+
+	def get_system_timestamp_nsec(self):
+		if not self.is_valid():
+			return None
+
+		return int(_k4a.k4a_image_get_system_timestamp_nsec(self._handle))
+
+	def to_numpy(self, copy=True):
+		# With copy=False, uncompressed formats are returned as read-only views of the image buffer.
+		# A view keeps this Image alive, it must not be used after an explicit reset().
 
 		if not self.is_valid():
 			return False, None
@@ -103,26 +138,34 @@ class Image:
 		image_format = self.get_format()
 
 		# Read the data in the buffer
-		buffer_array = np.ctypeslib.as_array(self.buffer_pointer,shape=(image_size,))
+		if copy:
+			buffer_array = np.ctypeslib.as_array(self.buffer_pointer,shape=(image_size,))
+		else:
+			buffer_array = np.frombuffer(self.get_buffer_view(), dtype=np.uint8)
+			buffer_array.flags.writeable = False
 
 		# Parse buffer based on image formats
 		if image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
-			return True, cv2.imdecode(np.frombuffer(buffer_array, dtype=np.uint8).copy(), -1)
+			return True, cv2.imdecode(np.frombuffer(buffer_array, dtype=np.uint8), -1)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_NV12:
-			yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(int(image_height*1.5),image_width)
+			yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).reshape(int(image_height*1.5),image_width)
 			return True, cv2.cvtColor(yuv_image, cv2.COLOR_YUV2BGR_NV12)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_YUY2:
-			yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(image_height,image_width,2)
+			yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).reshape(image_height,image_width,2)
 			return True, cv2.cvtColor(yuv_image, cv2.COLOR_YUV2BGR_YUY2)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32:
-			return True, np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(image_height,image_width,4)
+			image = np.frombuffer(buffer_array, dtype=np.uint8).reshape(image_height,image_width,4)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_DEPTH16:
-			return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(image_height,image_width)#little-endian 16 bits unsigned Depth data
+			image = np.frombuffer(buffer_array, dtype="<u2").reshape(image_height,image_width)#little-endian 16 bits unsigned Depth data
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_IR16:
-			return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(image_height,image_width)#little-endian 16 bits unsigned IR data. For more details see: https://microsoft.github.io/Azure-Kinect-Sensor-SDK/release/1.2.x/namespace_microsoft_1_1_azure_1_1_kinect_1_1_sensor_a7a3cb7a0a3073650bf17c2fef2bfbd1b.html
+			image = np.frombuffer(buffer_array, dtype="<u2").reshape(image_height,image_width)#little-endian 16 bits unsigned IR data. For more details see: https://microsoft.github.io/Azure-Kinect-Sensor-SDK/release/1.2.x/namespace_microsoft_1_1_azure_1_1_kinect_1_1_sensor_a7a3cb7a0a3073650bf17c2fef2bfbd1b.html
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM8:
-			return True, np.frombuffer(buffer_array, dtype="<u1").copy().reshape(image_height,image_width)
+			image = np.frombuffer(buffer_array, dtype="<u1").reshape(image_height,image_width)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM16:
-			return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(image_height,image_width)
+			image = np.frombuffer(buffer_array, dtype="<u2").reshape(image_height,image_width)
 		elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM:
-			return True, np.frombuffer(buffer_array, dtype="<i2").copy()
\ No newline at end of file
+			image = np.frombuffer(buffer_array, dtype="<i2")
+		else:
+			return False, None
+
+		return True, image.copy() if copy else image
@@ -0,0 +1,47 @@
+import ctypes
+
+import numpy as np
+
+from pykinect_azure.k4a._k4atypes import k4a_imu_sample_t
+
+# Flat numpy layout of k4a_imu_sample_t, acc and gyro as (x, y, z) arrays
+imu_sample_dtype = np.dtype({
+	"names": ["temperature", "acc", "acc_timestamp_usec", "gyro", "gyro_timestamp_usec"],
+	"formats": ["<f4", ("<f4", 3), "<u8", ("<f4", 3), "<u8"],
+	"offsets": [k4a_imu_sample_t.temperature.offset, k4a_imu_sample_t.acc_sample.offset,
+				k4a_imu_sample_t.acc_timestamp_usec.offset, k4a_imu_sample_t.gyro_sample.offset,
+				k4a_imu_sample_t.gyro_timestamp_usec.offset],
+	"itemsize": ctypes.sizeof(k4a_imu_sample_t)})
+
+class ImuRingBuffer:
+	# Ring buffer of the most recent IMU samples. The SDK writes samples directly into its slots,
+	# so reading samples involves no per-sample Python objects.
+
+	def __init__(self, size=256):
+
+		self.size = size
+		self.samples = np.zeros(size, dtype=imu_sample_dtype)
+		self._slots = [k4a_imu_sample_t.from_buffer(self.samples, i * imu_sample_dtype.itemsize) for i in range(size)]
+		self._index = 0
+		self.count = 0  # total number of samples written
+
+	def next_slot(self):
+		# ctypes struct the next sample is written to, commit() makes it part of the buffer
+		return self._slots[self._index]
+
+	def commit(self):
+		self._index = (self._index + 1) % self.size
+		self.count += 1
+
+	def latest(self, n=1):
+		# Copy of the n most recent samples, oldest first
+		n = min(n, self.count, self.size)
+		indices = np.arange(self._index - n, self._index) % self.size
+		return self.samples[indices]
+
+	@property
+	def last(self):
+		# Most recent sample, None if nothing was written
+		if self.count == 0:
+			return None
+		return self.samples[self._index - 1]
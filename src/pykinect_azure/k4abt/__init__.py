@@ -1,5 +1,6 @@
 from .body import Body
 from .body2d import Body2d
+from .skeleton_overlay import SkeletonOverlay
 from .frame import Frame
 from .joint import Joint
 from .joint2d import Joint2d
@@ -4,6 +4,7 @@ import cv2
 from pykinect_azure.k4abt import _k4abt
 from pykinect_azure.k4abt.body import Body
 from pykinect_azure.k4abt.body2d import Body2d
+from pykinect_azure.k4abt.skeleton_overlay import SkeletonOverlay, skeleton_to_numpy
 from pykinect_azure.k4abt._k4abtTypes import k4abt_body_t, body_colors
 from pykinect_azure.k4a import Image, Capture, Transformation
 from pykinect_azure.k4a._k4atypes import K4A_CALIBRATION_TYPE_DEPTH
@@ -84,13 +85,21 @@ class Frame:
 
 		return Body2d.create(body_handle, self.calibration, bodyIdx, dest_camera)
 
-	def draw_bodies(self, destination_image, dest_camera = K4A_CALIBRATION_TYPE_DEPTH, only_segments = False):
+	def draw_bodies(self, destination_image, dest_camera = K4A_CALIBRATION_TYPE_DEPTH, only_segments = False, scale = 1.0, mirror = False):
 		num_bodies = self.get_num_bodies()
 
-		for body_id in range(num_bodies):
-			destination_image = self.draw_body2d(destination_image, body_id, dest_camera, only_segments)
+		skeletons = [skeleton_to_numpy(self.get_body_skeleton(body_id)) for body_id in range(num_bodies)]
 
-		return destination_image
+		return self.get_skeleton_overlay(dest_camera).draw(destination_image, skeletons, range(num_bodies), only_segments, scale, mirror)
+
+	def get_skeleton_overlay(self, dest_camera = K4A_CALIBRATION_TYPE_DEPTH):
+		# Projection parameters are cached per destination camera, the calibration of a frame does not change
+		if not hasattr(self, "_overlays"):
+			self._overlays = {}
+		if dest_camera not in self._overlays:
+			self._overlays[dest_camera] = SkeletonOverlay(self.calibration, dest_camera)
+
+		return self._overlays[dest_camera]
 
 	def draw_body2d(self, destination_image, bodyIdx = 0, dest_camera = K4A_CALIBRATION_TYPE_DEPTH, only_segments = False):
 		return self.get_body2d(bodyIdx, dest_camera).draw(destination_image, only_segments)
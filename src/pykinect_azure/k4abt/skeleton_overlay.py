@@ -0,0 +1,76 @@
+import ctypes
+
+import numpy as np
+import cv2
+
+from pykinect_azure.k4abt._k4abtTypes import K4ABT_JOINT_COUNT, K4ABT_SEGMENT_PAIRS, K4ABT_JOINT_CONFIDENCE_NONE
+from pykinect_azure.k4abt._k4abtTypes import k4abt_skeleton_t, body_colors
+from pykinect_azure.k4a._k4atypes import K4A_CALIBRATION_TYPE_DEPTH
+
+# Memory layout of k4abt_joint_t: position (x, y, z), orientation (w, x, y, z), confidence level
+joint_dtype = np.dtype([("position", "<f4", 3), ("orientation", "<f4", 4), ("confidence_level", "<i4")])
+assert joint_dtype.itemsize * K4ABT_JOINT_COUNT == ctypes.sizeof(k4abt_skeleton_t)
+
+segment_pairs = np.array(K4ABT_SEGMENT_PAIRS, dtype=np.intp)
+
+def skeleton_to_numpy(skeleton):
+	# View the joints of a k4abt_skeleton_t as structured numpy array, without converting each joint
+	return np.frombuffer(skeleton, dtype=joint_dtype, count=K4ABT_JOINT_COUNT)
+
+class SkeletonOverlay:
+	"""
+	Draws the skeletons of all bodies of a frame at once. All joints are projected in one cv2.projectPoints call
+	using the cached intrinsics, distortion and extrinsics of the calibration, and drawn with batched cv2.polylines.
+	"""
+	def __init__(self, calibration, dest_camera = K4A_CALIBRATION_TYPE_DEPTH):
+
+		self.dest_camera = dest_camera
+		self.rotation, self.translation = calibration.get_extrinsics(K4A_CALIBRATION_TYPE_DEPTH, dest_camera)
+		self.camera_matrix = np.array(calibration.get_matrix(dest_camera), dtype=np.float64)
+		self.distortion = calibration.get_distortion(dest_camera)
+		self._zero = np.zeros(3, dtype=np.float64)
+
+	def project(self, positions):
+		# Project joint positions (N x 3, millimeters, depth camera) to pixels of the destination camera.
+		# Points behind the camera are returned as NaN.
+		points = positions.astype(np.float64) @ self.rotation.T + self.translation
+
+		pixels, _ = cv2.projectPoints(points, self._zero, self._zero, self.camera_matrix, self.distortion)
+		pixels = pixels.reshape(-1, 2)
+		pixels[points[:, 2] <= 0] = np.nan
+
+		return pixels
+
+	def draw(self, destination_image, skeletons, body_ids, only_segments = False, scale = 1.0, mirror = False):
+		# Draw skeletons given as arrays of joint_dtype, colored by body id.
+		# Pixel coordinates are multiplied by scale and mirrored horizontally if the image is scaled or mirrored.
+
+		if not skeletons:
+			return destination_image
+
+		joints = np.concatenate(skeletons)
+		pixels = self.project(joints["position"]).reshape(len(skeletons), K4ABT_JOINT_COUNT, 2)
+		if scale != 1.0:
+			pixels *= scale
+		if mirror:
+			pixels[..., 0] = destination_image.shape[1] - 1 - pixels[..., 0]
+		valid = ~np.isnan(pixels[..., 0]) & (joints["confidence_level"].reshape(len(skeletons), -1) != K4ABT_JOINT_CONFIDENCE_NONE)
+		pixels = np.nan_to_num(pixels).round().astype(np.int32)
+
+		for body_pixels, body_valid, body_id in zip(pixels, valid, body_ids):
+			color = tuple(int(c) for c in body_colors[body_id])
+
+			# one polyline of two points per segment with both joints valid
+			segments = segment_pairs[body_valid[segment_pairs].all(axis=1)]
+			if len(segments):
+				cv2.polylines(destination_image, body_pixels[segments], False, color, 2)
+
+			if only_segments:
+				continue
+
+			# joints as zero-length polylines, which are drawn as dots of the line thickness
+			points = body_pixels[body_valid][:, np.newaxis, :]
+			if len(points):
+				cv2.polylines(destination_image, points, False, color, 6)
+
+		return destination_image
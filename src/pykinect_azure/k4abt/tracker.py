@@ -68,6 +68,9 @@ class Tracker:
 		if model_type == _k4abt.K4ABT_LITE_MODEL:
 			self.tracker_configuration.model_path = get_k4abt_lite_model_path()
 
+		# Set the model path on the configuration struct as well, a shared configuration may still hold another model
+		self.tracker_configuration.handle().model_path = get_k4abt_lite_model_path() if model_type == _k4abt.K4ABT_LITE_MODEL else None
+
 		tracker_handle = _k4abt.k4abt_tracker_t()
 		_k4abt.VERIFY(_k4abt.k4abt_tracker_create(self.calibration.handle(),
 												  self.tracker_configuration.handle(),
@@ -28,6 +28,15 @@ def initialize_libraries(module_k4a_path=None, module_k4abt_path=None, track_bod
         # Initialize k4abt related wrappers
         init_k4abt(module_k4abt_path)
 
+def initialize_simulated_libraries(simulated_sdk, track_body=False):
+    # Use a pure Python simulation (e.g. simulator.SimulatedSdk) instead of the SDK libraries, no camera required.
+    # Recording and playback are not simulated.
+
+    _k4a._functions.bind_python(simulated_sdk)
+
+    if track_body:
+        _k4abt._functions.bind_python(simulated_sdk)
+
 def init_k4a(module_k4a_path):
 
     _k4a.setup_library(module_k4a_path)
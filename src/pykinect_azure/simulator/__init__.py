@@ -0,0 +1,3 @@
+from .sdk import SimulatedSdk
+from .skeletons import SkeletonSource, StandingBodySource, RecordedSkeletonSource, SkeletonRecorder, REST_POSE, \
+	joints_from_positions
@@ -0,0 +1,484 @@
+import ctypes
+import itertools
+import math
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from pykinect_azure.k4a._k4atypes import *
+from pykinect_azure.k4abt._k4abtTypes import K4ABT_JOINT_COUNT
+from pykinect_azure.k4abt.skeleton_overlay import joint_dtype
+from pykinect_azure.simulator.skeletons import StandingBodySource
+
+def _address(handle):
+	# Integer value of a handle, which is an opaque pointer
+	if handle is None or isinstance(handle, int):
+		return handle or 0
+	return ctypes.cast(handle, ctypes.c_void_p).value or 0
+
+def _write_handle(handle_out, address):
+	# Stores a handle in an output parameter, like the SDK writing to a k4a_*_t pointer
+	ctypes.cast(ctypes.byref(handle_out), ctypes.POINTER(ctypes.c_void_p))[0] = address
+
+class _Image:
+	def __init__(self, image_format, width, height, stride, buffer, device_usec=0, system_nsec=0):
+		self.format = image_format
+		self.width = width
+		self.height = height
+		self.stride = stride
+		self.buffer = buffer  # flat uint8 array
+		self.pointer = buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8))
+		self.device_usec = device_usec
+		self.system_nsec = system_nsec
+
+class _Capture:
+	def __init__(self, images, device_usec):
+		self.images = images  # "color"/"depth" -> image handle, released with the capture
+		self.device_usec = device_usec
+
+class _BodyFrame:
+	def __init__(self, bodies, device_usec, capture):
+		self.bodies = bodies
+		self.device_usec = device_usec
+		self.capture = capture  # capture handle, released with the frame
+
+class _Tracker:
+	def __init__(self, queue_size):
+		self.queue = deque(maxlen=queue_size)  # capture handles
+
+class SimulatedSdk:
+	# Pure Python stand-in for the Azure Kinect Sensor and Body Tracking SDKs, plugged into the wrappers' function
+	# tables by pykinect.initialize_simulated_libraries(). Implements the entry points of devices, captures, images,
+	# IMU and body tracker: captures are delivered at the configured frame rate with synthetic color and depth images,
+	# the body tracker reports the bodies of a SkeletonSource at the device timestamp of each capture.
+	# Handles are opaque integers, objects are released when their reference count drops to zero.
+
+	def __init__(self, skeleton_source=None, color_image=None, fps=None, realtime=True, copy_images=True,
+				 tracker_delay=0.01, imu_rate=1600, gravity=(0.0, 0.0, -9.81), queue_size=2):
+		# skeleton_source: SkeletonSource of the bodies, a person standing 2 m in front of the camera if None
+		# color_image: BGR image shown by the color camera, resized to the color resolution. Synthetic if None
+		# fps: Frame rate overriding the one of the device configuration
+		# realtime: Pace captures and IMU samples in real time. Otherwise captures are delivered immediately,
+		#           timestamps still advance by one frame period per capture.
+		# copy_images: Copy the color image into a new buffer for every capture, like the SDK does
+		# tracker_delay: Seconds the body tracker takes per frame, spent sleeping
+		# imu_rate: IMU samples per second
+		# gravity: Accelerometer reading of the device at rest in m/s^2
+		# queue_size: Captures the device keeps for the application before dropping the oldest
+		self.skeleton_source = skeleton_source if skeleton_source is not None else StandingBodySource()
+		self.color_image = color_image
+		self.fps = fps
+		self.realtime = realtime
+		self.copy_images = copy_images
+		self.tracker_delay = tracker_delay
+		self.imu_rate = imu_rate
+		self.gravity = np.asarray(gravity, dtype=np.float32)
+		self.queue_size = queue_size
+
+		self._objects = {}  # handle -> [object, reference count]
+		self._handles = itertools.count(0x1000, 0x10)
+		self._lock = threading.Lock()
+
+		self._configuration = None
+		self._color_buffer = None  # rendered color image in the configured format
+		self._depth_buffer = None
+		self._start = 0.0  # perf_counter() time of the first frame
+		self._simulated_time = 0.0  # seconds since start, when not running in real time
+		self._next_frame = 0
+		self._next_imu_sample = 0
+		self._rng = np.random.default_rng(0)
+
+		# statistics
+		self.captures = 0
+		self.dropped_captures = 0
+		self.imu_samples = 0
+		self.body_frames = 0
+
+	# ----- handles
+
+	def _create(self, obj):
+		with self._lock:
+			handle = next(self._handles)
+			self._objects[handle] = [obj, 1]
+		return handle
+
+	def _get(self, handle):
+		entry = self._objects.get(_address(handle))
+		return entry[0] if entry is not None else None
+
+	def _reference(self, handle):
+		with self._lock:
+			self._objects[_address(handle)][1] += 1
+
+	def _release(self, handle):
+		with self._lock:
+			address = _address(handle)
+			entry = self._objects.get(address)
+			if entry is None:
+				return
+			entry[1] -= 1
+			if entry[1] > 0:
+				return
+			del self._objects[address]
+
+		# release what the object refers to
+		obj = entry[0]
+		if isinstance(obj, _Capture):
+			for image_handle in obj.images.values():
+				self._release(image_handle)
+		elif isinstance(obj, _BodyFrame):
+			self._release(obj.capture)
+		elif isinstance(obj, _Tracker):
+			for capture_handle in obj.queue:
+				self._release(capture_handle)
+
+	@property
+	def open_handles(self):
+		return len(self._objects)
+
+	# ----- clock
+
+	def _now(self):
+		# Seconds since the start of the cameras
+		if self.realtime:
+			return time.perf_counter() - self._start
+		return self._simulated_time
+
+	def _wait_until(self, due, timeout_in_ms):
+		# Waits until due seconds after the start, at most timeout_in_ms. Returns True if due was reached.
+		delay = due - self._now()
+		if delay <= 0:
+			return True
+		if not self.realtime:
+			return False
+		if 0 <= timeout_in_ms < delay * 1000:
+			time.sleep(timeout_in_ms / 1000)
+			return False
+		time.sleep(delay)
+		return True
+
+	def _frame_period(self):
+		if self.fps is not None:
+			return 1 / self.fps
+		return 1 / FRAMES_PER_SECOND[self._configuration.camera_fps]
+
+	# ----- device
+
+	def k4a_device_get_installed_count(self):
+		return 1
+
+	def k4a_device_open(self, index, device_handle):
+		if index != 0:
+			return K4A_RESULT_FAILED
+		_write_handle(device_handle, self._create("device"))
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_device_close(self, device_handle):
+		self._release(device_handle)
+
+	def k4a_device_get_serialnum(self, device_handle, serial_number, serial_number_size):
+		serial = b"000000000000"
+		if serial_number is None or serial_number_size.value < len(serial) + 1:
+			serial_number_size.value = len(serial) + 1
+			return K4A_BUFFER_RESULT_TOO_SMALL
+		ctypes.memmove(serial_number, serial + b"\0", len(serial) + 1)
+		return K4A_BUFFER_RESULT_SUCCEEDED
+
+	def k4a_device_get_version(self, device_handle, version):
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_device_get_calibration(self, device_handle, depth_mode, color_resolution, calibration):
+		if color_resolution not in COLOR_RESOLUTIONS or depth_mode not in DEPTH_RESOLUTIONS:
+			return K4A_RESULT_FAILED
+
+		# Pinhole cameras with the fields of view of the Azure Kinect, color camera tilted 6 degrees down
+		color_width, color_height = COLOR_RESOLUTIONS[color_resolution]
+		self._set_camera(calibration.color_camera_calibration, color_width, color_height, horizontal_fov=90)
+		depth_width, depth_height = DEPTH_RESOLUTIONS[depth_mode]
+		wide = depth_mode in (K4A_DEPTH_MODE_WFOV_2X2BINNED, K4A_DEPTH_MODE_WFOV_UNBINNED, K4A_DEPTH_MODE_PASSIVE_IR)
+		self._set_camera(calibration.depth_camera_calibration, depth_width, depth_height,
+						 horizontal_fov=120 if wide else 75)
+
+		tilt = math.radians(-6)
+		depth_to_color = np.array([[1, 0, 0],
+								   [0, math.cos(tilt), -math.sin(tilt)],
+								   [0, math.sin(tilt), math.cos(tilt)]])
+		translation = np.array([-32.0, -2.0, 4.0])
+		for source in range(K4A_CALIBRATION_TYPE_NUM):
+			for target in range(K4A_CALIBRATION_TYPE_NUM):
+				rotation, offset = np.eye(3), np.zeros(3)
+				if source == K4A_CALIBRATION_TYPE_DEPTH and target == K4A_CALIBRATION_TYPE_COLOR:
+					rotation, offset = depth_to_color, translation
+				elif source == K4A_CALIBRATION_TYPE_COLOR and target == K4A_CALIBRATION_TYPE_DEPTH:
+					rotation, offset = depth_to_color.T, -depth_to_color.T @ translation
+				extrinsics = calibration.extrinsics[source][target]
+				extrinsics.rotation[:] = rotation.ravel().tolist()
+				extrinsics.translation[:] = offset.tolist()
+
+		calibration.depth_mode = depth_mode
+		calibration.color_resolution = color_resolution
+		return K4A_RESULT_SUCCEEDED
+
+	@staticmethod
+	def _set_camera(camera, width, height, horizontal_fov):
+		focal_length = width / 2 / math.tan(math.radians(horizontal_fov) / 2)
+		camera.resolution_width = width
+		camera.resolution_height = height
+		camera.metric_radius = 1.7
+		camera.intrinsics.type = K4A_CALIBRATION_LENS_DISTORTION_MODEL_BROWN_CONRADY
+		camera.intrinsics.parameter_count = 14
+		params = camera.intrinsics.parameters.param
+		params.cx, params.cy = width / 2, height / 2
+		params.fx = params.fy = focal_length
+
+	def k4a_device_start_cameras(self, device_handle, configuration):
+		if configuration.color_resolution not in COLOR_RESOLUTIONS:
+			return K4A_RESULT_FAILED
+		self._configuration = configuration
+		self._color_buffer = self._render_color_image(configuration.color_format,
+													  *COLOR_RESOLUTIONS[configuration.color_resolution])
+		depth_width, depth_height = DEPTH_RESOLUTIONS.get(configuration.depth_mode, (0, 0))
+		self._depth_buffer = np.zeros(depth_width * depth_height * 2, dtype=np.uint8)
+		self._start = time.perf_counter()
+		self._simulated_time = 0.0
+		self._next_frame = 0
+		self._next_imu_sample = 0
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_device_stop_cameras(self, device_handle):
+		self._configuration = None
+
+	def k4a_device_start_imu(self, device_handle):
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_device_stop_imu(self, device_handle):
+		pass
+
+	def _render_color_image(self, color_format, width, height):
+		if self.color_image is not None:
+			image = cv2.resize(self.color_image, (width, height))
+		else:
+			# gradient with a grid, so scaling and mirroring are visible
+			x = np.linspace(40, 200, width, dtype=np.float32)
+			y = np.linspace(60, 160, height, dtype=np.float32)[:, None]
+			image = np.dstack(np.broadcast_arrays(x, (x + y) / 2, y)).astype(np.uint8)
+			image[::height // 9] = 255
+			image[:, ::width // 16] = 255
+
+		if color_format == K4A_IMAGE_FORMAT_COLOR_BGRA32:
+			return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA).ravel()
+		if color_format == K4A_IMAGE_FORMAT_COLOR_MJPG:
+			return cv2.imencode(".jpg", image)[1].ravel()
+		raise ValueError(f"Color format {color_format} is not simulated")
+
+	def k4a_device_get_capture(self, device_handle, capture_handle, timeout_in_ms):
+		if self._configuration is None:
+			return K4A_WAIT_RESULT_FAILED
+
+		period = self._frame_period()
+		if self.realtime:
+			# The device keeps queue_size captures, older ones are dropped while the application falls behind
+			latest_frame = math.floor(self._now() / period)
+			oldest_frame = latest_frame - self.queue_size + 1
+			if self._next_frame < oldest_frame:
+				self.dropped_captures += oldest_frame - self._next_frame
+				self._next_frame = oldest_frame
+		else:
+			self._simulated_time = self._next_frame * period
+
+		arrival = self._next_frame * period
+		if not self._wait_until(arrival, timeout_in_ms):
+			return K4A_WAIT_RESULT_TIMEOUT
+
+		device_usec = round(arrival * 1e6)
+		system_nsec = round((self._start + arrival) * 1e9) if self.realtime else time.perf_counter_ns()
+		self._next_frame += 1
+		self.captures += 1
+
+		configuration = self._configuration
+		color_buffer = self._color_buffer.copy() if self.copy_images else self._color_buffer
+		color_width, color_height = COLOR_RESOLUTIONS[configuration.color_resolution]
+		stride = color_width * 4 if configuration.color_format == K4A_IMAGE_FORMAT_COLOR_BGRA32 else 0
+		images = {"color": self._create(_Image(configuration.color_format, color_width,
+																	 color_height, stride, color_buffer,
+																	 device_usec, system_nsec))}
+		if configuration.depth_mode in DEPTH_RESOLUTIONS:
+			depth_width, depth_height = DEPTH_RESOLUTIONS[configuration.depth_mode]
+			images["depth"] = self._create(_Image(K4A_IMAGE_FORMAT_DEPTH16, depth_width, depth_height,
+																   depth_width * 2, self._depth_buffer,
+																   device_usec, system_nsec))
+
+		_write_handle(capture_handle, self._create(_Capture(images, device_usec)))
+		return K4A_WAIT_RESULT_SUCCEEDED
+
+	def k4a_device_get_imu_sample(self, device_handle, imu_sample, timeout_in_ms):
+		if self._configuration is None:
+			return K4A_WAIT_RESULT_FAILED
+
+		if self.realtime:
+			# keep at most one second of samples, like the SDK's queue
+			oldest_sample = math.floor(self._now() * self.imu_rate) - self.imu_rate + 1
+			self._next_imu_sample = max(self._next_imu_sample, oldest_sample)
+
+		due = self._next_imu_sample / self.imu_rate
+		if not self._wait_until(due, timeout_in_ms):
+			return K4A_WAIT_RESULT_TIMEOUT
+
+		sample_usec = round(due * 1e6)
+		self._next_imu_sample += 1
+		self.imu_samples += 1
+
+		noise = self._rng.normal(0, 0.02, 6)
+		imu_sample.temperature = 30.0
+		imu_sample.acc_sample.v[:] = (self.gravity + noise[:3]).tolist()
+		imu_sample.acc_timestamp_usec = sample_usec
+		imu_sample.gyro_sample.v[:] = noise[3:].tolist()
+		imu_sample.gyro_timestamp_usec = sample_usec
+		return K4A_WAIT_RESULT_SUCCEEDED
+
+	# ----- captures
+
+	def k4a_capture_create(self, capture_handle):
+		_write_handle(capture_handle, self._create(_Capture({}, 0)))
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_capture_release(self, capture_handle):
+		self._release(capture_handle)
+
+	def k4a_capture_reference(self, capture_handle):
+		self._reference(capture_handle)
+
+	def _capture_image(self, capture_handle, image_name):
+		capture = self._get(capture_handle)
+		image_handle = capture.images.get(image_name) if capture is not None else None
+		if image_handle is None:
+			return k4a_image_t()
+		self._reference(image_handle)
+		return ctypes.cast(ctypes.c_void_p(image_handle), k4a_image_t)
+
+	def k4a_capture_get_color_image(self, capture_handle):
+		return self._capture_image(capture_handle, "color")
+
+	def k4a_capture_get_depth_image(self, capture_handle):
+		return self._capture_image(capture_handle, "depth")
+
+	def k4a_capture_get_ir_image(self, capture_handle):
+		return k4a_image_t()
+
+	# ----- images
+
+	def k4a_image_create(self, image_format, width, height, stride, image_handle):
+		size = stride * height if stride else width * height * 4
+		_write_handle(image_handle, self._create(_Image(image_format, width, height, stride,
+														np.zeros(size, dtype=np.uint8))))
+		return K4A_RESULT_SUCCEEDED
+
+	def k4a_image_release(self, image_handle):
+		self._release(image_handle)
+
+	def k4a_image_reference(self, image_handle):
+		self._reference(image_handle)
+
+	def k4a_image_get_buffer(self, image_handle):
+		return self._get(image_handle).pointer
+
+	def k4a_image_get_size(self, image_handle):
+		return self._get(image_handle).buffer.size
+
+	def k4a_image_get_format(self, image_handle):
+		return self._get(image_handle).format
+
+	def k4a_image_get_width_pixels(self, image_handle):
+		return self._get(image_handle).width
+
+	def k4a_image_get_height_pixels(self, image_handle):
+		return self._get(image_handle).height
+
+	def k4a_image_get_stride_bytes(self, image_handle):
+		return self._get(image_handle).stride
+
+	def k4a_image_get_device_timestamp_usec(self, image_handle):
+		return self._get(image_handle).device_usec
+
+	def k4a_image_get_system_timestamp_nsec(self, image_handle):
+		return self._get(image_handle).system_nsec
+
+	# ----- transformation, only created and destroyed by the wrappers' constructors
+
+	def k4a_transformation_create(self, calibration):
+		return ctypes.cast(ctypes.c_void_p(self._create("transformation")), k4a_transformation_t)
+
+	def k4a_transformation_destroy(self, transformation_handle):
+		self._release(transformation_handle)
+
+	# ----- body tracker
+
+	def k4abt_tracker_create(self, calibration, configuration, tracker_handle):
+		_write_handle(tracker_handle, self._create(_Tracker(self.queue_size)))
+		return K4A_RESULT_SUCCEEDED
+
+	def k4abt_tracker_destroy(self, tracker_handle):
+		self._release(tracker_handle)
+
+	def k4abt_tracker_shutdown(self, tracker_handle):
+		tracker = self._get(tracker_handle)
+		while tracker.queue:
+			self._release(tracker.queue.popleft())
+
+	def k4abt_tracker_set_temporal_smoothing(self, tracker_handle, smoothing_factor):
+		pass
+
+	def k4abt_tracker_enqueue_capture(self, tracker_handle, capture_handle, timeout_in_ms):
+		tracker = self._get(tracker_handle)
+		if len(tracker.queue) == tracker.queue.maxlen:
+			return K4A_WAIT_RESULT_TIMEOUT
+		self._reference(capture_handle)
+		tracker.queue.append(_address(capture_handle))
+		return K4A_WAIT_RESULT_SUCCEEDED
+
+	def k4abt_tracker_pop_result(self, tracker_handle, body_frame_handle, timeout_in_ms):
+		tracker = self._get(tracker_handle)
+		if not tracker.queue:
+			return K4A_WAIT_RESULT_TIMEOUT if timeout_in_ms >= 0 else K4A_WAIT_RESULT_FAILED
+		if self.realtime and self.tracker_delay > 0:
+			time.sleep(self.tracker_delay)
+
+		capture_handle = tracker.queue.popleft()  # the frame takes over the queue's reference
+		device_usec = self._get(capture_handle).device_usec
+		bodies = self.skeleton_source.get_bodies(device_usec / 1e6)
+		self.body_frames += 1
+
+		_write_handle(body_frame_handle, self._create(_BodyFrame(bodies, device_usec, capture_handle)))
+		return K4A_WAIT_RESULT_SUCCEEDED
+
+	def k4abt_frame_release(self, body_frame_handle):
+		self._release(body_frame_handle)
+
+	def k4abt_frame_reference(self, body_frame_handle):
+		self._reference(body_frame_handle)
+
+	def k4abt_frame_get_num_bodies(self, body_frame_handle):
+		return len(self._get(body_frame_handle).bodies)
+
+	def k4abt_frame_get_body_skeleton(self, body_frame_handle, index, skeleton):
+		bodies = self._get(body_frame_handle).bodies
+		if index >= len(bodies):
+			return K4A_RESULT_FAILED
+		joints = np.ascontiguousarray(bodies[index][1], dtype=joint_dtype)
+		ctypes.memmove(ctypes.addressof(skeleton), joints.ctypes.data, joint_dtype.itemsize * K4ABT_JOINT_COUNT)
+		return K4A_RESULT_SUCCEEDED
+
+	def k4abt_frame_get_body_id(self, body_frame_handle, index):
+		bodies = self._get(body_frame_handle).bodies
+		return bodies[index][0] if index < len(bodies) else 0xFFFFFFFF
+
+	def k4abt_frame_get_device_timestamp_usec(self, body_frame_handle):
+		return self._get(body_frame_handle).device_usec
+
+	def k4abt_frame_get_capture(self, body_frame_handle):
+		capture_handle = self._get(body_frame_handle).capture
+		self._reference(capture_handle)
+		return ctypes.cast(ctypes.c_void_p(capture_handle), k4a_capture_t)
@@ -0,0 +1,129 @@
+import numpy as np
+
+from pykinect_azure.k4abt._k4abtTypes import *
+from pykinect_azure.k4abt.skeleton_overlay import joint_dtype, skeleton_to_numpy
+
+# Joint positions of a person standing upright with hanging arms, facing the camera, relative to the pelvis.
+# Millimeters in depth camera coordinates: x to the right of the camera image, y down, z away from the camera.
+# The person's left side is on the right of the camera image.
+REST_POSE = np.zeros((K4ABT_JOINT_COUNT, 3))
+for _joint, _position in {
+		K4ABT_JOINT_PELVIS: (0, 0, 0),
+		K4ABT_JOINT_SPINE_NAVEL: (0, -100, 10),
+		K4ABT_JOINT_SPINE_CHEST: (0, -260, 10),
+		K4ABT_JOINT_NECK: (0, -450, 0),
+		K4ABT_JOINT_CLAVICLE_LEFT: (40, -420, 0),
+		K4ABT_JOINT_SHOULDER_LEFT: (180, -410, 10),
+		K4ABT_JOINT_ELBOW_LEFT: (200, -130, 20),
+		K4ABT_JOINT_WRIST_LEFT: (210, 120, 0),
+		K4ABT_JOINT_HAND_LEFT: (210, 190, -10),
+		K4ABT_JOINT_HANDTIP_LEFT: (210, 260, -10),
+		K4ABT_JOINT_THUMB_LEFT: (180, 190, -40),
+		K4ABT_JOINT_CLAVICLE_RIGHT: (-40, -420, 0),
+		K4ABT_JOINT_SHOULDER_RIGHT: (-180, -410, 10),
+		K4ABT_JOINT_ELBOW_RIGHT: (-200, -130, 20),
+		K4ABT_JOINT_WRIST_RIGHT: (-210, 120, 0),
+		K4ABT_JOINT_HAND_RIGHT: (-210, 190, -10),
+		K4ABT_JOINT_HANDTIP_RIGHT: (-210, 260, -10),
+		K4ABT_JOINT_THUMB_RIGHT: (-180, 190, -40),
+		K4ABT_JOINT_HIP_LEFT: (90, 0, 0),
+		K4ABT_JOINT_KNEE_LEFT: (100, 430, 0),
+		K4ABT_JOINT_ANKLE_LEFT: (100, 830, 20),
+		K4ABT_JOINT_FOOT_LEFT: (100, 880, -100),
+		K4ABT_JOINT_HIP_RIGHT: (-90, 0, 0),
+		K4ABT_JOINT_KNEE_RIGHT: (-100, 430, 0),
+		K4ABT_JOINT_ANKLE_RIGHT: (-100, 830, 20),
+		K4ABT_JOINT_FOOT_RIGHT: (-100, 880, -100),
+		K4ABT_JOINT_HEAD: (0, -560, 0),
+		K4ABT_JOINT_NOSE: (0, -540, -90),
+		K4ABT_JOINT_EYE_LEFT: (30, -580, -70),
+		K4ABT_JOINT_EAR_LEFT: (70, -560, 0),
+		K4ABT_JOINT_EYE_RIGHT: (-30, -580, -70),
+		K4ABT_JOINT_EAR_RIGHT: (-70, -560, 0)}.items():
+	REST_POSE[_joint] = _position
+
+def joints_from_positions(positions, confidence_level=K4ABT_JOINT_CONFIDENCE_MEDIUM):
+	# Skeleton as joint_dtype array from joint positions (32 x 3, millimeters), with identity orientations
+	joints = np.zeros(K4ABT_JOINT_COUNT, dtype=joint_dtype)
+	joints["position"] = positions
+	joints["orientation"] = (1, 0, 0, 0)
+	joints["confidence_level"] = confidence_level
+	return joints
+
+class SkeletonSource:
+	# Provides the bodies the simulated body tracker detects
+
+	def get_bodies(self, time):
+		# List of (body id, joint_dtype array of the 32 joints) at time seconds of device time
+		raise NotImplementedError
+
+class StandingBodySource(SkeletonSource):
+	# One person standing in front of the camera, swaying slightly from side to side
+
+	def __init__(self, position=(0.0, 0.0, 2000.0), body_id=1, sway=10.0, sway_period=4.0):
+		# position: Position of the pelvis in millimeters, depth camera coordinates
+		# sway: Amplitude of the sideways sway in millimeters
+		self.position = np.asarray(position, dtype=np.float64)
+		self.body_id = body_id
+		self.sway = sway
+		self.sway_period = sway_period
+
+	def pose(self, time):
+		# Joint positions (32 x 3, millimeters) at time seconds. Override to animate the body.
+		positions = REST_POSE + self.position
+		positions[:, 0] += self.sway * np.sin(2 * np.pi * time / self.sway_period)
+		return positions
+
+	def get_bodies(self, time):
+		return [(self.body_id, joints_from_positions(self.pose(time)))]
+
+class RecordedSkeletonSource(SkeletonSource):
+	# Replays skeletons saved by SkeletonRecorder
+
+	def __init__(self, path, loop=True):
+		recording = np.load(path)
+		self.times = recording["times"]  # seconds since the start of the recording, per frame
+		self.body_ids = recording["body_ids"]  # per frame and body slot, 0 for empty slots
+		self.joints = recording["joints"]  # joint_dtype, per frame and body slot
+		self.loop = loop
+		self.duration = float(self.times[-1]) if len(self.times) else 0.0
+
+	def get_bodies(self, time):
+		if not len(self.times) or (not self.loop and time > self.duration):
+			return []
+		if self.loop and self.duration > 0:
+			time = time % self.duration
+
+		frame = max(int(np.searchsorted(self.times, time, side="right")) - 1, 0)
+		return [(int(body_id), self.joints[frame, slot])
+				for slot, body_id in enumerate(self.body_ids[frame]) if body_id]
+
+class SkeletonRecorder:
+	# Collects the bodies of body tracker frames, e.g. of a session with a real camera, for RecordedSkeletonSource
+
+	def __init__(self):
+		self._frames = []  # (device time in seconds, [(body id, joints)])
+
+	def add_frame(self, frame):
+		bodies = [(int(frame.get_body_id(index)), skeleton_to_numpy(frame.get_body_skeleton(index)).copy())
+				  for index in range(frame.get_num_bodies())]
+		self.add(frame.get_device_timestamp_usec() / 1e6, bodies)
+
+	def add(self, time, bodies):
+		self._frames.append((time, bodies))
+
+	def save(self, path):
+		frame_count = len(self._frames)
+		slots = max((len(bodies) for _, bodies in self._frames), default=0)
+		start = self._frames[0][0] if self._frames else 0.0
+
+		times = np.zeros(frame_count)
+		body_ids = np.zeros((frame_count, slots), dtype=np.uint32)
+		joints = np.zeros((frame_count, slots, K4ABT_JOINT_COUNT), dtype=joint_dtype)
+		for frame_index, (time, bodies) in enumerate(self._frames):
+			times[frame_index] = time - start
+			for slot, (body_id, body_joints) in enumerate(bodies):
+				body_ids[frame_index, slot] = body_id
+				joints[frame_index, slot] = body_joints
+
+		np.savez_compressed(path, times=times, body_ids=body_ids, joints=joints)
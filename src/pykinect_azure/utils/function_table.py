@@ -0,0 +1,41 @@
+import ctypes
+
+
+class FunctionTable:
+	# Foreign functions of a shared library, with their prototypes set once when the library is loaded.
+	# Wrappers register the prototype of the function they call with the prototype() decorator and call it
+	# through the table, so calls do not pay for looking up the symbol and assigning restype/argtypes.
+
+	def __init__(self):
+		self._prototypes = {}
+
+	def prototype(self, restype=ctypes.c_int, argtypes=None, name=None):
+		# Decorator registering the prototype of the library function the decorated wrapper is named after,
+		# or of the function called name
+		def register(wrapper):
+			self._prototypes[name or wrapper.__name__] = (restype, argtypes)
+			return wrapper
+		return register
+
+	def bind(self, dll):
+		# Looks up all registered functions in the loaded library. Functions the library does not export
+		# stay unbound, calling their wrapper raises an AttributeError like calling the library would.
+		for name, (restype, argtypes) in self._prototypes.items():
+			try:
+				function = getattr(dll, name)
+			except AttributeError:
+				continue
+			function.restype = restype
+			if argtypes is not None:
+				function.argtypes = argtypes
+			setattr(self, name, function)
+
+	def bind_python(self, implementation):
+		# Binds the methods of a Python object instead of a library, e.g. a simulated SDK. The methods receive
+		# the arguments as passed to the wrappers and must return values of the registered restype.
+		for name in self._prototypes:
+			function = getattr(implementation, name, None)
+			if function is not None:
+				setattr(self, name, function)
+			elif name in self.__dict__:
+				delattr(self, name)
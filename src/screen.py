@@ -38,6 +38,14 @@ class Screen:
         self.px_width = px_width
         self.px_height = px_height
 
+    @property
+    def upper_left_corner(self) -> Point3D:
+        return self.__upper_left_corner
+
+    @property
+    def lower_right_corner(self) -> Point3D:
+        return self.__lower_right_corner
+
     def calc_screen_plain(self) -> Plane3D:
         p = Plane3D.from_vectors(self.__upper_left_corner.get_pointvector(),
                                  Vector3D.from_points(self.__upper_left_corner, self.__lower_right_corner),
@@ -189,3 +197,12 @@ SCREENS_IVE_2: tuple[Screen, Screen] = (
            2048, 1080)
 )
 
+
+# Screen setups by name, e.g. to select them in config files
+SCREEN_ENVIRONMENTS: dict[str, tuple[Screen, ...]] = {
+    "SCREEN_SINGLE_ABOVE_1200p": SCREEN_SINGLE_ABOVE_1200p,
+    "SCREEN_SINGLE_ABOVE_FHD": SCREEN_SINGLE_ABOVE_FHD,
+    "SCREEN_SINGLE_ABOVE_UHD": SCREEN_SINGLE_ABOVE_UHD,
+    "SCREENS_IVE": SCREENS_IVE,
+    "SCREENS_IVE_2": SCREENS_IVE_2,
+}
@@ -0,0 +1,253 @@
+"""
+Headless entry point for kiosks: runs the camera loop, the websocket server and touch output without the wx window,
+configured by a config file. Status is served by a MetricsServer instead of the data grid. Stops on SIGINT, SIGTERM
+(and SIGBREAK on Windows), exits with code 1 if the camera fails, so that a supervisor restarts it. SIGUSR1 (not on
+Windows) or POST /profile on the metrics server records a profile of the camera threads.
+"""
+import argparse
+import configparser
+import signal
+import sys
+import threading
+from time import monotonic
+from typing import Union
+
+from screen import SCREEN_ENVIRONMENTS
+from constants import InteractionMechanism, PointingMechanism
+from interaction_controller import InteractionController
+from metrics_server import MetricsServer
+from utils import event_log
+
+# Settings used for options missing in the config file
+DEFAULT_CONFIG = {
+    "camera": {
+        "k4a_path": "",  # empty to use the default install location
+        "k4abt_path": "",
+        "gpu_id": "0",
+        "simulate": "false",
+        "recording": "",  # skeleton recording (.npz) replayed by the simulation, empty for a standing person
+        "mjpg_capture": "false",
+        "adaptive_quality": "false",
+    },
+    "interaction": {
+        "screens": "SCREEN_SINGLE_ABOVE_FHD",
+        "interaction_mechanism": InteractionMechanism.SELECT_BOTH_PAN_BOTH.name,
+        "pointing_mechanism": PointingMechanism.POINTER_TO_OBJECT.name,
+        "touch_control": "true",
+        "pointer_prediction": "false",
+        "one_euro_min_cutoff": "",  # empty to keep the default filter parameters
+        "one_euro_beta": "",
+    },
+    "metrics": {
+        "enabled": "true",
+        "host": "localhost",
+        "port": "8766",
+    },
+    "timing": {
+        "dump_path": "",  # empty to not dump stage timings
+        "dump_interval": "10",
+        "sensor_delay": "0",  # seconds from exposure to arrival at the host, added to the output latencies
+    },
+    "profiling": {
+        "directory": "profiles",
+        "duration": "30",  # seconds profiled on SIGUSR1
+    },
+    "events": {
+        "path": "events.jsonl",  # empty to only keep the recent events in memory
+        "max_bytes": "10485760",
+        "backups": "5",
+    },
+}
+
+
+class ConfigException(Exception):
+    pass
+
+
+def load_config(path: str) -> configparser.ConfigParser:
+    """
+    Reads the config file
+    :param path: Path to the INI file, options missing in it take their value from DEFAULT_CONFIG
+    :return: The config
+    """
+    config = configparser.ConfigParser()
+    config.read_dict(DEFAULT_CONFIG)
+    with open(path) as file:
+        config.read_file(file)
+    return config
+
+
+class Service(object):
+    def __init__(self, config: configparser.ConfigParser):
+        """
+        :param config: Config as returned by load_config
+        """
+        self.infodata: dict = {"camera": "stopped"}
+        self.interaction_controller = InteractionController(None, self.infodata)
+        self.profile_duration: float = 30  # seconds profiled on SIGUSR1
+        self.event_log_path: Union[str, None] = None
+        self.event_log_max_bytes: int = 10485760
+        self.event_log_backups: int = 5
+        self.configure(config)
+
+        self.metrics_server: Union[MetricsServer, None] = None
+        if config.getboolean("metrics", "enabled"):
+            self.metrics_server = MetricsServer(self.get_status, self.interaction_controller.is_camera_running,
+                                                host=config.get("metrics", "host"),
+                                                port=config.getint("metrics", "port"),
+                                                get_metrics=self.interaction_controller.metrics.render,
+                                                start_profiling=self.interaction_controller.start_profiling,
+                                                get_events=event_log.recent)
+
+        self.__started = monotonic()
+        self.__stop_requested = threading.Event()
+
+    def configure(self, config: configparser.ConfigParser):
+        """
+        Applies the config to the interaction controller and the service
+        :param config: Config as returned by load_config
+        :return: None. Raises ConfigException on invalid values.
+        """
+        controller = self.interaction_controller
+
+        try:
+            k4a_path_setfunction, k4abt_path_setfunction = controller.get_k4a_path_setfunctions()
+            if config.get("camera", "k4a_path"):
+                k4a_path_setfunction(config.get("camera", "k4a_path"))
+            if config.get("camera", "k4abt_path"):
+                k4abt_path_setfunction(config.get("camera", "k4abt_path"))
+            controller.get_k4a_gpu_id_setfunction()(config.getint("camera", "gpu_id"))
+
+            if config.getboolean("camera", "simulate"):
+                from pykinect_azure.simulator import SimulatedSdk, RecordedSkeletonSource
+
+                recording = config.get("camera", "recording")
+                skeleton_source = RecordedSkeletonSource(recording) if recording else None
+                controller.set_simulated_camera(SimulatedSdk(skeleton_source=skeleton_source))
+
+            controller.mjpg_capture_enabled = config.getboolean("camera", "mjpg_capture")
+            controller.adaptive_quality_enabled = config.getboolean("camera", "adaptive_quality")
+
+            controller.set_screen_environment(SCREEN_ENVIRONMENTS[config.get("interaction", "screens")])
+            controller.interaction_mechanism = InteractionMechanism[config.get("interaction", "interaction_mechanism")]
+            controller.pointing_mechanism = PointingMechanism[config.get("interaction", "pointing_mechanism")]
+            controller.touch_control_enabled = config.getboolean("interaction", "touch_control")
+            controller.pointer_prediction_enabled = config.getboolean("interaction", "pointer_prediction")
+
+            min_cutoff = config.get("interaction", "one_euro_min_cutoff")
+            beta = config.get("interaction", "one_euro_beta")
+            if min_cutoff or beta:
+                min_cutoff = float(min_cutoff) if min_cutoff else controller.get_1euro_min_cutoff()
+                beta = float(beta) if beta else controller.get_1euro_beta_value()
+                controller.get_1euro_tune_function()(min_cutoff, beta)
+
+            if config.get("timing", "dump_path"):
+                controller.timing_dump_path = config.get("timing", "dump_path")
+                controller.timing_dump_interval = config.getfloat("timing", "dump_interval")
+            controller.latency_tracker.sensor_delay = config.getfloat("timing", "sensor_delay")
+
+            controller.profile_directory = config.get("profiling", "directory")
+            self.profile_duration = config.getfloat("profiling", "duration")
+
+            self.event_log_path = config.get("events", "path") or None
+            self.event_log_max_bytes = config.getint("events", "max_bytes")
+            self.event_log_backups = config.getint("events", "backups")
+        except KeyError as e:
+            raise ConfigException(f"Unknown value {e}")
+        except ValueError as e:
+            raise ConfigException(str(e))
+
+    def get_status(self) -> dict:
+        """
+        Gets the status served by the metrics server
+        :return: Dict with uptime in seconds, infodata, stage timings and latencies in milliseconds
+        """
+        return {"uptime": round(monotonic() - self.__started, 1), **self.interaction_controller.get_status()}
+
+    def profile(self):
+        """ Profiles the camera threads for profile_duration seconds, e.g. on a signal. """
+        try:
+            path = self.interaction_controller.start_profiling(self.profile_duration)
+            print(f"Profiling for {self.profile_duration:g} s, writing {path}")
+        except (ValueError, RuntimeError) as e:
+            print(f"Cannot profile: {e}", file=sys.stderr)
+
+    def stop(self):
+        """ Requests the service to stop, can be called from any thread and from signal handlers. """
+        self.__stop_requested.set()
+
+    def run(self) -> int:
+        """
+        Starts the camera and serves until stop is called or the camera loop ends
+        :return: Exit code, 0 if stopped, 1 if the camera failed
+        """
+        controller = self.interaction_controller
+
+        if self.event_log_path is not None:
+            event_log.start_writer(self.event_log_path, max_bytes=self.event_log_max_bytes,
+                                   backup_count=self.event_log_backups)
+
+        if self.metrics_server is not None:
+            self.metrics_server.open_server()
+            print("Metrics server listening on http://%s:%d" % self.metrics_server.address)
+
+        exit_code = 0
+        try:
+            controller.check_required_files()
+            controller.warm_up()  # models are prepared while the device starts, their state is part of the status
+            controller.start_camera()
+            self.infodata["camera"] = "running"
+            print("Camera started")
+
+            # Wait with a timeout, so that signal handlers run on Windows as well
+            while not self.__stop_requested.wait(0.5):
+                if not controller.cameraloop_thread.is_alive():
+                    print("Camera loop stopped unexpectedly", file=sys.stderr)
+                    exit_code = 1
+                    break
+        except Exception as e:
+            print(f"Camera failed: {type(e).__name__}: {e}", file=sys.stderr)
+            exit_code = 1
+        finally:
+            controller.stop_camera()
+            self.infodata["camera"] = "stopped"
+            if self.metrics_server is not None:
+                self.metrics_server.close_server()
+            event_log.stop_writer()
+
+        print("Stopped")
+        return exit_code
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Map gesture controller, headless")
+    parser.add_argument("--config", required=True, metavar="FILE",
+                        help="INI file with the sections camera, interaction, metrics, timing, profiling and events, "
+                             "see service.example.ini")
+    return parser.parse_args()
+
+
+def main() -> int:
+    arguments = parse_arguments()
+
+    try:
+        service = Service(load_config(arguments.config))
+    except (OSError, configparser.Error, ConfigException) as e:
+        print(f"Invalid config: {e}", file=sys.stderr)
+        return 2
+
+    def on_signal(signum, frame):
+        print(f"Received {signal.Signals(signum).name}, stopping")
+        service.stop()
+
+    for signal_name in ("SIGINT", "SIGTERM", "SIGBREAK"):
+        if hasattr(signal, signal_name):  # SIGBREAK only exists on Windows
+            signal.signal(getattr(signal, signal_name), on_signal)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: service.profile())
+
+    return service.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,3 @@
 from .controls import *
 from .actions import *
+from .backends import TouchBackend, TouchContact, WindowsTouchBackend, UinputTouchBackend, RecordingTouchBackend
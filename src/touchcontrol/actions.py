@@ -1,4 +1,29 @@
 from .controls import *
+from .controls import _injector
+from .scheduler import GestureScheduler, Gesture, TouchEvent, interpolate_stroke, ACTION_DOWN, ACTION_UP
+
+
+# Scheduler injecting multi-step gestures from its own thread. Its thread starts with the first scheduled gesture.
+_scheduler = GestureScheduler(_injector)
+
+
+def set_refresh_rate(refresh_rate: float):
+    """
+    Sets the display refresh rate multi-step gestures are interpolated to
+    :param refresh_rate: Refresh rate in Hz
+    :return: None
+    """
+    _scheduler.refresh_rate = refresh_rate
+
+
+def schedule_gesture(events: list[TouchEvent], delay: float = 0) -> Gesture:
+    """
+    Schedules a custom sequence of timestamped touch events. Returns immediately.
+    :param events: Events with times relative to the gesture start
+    :param delay: Seconds from now until the gesture starts
+    :return: Handle of the scheduled gesture, call wait() on it to block until it finished
+    """
+    return _scheduler.schedule(events, delay)
 
 
 def tap(coords: tuple[int, int]):
@@ -12,56 +37,46 @@ def tap(coords: tuple[int, int]):
     finger_up()   # Simulate finger leaving the screen
 
 
-def swipe(start_coords: tuple[int, int], end_coords: tuple[int, int], num_steps=10):
+def swipe(start_coords: tuple[int, int], end_coords: tuple[int, int], duration: float = 0.1) -> Gesture:
     """
-    Method to emulate a linear swiping motion on touch screen.
+    Method to emulate a linear swiping motion on touch screen. Returns immediately, the gesture is injected
+    in the background with one move per display refresh.
     Example: Panning a map.
     :param start_coords: Tuple of screen coordinates where swiping should start (x, y)
     :param end_coords: Tuple of screen coordinates where swiping should end (x, y)
-    :param num_steps: Number of steps used for linear interpolation between start and end. Use higher number for smoother movement.
-    :return: None
+    :param duration: Duration of the swiping motion in seconds
+    :return: Handle of the scheduled gesture
     """
 
-    finger_down(start_coords)
+    events = [TouchEvent(0, ACTION_DOWN, 0, start_coords)]
+    events += interpolate_stroke(start_coords, end_coords, duration, _scheduler.refresh_rate, 0)
+    events.append(TouchEvent(duration, ACTION_UP, 0))  # Pull Up
 
-    x_step = int((end_coords[0] - start_coords[0]) / num_steps)
-    y_step = int((end_coords[1] - end_coords[0]) / num_steps)
-    offset = (x_step, y_step)
-    for i in range(num_steps):
-        move_finger(offset)
-        sleep(0.01)
-
-    # Pull Up
-    finger_up()
+    return _scheduler.schedule(events)
 
 
 def spread(start_f1: tuple[int, int], end_f1: tuple[int, int],
-           start_f2: tuple[int, int], end_f2: tuple[int, int], num_steps=10):
+           start_f2: tuple[int, int], end_f2: tuple[int, int], duration: float = 0.1) -> Gesture:
     """
-    Method emulating a spreading multitouch gesture by emulating two fingers swiping across the screen
+    Method emulating a spreading multitouch gesture by emulating two fingers swiping across the screen.
+    Returns immediately, the gesture is injected in the background with one move per display refresh.
     Example: Two fingers performing an opening or closing gesture to zoom in/out of an image.
     :param start_f1: Screen coordinates of where the first finger starts swiping (x,y)
     :param end_f1: Screen coordinates of where the first finger ends swiping (x,y)
     :param start_f2: Screen coordinates of where the second finger starts swiping (x,y)
     :param end_f2: Screen coordinaets of where the second finger ends swiping (x,y)
-    :param num_steps: Number of steps used for linear interpolation between start and end. Use higher number for smoother movement.
-    :return: None
+    :param duration: Duration of the spreading motion in seconds
+    :return: Handle of the scheduled gesture
     """
 
     # Press Down
-    two_fingers_down(start_f1, start_f2)
-
-    x1_step = int((end_f1[0] - start_f1[0]) / num_steps)
-    y1_step = int((end_f1[1] - start_f1[1]) / num_steps)
-    finger_1_offset = (x1_step, y1_step)
+    events = [TouchEvent(0, ACTION_DOWN, 0, start_f1), TouchEvent(0, ACTION_DOWN, 1, start_f2)]
 
-    x2_step = int((end_f2[0] - start_f2[0]) / num_steps)
-    y2_step = int((end_f2[1] - start_f2[1]) / num_steps)
-    finger_2_offset = (x2_step, y2_step)
-
-    for i in range(num_steps):
-        move_two_fingers(finger_1_offset, finger_2_offset)
-        sleep(0.01)
+    # Moves of both fingers share their timestamps and are therefore injected together
+    events += interpolate_stroke(start_f1, end_f1, duration, _scheduler.refresh_rate, 0)
+    events += interpolate_stroke(start_f2, end_f2, duration, _scheduler.refresh_rate, 1)
 
     # Pull Up
-    two_fingers_up()
+    events += [TouchEvent(duration, ACTION_UP, 0), TouchEvent(duration, ACTION_UP, 1)]
+
+    return _scheduler.schedule(events)
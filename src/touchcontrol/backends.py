@@ -0,0 +1,212 @@
+"""
+Backends that inject touch contacts into the operating system.
+All backends receive complete injection frames: a tuple of TouchContact, one per active contact.
+"""
+import platform
+from time import perf_counter
+from typing import Union
+
+from utils import event_log
+
+from ._wrapper import POINTER_FLAG_DOWN, POINTER_FLAG_UP, POINTER_FLAG_INCONTACT
+
+
+class TouchContact:
+    """
+    State of a single touch contact within one injection frame.
+    Flags use the POINTER_FLAG_* values of Winuser.h, independent of the backend in use.
+    origin_usec is the device timestamp of the camera frame the contact originates from, if known.
+    """
+    __slots__ = ("pointer_id", "x", "y", "flags", "origin_usec")
+
+    def __init__(self, pointer_id: int, x: int, y: int, flags: int, origin_usec: Union[int, None] = None):
+        self.pointer_id: int = pointer_id
+        self.x: int = x
+        self.y: int = y
+        self.flags: int = flags
+        self.origin_usec: Union[int, None] = origin_usec
+
+    def __repr__(self):
+        return f"TouchContact(pointer_id={self.pointer_id}, x={self.x}, y={self.y}, flags={hex(self.flags)})"
+
+    @property
+    def is_down(self) -> bool:
+        return bool(self.flags & POINTER_FLAG_DOWN)
+
+    @property
+    def is_up(self) -> bool:
+        return bool(self.flags & POINTER_FLAG_UP)
+
+    @property
+    def in_contact(self) -> bool:
+        return bool(self.flags & POINTER_FLAG_INCONTACT)
+
+
+class TouchBackend:
+    """
+    Interface for touch injection backends
+    """
+    max_contacts: int = 2
+
+    def inject(self, contacts: tuple[TouchContact, ...]) -> None:
+        """
+        Injects one frame of touch contacts
+        :param contacts: All contacts that are part of this frame
+        :return: None
+        """
+        raise NotImplementedError
+
+    def set_screen_size(self, width: int, height: int) -> None:
+        """
+        Informs the backend about the size of the (joined) screen in pixels
+        :param width: Width in pixels
+        :param height: Height in pixels
+        :return: None
+        """
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class WindowsTouchBackend(TouchBackend):
+    """
+    Injects touch contacts through InjectTouchInput of Windows' Winuser.h
+    """
+    def __init__(self, max_contacts: int = 2):
+        from ctypes import windll, byref
+        from ._wrapper import POINTER_TOUCH_INFO, PT_TOUCH, TOUCH_FLAG_NONE, TOUCH_MASK_ALL, TOUCH_FEEDBACK_INDIRECT
+
+        self.max_contacts = max_contacts
+        self.__user32 = windll.user32
+        self.__byref = byref
+        self.failed_injections = 0
+
+        self.__touch_info = (POINTER_TOUCH_INFO * max_contacts)()
+        for idx in range(max_contacts):
+            self.__touch_info[idx].pointerInfo.pointerType = PT_TOUCH
+            self.__touch_info[idx].touchFlags = TOUCH_FLAG_NONE
+            self.__touch_info[idx].touchMask = TOUCH_MASK_ALL
+            self.__touch_info[idx].orientation = 90
+            self.__touch_info[idx].pressure = 32000
+
+        initialized = bool(self.__user32.InitializeTouchInjection(max_contacts, TOUCH_FEEDBACK_INDIRECT))
+        event_log.record("touch_initialized", success=initialized, max_contacts=max_contacts)
+
+    def inject(self, contacts: tuple[TouchContact, ...]) -> None:
+        for idx, contact in enumerate(contacts):
+            info = self.__touch_info[idx]
+            info.pointerInfo.pointerId = contact.pointer_id
+            info.pointerInfo.pointerFlags = contact.flags
+            info.pointerInfo.ptPixelLocation.x = contact.x
+            info.pointerInfo.ptPixelLocation.y = contact.y
+            info.rcContact.top = contact.y - 2
+            info.rcContact.bottom = contact.y + 2
+            info.rcContact.left = contact.x - 2
+            info.rcContact.right = contact.x + 2
+
+        # Failing injections (e.g. lifting a contact that was already lifted) are counted, not raised,
+        # so a rejected frame does not end the camera loop
+        if not self.__user32.InjectTouchInput(len(contacts), self.__byref(self.__touch_info)):
+            self.failed_injections += 1
+
+
+class UinputTouchBackend(TouchBackend):
+    """
+    Injects touch contacts as a virtual multitouch screen (protocol B) through Linux' uinput.
+    Requires the evdev package and write access to /dev/uinput.
+    """
+    def __init__(self, width: int = 1920, height: int = 1080, max_contacts: int = 2):
+        try:
+            from evdev import UInput, AbsInfo, ecodes
+        except ImportError as e:
+            raise ImportError("UinputTouchBackend requires the evdev package: pip install evdev") from e
+
+        self.max_contacts = max_contacts
+        self.__uinput_class = UInput
+        self.__absinfo_class = AbsInfo
+        self.__ecodes = ecodes
+
+        self.__width = width
+        self.__height = height
+        self.__device = None
+        self.__next_tracking_id = 0
+
+    def set_screen_size(self, width: int, height: int) -> None:
+        if (width, height) == (self.__width, self.__height):
+            return
+        self.__width, self.__height = width, height
+        self.close()  # device is re-created with new axis ranges on next injection
+
+    def __open_device(self):
+        e = self.__ecodes
+        x_range = self.__absinfo_class(value=0, min=0, max=self.__width - 1, fuzz=0, flat=0, resolution=0)
+        y_range = self.__absinfo_class(value=0, min=0, max=self.__height - 1, fuzz=0, flat=0, resolution=0)
+        slots = self.__absinfo_class(value=0, min=0, max=self.max_contacts - 1, fuzz=0, flat=0, resolution=0)
+        ids = self.__absinfo_class(value=0, min=0, max=65535, fuzz=0, flat=0, resolution=0)
+        capabilities = {
+            e.EV_KEY: [e.BTN_TOUCH],
+            e.EV_ABS: [(e.ABS_X, x_range), (e.ABS_Y, y_range),
+                       (e.ABS_MT_SLOT, slots), (e.ABS_MT_TRACKING_ID, ids),
+                       (e.ABS_MT_POSITION_X, x_range), (e.ABS_MT_POSITION_Y, y_range)]
+        }
+        self.__device = self.__uinput_class(capabilities, name="MapGestureController Touch",
+                                            input_props=[e.INPUT_PROP_DIRECT])
+
+    def inject(self, contacts: tuple[TouchContact, ...]) -> None:
+        if self.__device is None:
+            self.__open_device()
+
+        e = self.__ecodes
+        any_in_contact = False
+        for contact in contacts:
+            self.__device.write(e.EV_ABS, e.ABS_MT_SLOT, contact.pointer_id)
+            if contact.is_up:
+                self.__device.write(e.EV_ABS, e.ABS_MT_TRACKING_ID, -1)
+                continue
+            if contact.is_down:
+                self.__device.write(e.EV_ABS, e.ABS_MT_TRACKING_ID, self.__next_tracking_id)
+                self.__next_tracking_id = (self.__next_tracking_id + 1) % 65536
+            self.__device.write(e.EV_ABS, e.ABS_MT_POSITION_X, contact.x)
+            self.__device.write(e.EV_ABS, e.ABS_MT_POSITION_Y, contact.y)
+            if not any_in_contact:
+                # single touch emulation follows the first contact
+                self.__device.write(e.EV_ABS, e.ABS_X, contact.x)
+                self.__device.write(e.EV_ABS, e.ABS_Y, contact.y)
+            any_in_contact = True
+
+        self.__device.write(e.EV_KEY, e.BTN_TOUCH, 1 if any_in_contact else 0)
+        self.__device.syn()
+
+    def close(self) -> None:
+        if self.__device is not None:
+            self.__device.close()
+            self.__device = None
+
+
+class RecordingTouchBackend(TouchBackend):
+    """
+    Keeps injected frames in memory instead of injecting them. Used for tests and benchmarks.
+    """
+    def __init__(self, max_contacts: int = 2):
+        self.max_contacts = max_contacts
+        self.frames: list[tuple[float, tuple[TouchContact, ...]]] = []
+
+    def inject(self, contacts: tuple[TouchContact, ...]) -> None:
+        self.frames.append((perf_counter(), contacts))
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+
+def get_default_backend() -> TouchBackend:
+    """
+    Creates the injection backend suitable for the current operating system
+    :return: The backend
+    """
+    system = platform.system()
+    if system == "Windows":
+        return WindowsTouchBackend()
+    if system == "Linux":
+        return UinputTouchBackend()
+    raise NotImplementedError(f"Touch injection is not supported on {system}")
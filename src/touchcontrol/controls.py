@@ -1,4 +1,57 @@
 from ._wrapper import *
+from .backends import TouchBackend, TouchContact
+from typing import Callable, Union  # after the wrapper, whose ctypes import shadows Union
+from .injector import TouchInjector
+
+
+# Injector shared by all control functions. The backend is created on first injection, not at import time.
+_injector = TouchInjector()
+
+
+def set_backend(backend: TouchBackend):
+    """
+    Selects the backend used to inject touch contacts, e.g. RecordingTouchBackend for tests.
+    :param backend: The backend
+    :return: None
+    """
+    _injector.set_backend(backend)
+
+
+def set_screen_size(width: int, height: int):
+    """
+    Informs the injection backend about the size of the joined screen in pixels
+    :param width: Width in pixels
+    :param height: Height in pixels
+    :return: None
+    """
+    _injector.set_screen_size(width, height)
+
+
+def touch_frame(origin_usec: Union[int, None] = None):
+    """
+    Context manager: all control functions called within are injected as one frame on exit.
+    Use once per camera frame to avoid sending redundant events.
+    :param origin_usec: Device timestamp of the camera frame, attached to the injected contacts
+    :return: Context manager
+    """
+    return _injector.frame(origin_usec)
+
+
+def set_injection_listener(listener: Union[Callable[[tuple[TouchContact, ...]], None], None]):
+    """
+    Sets a function called with the contacts of every injected frame, e.g. to measure latency
+    :param listener: The function, None to remove it
+    :return: None
+    """
+    _injector.injection_listener = listener
+
+
+def get_injection_stats() -> dict:
+    """
+    Gets counters of injected, coalesced and skipped touch frames
+    :return: Dict of counters
+    """
+    return _injector.get_stats()
 
 
 def finger_down(coords: tuple[int, int]):
@@ -8,8 +61,7 @@ def finger_down(coords: tuple[int, int]):
     :return: None
     """
 
-    pointer_make_contact_single(coords)
-    inject_single()
+    _injector.contact_down(coords, 0)
 
 
 def two_fingers_down(finger1_coords: tuple[int, int], finger2_coords: tuple[int, int]):
@@ -19,9 +71,9 @@ def two_fingers_down(finger1_coords: tuple[int, int], finger2_coords: tuple[int,
     :param finger2_coords: Tuple containing screen coordinates wehre second finger is placed on screen: (x, y)
     :return: None
     """
-    coords = (finger1_coords, finger2_coords)
-    pointer_make_contact_double(coords)
-    inject_double()
+    with _injector.frame():
+        _injector.contact_down(finger1_coords, 0)
+        _injector.contact_down(finger2_coords, 1)
 
 
 def finger_up():
@@ -29,8 +81,7 @@ def finger_up():
     Method to simualte taking the finger off the screen. finger_down() must have been called before
     :return: None
     """
-    pointer_leave_single()
-    inject_single()
+    _injector.contact_up(0)
 
 
 def two_fingers_up():
@@ -38,8 +89,9 @@ def two_fingers_up():
     Method to simulate taking both fingers off the screen. two_fingers_down() must have been called before.
     :return:
     """
-    pointer_leave_double()
-    inject_double()
+    with _injector.frame():
+        _injector.contact_up(0)
+        _injector.contact_up(1)
 
 
 def move_finger(coord_offset: tuple[int, int]):
@@ -48,8 +100,7 @@ def move_finger(coord_offset: tuple[int, int]):
     :param coord_offset: Tuple indicating finger movement in pixels, relative to curernt position, e.g. (dx, dy)
     :return: None
     """
-    pointer_udpate_single_relative(coord_offset)
-    inject_single()
+    _injector.contact_move_relative(coord_offset, 0)
 
 
 def move_two_fingers(coord_offset_finger_1: tuple[int, int], corod_offset_finger_2: tuple[int, int]):
@@ -59,6 +110,25 @@ def move_two_fingers(coord_offset_finger_1: tuple[int, int], corod_offset_finger
     :param corod_offset_finger_2: Tuple indicating finger-2 movement in pixels, relative to curernt position, e.g. (dx, dy)
     :return: None
     """
-    offsets = (coord_offset_finger_1, corod_offset_finger_2)
-    pointer_update_double_relative(offsets)
-    inject_double()
+    with _injector.frame():
+        _injector.contact_move_relative(coord_offset_finger_1, 0)
+        _injector.contact_move_relative(corod_offset_finger_2, 1)
+
+
+def move_finger_to(coords: tuple[int, int], idx: int = 0):
+    """
+    Method to move a finger that is on the screen to absolute screen coordinates.
+    :param coords: Tuple containing screen coordinates the finger moves to: (x, y)
+    :param idx: Index of the finger, 0 for the first and 1 for the second finger
+    :return: None
+    """
+    _injector.contact_move(coords, idx)
+
+
+def get_finger_position(idx: int = 0) -> tuple[int, int]:
+    """
+    Gets the screen coordinates of a finger, including moves that were not injected yet
+    :param idx: Index of the finger, 0 for the first and 1 for the second finger
+    :return: Screen coordinates (x, y)
+    """
+    return _injector.get_position(idx)
@@ -0,0 +1,220 @@
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Union
+
+from ._wrapper import POINTER_FLAG_DOWN, POINTER_FLAG_UPDATE, POINTER_FLAG_UP, \
+    POINTER_FLAG_INRANGE, POINTER_FLAG_INCONTACT
+from .backends import TouchBackend, TouchContact, get_default_backend
+
+
+FLAGS_DOWN = POINTER_FLAG_DOWN | POINTER_FLAG_INRANGE | POINTER_FLAG_INCONTACT
+FLAGS_UPDATE = POINTER_FLAG_INRANGE | POINTER_FLAG_INCONTACT | POINTER_FLAG_UPDATE
+FLAGS_UP = POINTER_FLAG_UP
+
+
+class TouchInjector:
+    """
+    Keeps the state of all touch contacts and hands them to a TouchBackend.
+    Changes issued within one frame (see frame()) are coalesced into a single injection,
+    and frames that would not change anything are not injected at all.
+    Thread safe: a frame holds the lock until it is injected.
+    """
+    def __init__(self, backend: Union[TouchBackend, None] = None, max_contacts: int = 2, keepalive: float = 0.1):
+        """
+        Creates a new injector
+        :param backend: Backend used for injection. Created for the current OS on first injection if None
+        :param max_contacts: Number of simultaneous contacts
+        :param keepalive: Seconds after which an unchanged frame is injected again to keep contacts alive
+        """
+        self.__backend: Union[TouchBackend, None] = backend
+        self.max_contacts = max_contacts
+        self.keepalive = keepalive
+
+        self.__screen_size: Union[tuple[int, int], None] = None
+
+        self.__positions: list[tuple[int, int]] = [(0, 0)] * max_contacts
+        self.__injected_positions: list[tuple[int, int]] = [(0, 0)] * max_contacts
+        self.__in_contact: list[bool] = [False] * max_contacts
+        self.__pending: dict[int, int] = {}  # contact index -> flags of the change to be injected
+
+        self.__lock = threading.RLock()
+        self.__frame_depth = 0
+        self.__last_injection = 0.0
+        self.__origin_usec: Union[int, None] = None  # device timestamp of the camera frame of the current frame
+
+        # called with the contacts after each injection, e.g. to measure latency
+        self.injection_listener: Union[Callable[[tuple[TouchContact, ...]], None], None] = None
+
+        # statistics
+        self.injections = 0  # frames handed to the backend
+        self.coalesced = 0  # updates merged into an already pending update
+        self.skipped = 0  # redundant frames or contact changes that were not injected
+
+    @property
+    def backend(self) -> TouchBackend:
+        if self.__backend is None:
+            self.__backend = get_default_backend()
+            if self.__screen_size is not None:
+                self.__backend.set_screen_size(*self.__screen_size)
+        return self.__backend
+
+    def set_backend(self, backend: TouchBackend):
+        """
+        Replaces the backend. All contacts are considered lifted afterwards.
+        :param backend: The new backend
+        :return: None
+        """
+        with self.__lock:
+            if self.__backend is not None:
+                self.__backend.close()
+            self.__backend = backend
+            if self.__screen_size is not None:
+                backend.set_screen_size(*self.__screen_size)
+            self.__in_contact = [False] * self.max_contacts
+            self.__pending.clear()
+
+    def set_screen_size(self, width: int, height: int):
+        self.__screen_size = (width, height)
+        if self.__backend is not None:
+            self.__backend.set_screen_size(width, height)
+
+    def get_position(self, idx: int = 0) -> tuple[int, int]:
+        return self.__positions[idx]
+
+    def get_stats(self) -> dict:
+        return {"injections": self.injections, "coalesced": self.coalesced, "skipped": self.skipped}
+
+    @contextmanager
+    def frame(self, origin_usec: Union[int, None] = None):
+        """
+        Context manager collecting all contact changes and injecting them together on exit. Frames can be nested,
+        only the outermost one injects.
+        :param origin_usec: Device timestamp of the camera frame the changes originate from, attached to the contacts
+        """
+        with self.__lock:
+            self.__frame_depth += 1
+            if origin_usec is not None:
+                self.__origin_usec = origin_usec
+            try:
+                yield self
+            finally:
+                self.__frame_depth -= 1
+                if self.__frame_depth == 0:
+                    self.flush()
+                    self.__origin_usec = None
+
+    def contact_down(self, coords: tuple[int, int], idx: int = 0):
+        """
+        Puts a contact onto the screen
+        :param coords: Screen coordinates of the contact (x, y)
+        :param idx: Index of the contact
+        :return: None
+        """
+        with self.__lock:
+            if self.__is_in_contact(idx):
+                # already on screen: only move it
+                self.contact_move(coords, idx)
+                return
+            self.__stage(idx, FLAGS_DOWN, coords)
+
+    def contact_move(self, coords: tuple[int, int], idx: int = 0):
+        """
+        Moves a contact that is on the screen to new screen coordinates
+        :param coords: Screen coordinates (x, y)
+        :param idx: Index of the contact
+        :return: None
+        """
+        with self.__lock:
+            if not self.__is_in_contact(idx):
+                self.skipped += 1
+                return
+            self.__stage(idx, FLAGS_UPDATE, coords)
+
+    def contact_move_relative(self, offset: tuple[int, int], idx: int = 0):
+        """
+        Moves a contact that is on the screen relative to its current position
+        :param offset: Movement in pixels (dx, dy)
+        :param idx: Index of the contact
+        :return: None
+        """
+        with self.__lock:
+            x, y = self.__positions[idx]
+            self.contact_move((x + offset[0], y + offset[1]), idx)
+
+    def contact_up(self, idx: int = 0):
+        """
+        Lifts a contact off the screen
+        :param idx: Index of the contact
+        :return: None
+        """
+        with self.__lock:
+            if not self.__is_in_contact(idx):
+                self.skipped += 1
+                return
+            self.__stage(idx, FLAGS_UP, None)
+
+    def flush(self):
+        """
+        Injects all pending changes as one frame. Contacts that are on screen but unchanged are part of the frame, too.
+        :return: None
+        """
+        with self.__lock:
+            if not self.__pending:
+                return
+
+            contacts = []
+            changed = False
+            for idx in range(self.max_contacts):
+                flags = self.__pending.get(idx)
+                if flags is None:
+                    if not self.__in_contact[idx]:
+                        continue
+                    flags = FLAGS_UPDATE
+                x, y = self.__positions[idx]
+                if flags != FLAGS_UPDATE or (x, y) != self.__injected_positions[idx]:
+                    changed = True
+                contacts.append(TouchContact(idx, x, y, flags, self.__origin_usec))
+            self.__pending.clear()
+
+            now = perf_counter()
+            if not changed and now - self.__last_injection < self.keepalive:
+                self.skipped += 1
+                return
+
+            contacts = tuple(contacts)
+            self.backend.inject(contacts)
+            self.injections += 1
+            self.__last_injection = now
+
+            for contact in contacts:
+                self.__in_contact[contact.pointer_id] = contact.in_contact
+                self.__injected_positions[contact.pointer_id] = (contact.x, contact.y)
+
+            if self.injection_listener is not None:
+                self.injection_listener(contacts)
+
+    def __is_in_contact(self, idx: int) -> bool:
+        """ Contact state including changes that are not injected yet """
+        pending = self.__pending.get(idx)
+        if pending is None:
+            return self.__in_contact[idx]
+        return pending != FLAGS_UP
+
+    def __stage(self, idx: int, flags: int, coords: Union[tuple[int, int], None]):
+        pending = self.__pending.get(idx)
+        if pending is not None:
+            if flags == FLAGS_UPDATE:
+                # merge into pending down or update, keep its flags
+                self.coalesced += 1
+                flags = pending
+            else:
+                # down and up must reach the system in separate frames, e.g. for a tap
+                self.flush()
+
+        self.__pending[idx] = flags
+        if coords is not None:
+            self.__positions[idx] = (int(coords[0]), int(coords[1]))
+
+        if self.__frame_depth == 0:
+            self.flush()
@@ -0,0 +1,161 @@
+import heapq
+import threading
+from itertools import count
+from time import perf_counter
+from typing import Union
+
+from .injector import TouchInjector
+
+
+ACTION_DOWN = 0
+ACTION_MOVE = 1
+ACTION_UP = 2
+
+
+class TouchEvent:
+    """
+    Touch event scheduled at a point in time relative to the start of its gesture
+    """
+    __slots__ = ("t", "action", "idx", "coords")
+
+    def __init__(self, t: float, action: int, idx: int = 0, coords: Union[tuple[int, int], None] = None):
+        """
+        :param t: Seconds after the start of the gesture at which the event is injected
+        :param action: One of ACTION_DOWN, ACTION_MOVE, ACTION_UP
+        :param idx: Index of the touch contact
+        :param coords: Absolute screen coordinates (x, y), None for ACTION_UP
+        """
+        self.t: float = t
+        self.action: int = action
+        self.idx: int = idx
+        self.coords: Union[tuple[int, int], None] = coords
+
+    def __repr__(self):
+        return f"TouchEvent(t={self.t:.4f}, action={self.action}, idx={self.idx}, coords={self.coords})"
+
+
+class Gesture:
+    """
+    Handle for a scheduled gesture. Can be waited for or cancelled.
+    """
+    def __init__(self, events: list[TouchEvent]):
+        self.events: list[TouchEvent] = events
+        self.start_time: float = 0
+        self.cancelled: bool = False
+        self.__remaining = len(events)
+        self.__done = threading.Event()
+        if not events:
+            self.__done.set()
+
+    @property
+    def done(self) -> bool:
+        return self.__done.is_set()
+
+    def wait(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Blocks until all events of the gesture were injected
+        :param timeout: Maximum time to wait in seconds
+        :return: True if the gesture finished
+        """
+        return self.__done.wait(timeout)
+
+    def cancel(self):
+        """ Skips all events of the gesture that were not injected yet. """
+        self.cancelled = True
+
+    def _event_dispatched(self):
+        self.__remaining -= 1
+        if self.__remaining <= 0:
+            self.__done.set()
+
+
+class GestureScheduler:
+    """
+    Injects timestamped touch event sequences from a background thread, so multi-step gestures never block the caller.
+    Events that are due at the same time are injected as one frame.
+    """
+    def __init__(self, injector: TouchInjector, refresh_rate: float = 60):
+        """
+        :param injector: Injector that receives the events
+        :param refresh_rate: Refresh rate of the display in Hz. Gestures are interpolated to this rate
+        """
+        self.injector: TouchInjector = injector
+        self.refresh_rate: float = refresh_rate
+
+        self.__queue: list[tuple[float, int, TouchEvent, Gesture]] = []  # heap of (due time, sequence, event, gesture)
+        self.__sequence = count()
+        self.__condition = threading.Condition()
+        self.__thread: Union[threading.Thread, None] = None
+
+    def schedule(self, events: list[TouchEvent], delay: float = 0) -> Gesture:
+        """
+        Schedules a sequence of events
+        :param events: Events with times relative to the start of the gesture
+        :param delay: Seconds from now until the gesture starts
+        :return: Handle of the scheduled gesture
+        """
+        gesture = Gesture(events)
+        gesture.start_time = perf_counter() + delay
+        with self.__condition:
+            for event in events:
+                heapq.heappush(self.__queue, (gesture.start_time + event.t, next(self.__sequence), event, gesture))
+            self.__ensure_running()
+            self.__condition.notify()
+        return gesture
+
+    def __ensure_running(self):
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while not self.__queue:
+                    self.__condition.wait()
+                wait_time = self.__queue[0][0] - perf_counter()
+                if wait_time > 0:
+                    # woken up early if a gesture with an earlier event is scheduled
+                    self.__condition.wait(wait_time)
+                    continue
+
+                due = []
+                now = perf_counter()
+                while self.__queue and self.__queue[0][0] <= now:
+                    due.append(heapq.heappop(self.__queue))
+
+            with self.injector.frame():
+                for _, _, event, gesture in due:
+                    if not gesture.cancelled:
+                        self.__dispatch(event)
+                    gesture._event_dispatched()
+
+    def __dispatch(self, event: TouchEvent):
+        if event.action == ACTION_DOWN:
+            self.injector.contact_down(event.coords, event.idx)
+        elif event.action == ACTION_MOVE:
+            self.injector.contact_move(event.coords, event.idx)
+        elif event.action == ACTION_UP:
+            self.injector.contact_up(event.idx)
+
+
+def interpolate_stroke(start: tuple[int, int], end: tuple[int, int], duration: float, refresh_rate: float,
+                       idx: int = 0, t0: float = 0) -> list[TouchEvent]:
+    """
+    Creates move events along a straight line, one per display refresh
+    :param start: Start coordinates (x, y), where the contact already is
+    :param end: End coordinates (x, y)
+    :param duration: Duration of the stroke in seconds
+    :param refresh_rate: Display refresh rate in Hz
+    :param idx: Index of the touch contact
+    :param t0: Time of the stroke start, relative to the gesture start
+    :return: List of move events, the last one is at end
+    """
+    num_steps = max(1, round(duration * refresh_rate))
+    events = []
+    for step in range(1, num_steps + 1):
+        fraction = step / num_steps
+        coords = (round(start[0] + fraction * (end[0] - start[0])),
+                  round(start[1] + fraction * (end[1] - start[1])))
+        events.append(TouchEvent(t0 + fraction * duration, ACTION_MOVE, idx, coords))
+    return events
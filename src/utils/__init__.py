@@ -1,2 +1,13 @@
 from .cvfpscalc import CvFpsCalc
 from .one_euro_filter import OneEuroFilter
+from .latest_slot import LatestSlot
+from .stagetimer import StageTimer, LatencyWindow
+from .latency import LatencyTracker, ClockOffsetEstimator
+from .buffer_pool import BufferPool
+from .color_conversion import bgra_to_mirrored_rgb
+from .mjpg_decoder import MjpgDecodePool
+from .lazy_import import LazyModule
+from .preloader import Preloader
+from .metrics import MetricsRegistry, Histogram, DURATION_BUCKETS
+from .sampling_profiler import SamplingProfiler
+from .eventlog import EventLog, event_log
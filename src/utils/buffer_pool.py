@@ -0,0 +1,64 @@
+import sys
+
+import numpy as np
+
+
+def _unreferenced_refcount() -> int:
+    """ Reference count sys.getrefcount() reports for a buffer only the pool refers to, see BufferPool.acquire() """
+    ring = [np.empty(0)]
+    for buffer in ring:
+        return sys.getrefcount(buffer)
+
+
+class BufferPool(object):
+    """
+    Preallocated arrays for OpenCV's dst= parameters, so steady-state frames do not allocate.
+    A buffer is handed out again once all consumers dropped their references to it (including views of it),
+    no explicit release is necessary. Not thread safe: acquire from a single thread only.
+    """
+    _FREE_REFCOUNT = _unreferenced_refcount()
+
+    def __init__(self, max_buffers: int = 8):
+        """
+        :param max_buffers: Maximum number of buffers per shape. If all are in use, acquire() allocates an unpooled array
+        """
+        self.max_buffers = max_buffers
+        self._rings: dict[tuple, list[np.ndarray]] = {}
+
+        # statistics
+        self.allocations = 0  # buffers added to the pool
+        self.misses = 0  # unpooled arrays handed out because all buffers of a shape were in use
+
+    def acquire(self, shape: tuple, dtype=np.uint8) -> np.ndarray:
+        """
+        Gets a buffer no one else refers to. Its content is undefined.
+        :param shape: Shape of the buffer
+        :param dtype: Data type of the buffer
+        :return: The buffer
+        """
+        key = (tuple(shape), np.dtype(dtype))
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = []
+
+        for buffer in ring:
+            if sys.getrefcount(buffer) <= self._FREE_REFCOUNT:
+                buffer.flags.writeable = True  # a previous consumer may have locked it
+                return buffer
+
+        buffer = np.empty(shape, dtype)
+        if len(ring) < self.max_buffers:
+            ring.append(buffer)
+            self.allocations += 1
+        else:
+            self.misses += 1
+        return buffer
+
+    def clear(self):
+        """ Forgets all buffers, e.g. after the frame size changed. Buffers in use stay valid. """
+        self._rings.clear()
+
+    def get_stats(self) -> dict:
+        return {"buffers": sum(len(ring) for ring in self._rings.values()),
+                "allocations": self.allocations,
+                "misses": self.misses}
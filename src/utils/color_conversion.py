@@ -0,0 +1,32 @@
+import threading
+
+import cv2 as cv
+import numpy as np
+
+
+_local = threading.local()  # intermediate band per (band rows, width), per thread
+
+
+def bgra_to_mirrored_rgb(src: np.ndarray, dst: np.ndarray, band_rows: int = 64) -> np.ndarray:
+    """
+    Converts a BGRA (or BGR) image to RGB and mirrors it horizontally in one pass over the image.
+    Works in bands of rows, so the intermediate result of each band stays in the CPU cache.
+    The band buffer is reused by later calls of the same thread.
+    :param src: BGRA image, height x width x 4
+    :param dst: Destination, height x width x 3 uint8
+    :param band_rows: Number of rows converted at once
+    :return: dst
+    """
+    height, width = src.shape[:2]
+    band_buffers = getattr(_local, "band_buffers", None)
+    if band_buffers is None:
+        band_buffers = _local.band_buffers = {}
+    band = band_buffers.get((band_rows, width))
+    if band is None:
+        band = band_buffers[(band_rows, width)] = np.empty((band_rows, width, 3), dtype=np.uint8)
+    for y in range(0, height, band_rows):
+        rows = min(band_rows, height - y)
+        band_dst = band[:rows]
+        cv.cvtColor(src[y:y + rows], cv.COLOR_BGR2RGB, dst=band_dst)
+        cv.flip(band_dst, 1, dst=dst[y:y + rows])
+    return dst
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+from collections import deque
+from time import perf_counter, time
+from typing import Union
+
+
+class EventLog(object):
+    """
+    Ring buffer of structured events with bounded memory, e.g. the decisions of the interaction controller.
+    Recording appends one tuple with a perf_counter() timestamp and can be done from any thread. Each event type is
+    limited to rate_limit events per second, the number of events dropped by the limit is added as "suppressed" to the
+    next event of that type that is kept. A background writer appends new events to rotating JSONL files.
+    """
+    def __init__(self, capacity: int = 4096, rate_limit: int = 20):
+        """
+        :param capacity: Number of events kept, older ones are dropped (and reported as lost by the writer)
+        :param rate_limit: Events of one type kept per second
+        """
+        self.capacity = capacity
+        self.rate_limit = rate_limit
+        self.__events: deque = deque(maxlen=capacity)  # (sequence number, perf_counter() time, event, fields)
+        self.__sequence = 0
+        self.__windows: dict[str, list] = {}  # event -> [start of the rate window, events kept in it, suppressed]
+        self.__lock = threading.Lock()
+        self.__clock_offset = time() - perf_counter()  # wall clock time at perf_counter() zero
+
+        self.__writer: Union[threading.Thread, None] = None
+        self.__writer_stop = threading.Event()
+
+    def record(self, event: str, **fields) -> bool:
+        """
+        Records an event
+        :param event: Type of the event, e.g. "tap"
+        :param fields: Details of the event, must be serializable to JSON
+        :return: False if it was dropped by the rate limit
+        """
+        now = perf_counter()
+        with self.__lock:
+            window = self.__windows.get(event)
+            if window is None:
+                window = self.__windows[event] = [now, 0, 0]
+            elif now - window[0] >= 1:
+                window[0] = now
+                window[1] = 0
+            if window[1] >= self.rate_limit:
+                window[2] += 1
+                return False
+            window[1] += 1
+            if window[2]:
+                fields["suppressed"] = window[2]
+                window[2] = 0
+
+            self.__sequence += 1
+            self.__events.append((self.__sequence, now, event, fields))
+        return True
+
+    def recent(self, count: Union[int, None] = None) -> list[dict]:
+        """
+        Gets the most recent events
+        :param count: Number of events, None for all that are kept
+        :return: Events as dicts with seq, t (perf_counter() seconds), time (seconds since the epoch), event and fields
+        """
+        with self.__lock:
+            events = list(self.__events)
+        if count is not None:
+            events = events[-count:] if count > 0 else []
+        return [self.__to_dict(entry) for entry in events]
+
+    def __to_dict(self, entry: tuple) -> dict:
+        sequence, timestamp, event, fields = entry
+        return {"seq": sequence,
+                "t": round(timestamp, 6),
+                "time": round(timestamp + self.__clock_offset, 3),
+                "event": event,
+                **fields}
+
+    def start_writer(self, path: str, interval: float = 1, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        """
+        Starts a background thread appending new events as JSON lines to a file every interval seconds.
+        Events recorded before are written as well, if they are still kept.
+        :param path: Path of the file, rotated to path.1, path.2, ... when it exceeds max_bytes
+        :param interval: Seconds between two writes
+        :param max_bytes: Size of a file before it is rotated
+        :param backup_count: Number of rotated files kept
+        :return: None
+        """
+        self.stop_writer()
+        self.__writer_stop.clear()
+        self.__writer = threading.Thread(target=self.__write_loop, args=(path, interval, max_bytes, backup_count),
+                                         name="event-log-writer", daemon=True)
+        self.__writer.start()
+
+    def stop_writer(self):
+        """ Writes the remaining events and stops the writer thread. """
+        if self.__writer is not None:
+            self.__writer_stop.set()
+            self.__writer.join()
+            self.__writer = None
+
+    def __write_loop(self, path: str, interval: float, max_bytes: int, backup_count: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        written = 0  # sequence number of the last event written
+        file = open(path, "a")
+        try:
+            while True:
+                stopping = self.__writer_stop.wait(interval)
+
+                with self.__lock:
+                    events = list(self.__events)
+                events = [entry for entry in events if entry[0] > written]
+                if events:
+                    if events[0][0] > written + 1:
+                        file.write(json.dumps({"event": "events_lost", "count": events[0][0] - written - 1}) + "\n")
+                    file.writelines(json.dumps(self.__to_dict(entry), default=str) + "\n" for entry in events)
+                    file.flush()
+                    written = events[-1][0]
+
+                    if file.tell() >= max_bytes:
+                        file.close()
+                        self.__rotate(path, backup_count)
+                        file = open(path, "a")
+
+                if stopping:
+                    break
+        finally:
+            file.close()
+
+    @staticmethod
+    def __rotate(path: str, backup_count: int):
+        if backup_count < 1:
+            os.remove(path)
+            return
+        for index in range(backup_count - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+
+# Event log of the application, shared by all modules
+event_log = EventLog()
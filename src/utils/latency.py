@@ -0,0 +1,133 @@
+from collections import deque
+from time import perf_counter
+from typing import Union
+
+from .metrics import Histogram
+from .stagetimer import StageTimer
+
+
+class ClockOffsetEstimator(object):
+    """
+    Online estimate of the offset between the device clock (microseconds) and the host perf_counter() clock (seconds).
+    Every observation pairs a device timestamp with the host time it was received at. Transport delays only ever make
+    the observed offset larger, so the minimum over a sliding window is the best estimate. The window lets the
+    estimate follow drift between both clocks.
+    """
+    def __init__(self, window: float = 10):
+        """
+        :param window: Seconds of host time observations are kept for
+        """
+        self.window = window
+        self.__candidates: deque[tuple[float, float]] = deque()  # (host time, offset), offsets increasing
+        self.observations = 0
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.__candidates)
+
+    @property
+    def offset(self) -> Union[float, None]:
+        """ host time - device time in seconds, None if nothing was observed yet """
+        return self.__candidates[0][1] if self.__candidates else None
+
+    def update(self, device_usec: int, host_time: Union[float, None] = None):
+        """
+        Adds an observation
+        :param device_usec: Device timestamp in microseconds
+        :param host_time: perf_counter() time the timestamp was received at, now if None
+        :return: None
+        """
+        host_time = perf_counter() if host_time is None else host_time
+        offset = host_time - device_usec / 1e6
+        self.observations += 1
+
+        # monotonic queue: an observation with a smaller offset makes all earlier, larger ones obsolete
+        candidates = self.__candidates
+        while candidates and candidates[-1][1] >= offset:
+            candidates.pop()
+        candidates.append((host_time, offset))
+        while candidates[0][0] < host_time - self.window:
+            candidates.popleft()
+
+    def to_host(self, device_usec: int) -> Union[float, None]:
+        """
+        Maps a device timestamp to host time
+        :param device_usec: Device timestamp in microseconds
+        :return: perf_counter() time, None if nothing was observed yet
+        """
+        if not self.__candidates:
+            return None
+        return device_usec / 1e6 + self.__candidates[0][1]
+
+
+class LatencyTracker(object):
+    """
+    Measures the time from sensor exposure to output, based on device timestamps mapped to host time.
+    The clock offset is estimated from the times images arrived at the host, so the time spent waiting in the queue of
+    the SDK is part of the latency. The offset estimate absorbs the shortest delay from the device timestamp to the
+    arrival, which cannot be observed on the host. It is added back as sensor_delay (exposure, readout and USB
+    transfer). With sensor_delay at 0, latencies are measured from the fastest arrival of an image at the host.
+    """
+    def __init__(self, outputs: tuple = (), window_size: int = 256, clock_window: float = 10,
+                 histogram_bounds: tuple = (), sensor_delay: float = 0):
+        """
+        :param outputs: Names of the outputs, defines the order in summaries
+        :param window_size: Number of latencies kept per output
+        :param clock_window: Seconds of observations the clock offset estimate is based on
+        :param histogram_bounds: Bucket bounds in seconds of histograms counting all latencies of each output,
+        empty for no histograms
+        :param sensor_delay: Seconds from the device timestamp of an image to its fastest arrival at the host
+        """
+        self.clock = ClockOffsetEstimator(clock_window)
+        self.sensor_delay: float = sensor_delay
+        self.distributions = StageTimer(outputs, window_size, histogram_bounds)
+        self.__recorded_usec: dict[str, int] = {}  # output -> device timestamp of the last recorded latency
+
+    def observe(self, device_usec: int, host_time: Union[float, None] = None):
+        """
+        Feeds a device timestamp and its arrival time into the clock offset estimate
+        :param device_usec: Device timestamp in microseconds
+        :param host_time: perf_counter() time the timestamp arrived at the host, now if None
+        :return: None
+        """
+        self.clock.update(device_usec, host_time)
+
+    def to_host(self, device_usec: int) -> Union[float, None]:
+        """
+        Maps a device timestamp to the host time the sensor captured the data at
+        :param device_usec: Device timestamp in microseconds
+        :return: perf_counter() time, None if nothing was observed yet
+        """
+        host_time = self.clock.to_host(device_usec)
+        return None if host_time is None else host_time - self.sensor_delay
+
+    def record_output(self, output: str, device_usec: Union[int, None], host_time: Union[float, None] = None) \
+            -> Union[float, None]:
+        """
+        Records the latency of an output. Only the first output of the same sensor data is recorded, outputs sent
+        again (e.g. predicted positions between two frames) would count the same sensor data several times.
+        :param output: Name of the output, e.g. "websocket"
+        :param device_usec: Device timestamp of the sensor data the output originates from
+        :param host_time: perf_counter() time of the output, now if None
+        :return: Latency in seconds, None if it could not be determined or was recorded already
+        """
+        if device_usec is None or not self.clock.ready or self.__recorded_usec.get(output) == device_usec:
+            return None
+        self.__recorded_usec[output] = device_usec
+        host_time = perf_counter() if host_time is None else host_time
+        latency = host_time - self.to_host(device_usec)
+        self.distributions.record(output, latency)
+        return latency
+
+    def get_summary(self) -> dict:
+        """
+        Summarizes the latency distributions
+        :return: Dict output -> dict with count, last, p50, p95, p99 and max latency in milliseconds
+        """
+        return self.distributions.get_summary()
+
+    def get_histograms(self) -> dict[str, Histogram]:
+        return self.distributions.get_histograms()
+
+    def format_summary(self) -> dict:
+        return self.distributions.format_summary(prefix="lat ")
@@ -0,0 +1,32 @@
+from time import perf_counter
+
+
+class LatestSlot(object):
+    """
+    Single-value mailbox that only ever holds the most recently published item.
+    Publishing is a single attribute assignment and therefore atomic under the GIL, so the producer never
+    takes a lock and never waits for the consumer. Intended for exactly one producer thread.
+    """
+    def __init__(self):
+        self._entry = (0, 0.0, None)  # (sequence number, publish time, item)
+
+    def publish(self, item):
+        """
+        Replaces the content of the slot with item
+        :param item: The item to be published
+        :return: Sequence number of the published item
+        """
+        seq = self._entry[0] + 1
+        self._entry = (seq, perf_counter(), item)
+        return seq
+
+    def get(self) -> tuple:
+        """
+        Reads the content of the slot without removing it
+        :return: Tuple of sequence number, perf_counter() timestamp of publishing and the item itself
+        """
+        return self._entry
+
+    @property
+    def sequence(self) -> int:
+        return self._entry[0]
@@ -0,0 +1,19 @@
+"""
+Deferred imports of heavy dependencies, so that the GUI shows before they are loaded
+"""
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stands in for a module that is imported on first attribute access. Replaces "import module as name" with
+    "name = LazyModule('module')", usages of the module stay unchanged.
+    """
+    def __getattr__(self, attribute: str):
+        # only called for attributes not taken over from the module yet
+        module = importlib.import_module(self.__name__)
+        value = getattr(module, attribute)
+        setattr(self, attribute, value)
+        return value
+
@@ -0,0 +1,118 @@
+import math
+from bisect import bisect_left
+from typing import Callable, Union
+
+# Upper bounds in seconds of the buckets of duration histograms, from a fraction of a stage up to stalls
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.02, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram(object):
+    """
+    Counts values in fixed buckets over the lifetime of the application, as exported to Prometheus.
+    Values must only be observed by one thread at a time, snapshots can be taken from any thread.
+    """
+    def __init__(self, bounds: tuple = DURATION_BUCKETS):
+        """
+        :param bounds: Upper bounds of the buckets (inclusive), a bucket for larger values is added
+        """
+        self.bounds = tuple(sorted(bounds))
+        self._counts: list[int] = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """
+        Gets the distribution
+        :return: Cumulative count of values up to each bound, the last one of all values, and the sum of the values
+        """
+        counts, total = list(self._counts), self.sum
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        return counts, total
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f"{name}=\"{value}\"" for (name, _), value in zip(labels, escaped)) + "}"
+
+
+class MetricsRegistry(object):
+    """
+    Metrics in the Prometheus text exposition format. Values are collected by callbacks when the metrics are rendered,
+    i.e. on the thread serving a scrape, so that exporting them adds nothing to the thread producing them.
+    """
+    def __init__(self):
+        # name, type, help text, label names, collect function
+        self.__metrics: list[tuple[str, str, str, tuple, Callable]] = []
+
+    def gauge(self, name: str, documentation: str, collect: Callable[[], Union[float, dict, None]],
+              labelnames: tuple = ()):
+        """
+        Adds a value that can go up and down
+        :param name: Name of the metric
+        :param documentation: Help text
+        :param collect: Gets the value, or a dict label values tuple -> value if there are labelnames. None values are
+        left out.
+        :param labelnames: Names of the labels
+        :return: None
+        """
+        self.__metrics.append((name, "gauge", documentation, labelnames, collect))
+
+    def counter(self, name: str, documentation: str, collect: Callable[[], Union[float, dict, None]],
+                labelnames: tuple = ()):
+        """ Adds a value that only goes up, except for restarts. Parameters as in gauge, name should end with _total """
+        self.__metrics.append((name, "counter", documentation, labelnames, collect))
+
+    def histogram(self, name: str, documentation: str, collect: Callable[[], Union[Histogram, dict, None]],
+                  labelnames: tuple = ()):
+        """ Adds a distribution, collect gets Histograms instead of values. Parameters as in gauge. """
+        self.__metrics.append((name, "histogram", documentation, labelnames, collect))
+
+    def render(self) -> str:
+        """
+        Collects all metrics
+        :return: Metrics in the Prometheus text exposition format (version 0.0.4)
+        """
+        lines = []
+        for name, metric_type, documentation, labelnames, collect in self.__metrics:
+            samples = collect()
+            if samples is None:
+                continue
+            if not labelnames:
+                samples = {(): samples}
+
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labelvalues, value in samples.items():
+                if value is None:
+                    continue
+                labels = list(zip(labelnames, labelvalues))
+                if metric_type == "histogram":
+                    lines.extend(self.__histogram_lines(name, labels, value))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __histogram_lines(name: str, labels: list[tuple[str, str]], histogram: Histogram) -> list[str]:
+        counts, total = histogram.snapshot()
+        lines = [f"{name}_bucket{_format_labels(labels + [('le', _format_value(float(bound)))])} {count}"
+                 for bound, count in zip(histogram.bounds + (math.inf,), counts)]
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {counts[-1]}")
+        return lines
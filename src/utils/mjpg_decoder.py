@@ -0,0 +1,104 @@
+import heapq
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Union
+
+import cv2 as cv
+import numpy as np
+
+from .color_conversion import bgra_to_mirrored_rgb
+
+
+_REDUCED_FLAGS = {1: cv.IMREAD_COLOR, 2: cv.IMREAD_REDUCED_COLOR_2,
+                  4: cv.IMREAD_REDUCED_COLOR_4, 8: cv.IMREAD_REDUCED_COLOR_8}
+
+
+class MjpgDecodePool(object):
+    """
+    Decodes MJPG color images in a small thread pool. OpenCV releases the GIL while decoding, so decoding runs in
+    parallel to the camera loop and to other decodes. Decoded frames are returned in timestamp order, however the
+    decodes finish. Submit and get from a single thread only.
+    """
+    def __init__(self, workers: int = 2, reduction: int = 2, max_lag: int = 1):
+        """
+        :param workers: Number of decoding threads
+        :param reduction: Images are decoded at 1/reduction of their size, one of 1, 2, 4 or 8
+        :param max_lag: Number of frames get() may leave decoding. 0 waits for the frame submitted last.
+        """
+        if reduction not in _REDUCED_FLAGS:
+            raise ValueError(f"Unsupported reduction {reduction}, must be one of {tuple(_REDUCED_FLAGS)}")
+        self.reduction = reduction
+        self.max_lag = max_lag
+        self.__flags = _REDUCED_FLAGS[reduction]
+        self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mjpg-decode")
+        self.__pending: list[tuple[int, int, Future]] = []  # heap of (timestamp, submission number, future)
+        self.__counter = itertools.count()
+        self.__last_timestamp: Union[int, None] = None
+
+        # statistics
+        self.decoded = 0
+        self.failed = 0  # frames that could not be decoded
+        self.superseded = 0  # decoded frames skipped because a newer frame was ready as well
+        self.late = 0  # frames older than a frame returned before
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending)
+
+    def submit(self, jpeg: np.ndarray, timestamp_usec: int):
+        """
+        Starts decoding a frame
+        :param jpeg: Compressed image as uint8 array. Must stay unchanged until the frame was returned by get().
+        :param timestamp_usec: Device timestamp of the image
+        :return: None
+        """
+        future = self.__executor.submit(self.__decode, jpeg)
+        heapq.heappush(self.__pending, (timestamp_usec, next(self.__counter), future))
+
+    def get(self) -> tuple[Union[int, None], Union[np.ndarray, None]]:
+        """
+        Gets the newest decoded frame, waiting until at most max_lag frames are still decoding.
+        Frames are returned in timestamp order, older frames that were ready as well are skipped.
+        :return: Tuple (device timestamp, mirrored RGB image), (None, None) if no frame is ready
+        """
+        pending = self.__pending
+        timestamp, image = None, None
+        while pending and (len(pending) > self.max_lag or pending[0][2].done()):
+            frame_timestamp, _, future = heapq.heappop(pending)
+            frame = future.result()
+            if frame is None:
+                self.failed += 1
+                continue
+            if self.__last_timestamp is not None and frame_timestamp <= self.__last_timestamp:
+                self.late += 1
+                continue
+            if image is not None:
+                self.superseded += 1
+            timestamp, image = frame_timestamp, frame
+            self.__last_timestamp = frame_timestamp
+            self.decoded += 1
+        return timestamp, image
+
+    def clear(self):
+        """ Waits for and discards all pending frames, e.g. before the cameras restart """
+        for _, _, future in self.__pending:
+            future.result()
+        self.__pending.clear()
+        self.__last_timestamp = None
+
+    def shutdown(self):
+        self.__executor.shutdown(wait=True)
+        self.__pending.clear()
+
+    def get_stats(self) -> dict:
+        return {"pending": self.pending,
+                "decoded": self.decoded,
+                "failed": self.failed,
+                "superseded": self.superseded,
+                "late": self.late}
+
+    def __decode(self, jpeg: np.ndarray) -> Union[np.ndarray, None]:
+        bgr = cv.imdecode(jpeg, self.__flags)
+        if bgr is None:
+            return None
+        return bgra_to_mirrored_rgb(bgr, np.empty_like(bgr))
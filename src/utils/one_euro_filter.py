@@ -35,6 +35,10 @@ class OneEuroFilter:
         """Compute the filtered signal."""
         t_e = t - self.t_prev
 
+        # Repeated or out-of-order timestamp: nothing to be learned, keep the previous state.
+        if t_e <= 0:
+            return self.x_prev
+
         # The filtered derivative of the signal.
         a_d = smoothing_factor(t_e, self.d_cutoff)
         dx = (x - self.x_prev) / t_e
@@ -51,3 +55,17 @@ class OneEuroFilter:
         self.t_prev = t
 
         return x_hat
+
+    def extrapolate(self, t):
+        """
+        Advance the filter to time t without a measurement, e.g. over dropped frames,
+        assuming the signal keeps its filtered derivative.
+        """
+        t_e = t - self.t_prev
+        if t_e <= 0:
+            return self.x_prev
+
+        self.x_prev = self.x_prev + self.dx_prev * t_e
+        self.t_prev = t
+
+        return self.x_prev
@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Union
+
+
+class Preloader(object):
+    """
+    Creates objects in parallel background threads before they are needed, e.g. models that take seconds to load and
+    to run their first inference. Each object is taken once, waiting for it if it is not created yet.
+    """
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self, factories: dict[str, Callable[[], object]],
+                 on_state_change: Union[Callable[[str], None], None] = None):
+        """
+        :param factories: Function creating the object, by name of the object. Each runs in its own daemon thread.
+        :param on_state_change: Called with the new state, LOADING right away, READY or FAILED from the thread that
+        finished last
+        """
+        self.state: str = self.LOADING
+        self.error: Union[BaseException, None] = None  # first exception raised by a factory
+        self.__on_state_change = on_state_change
+        self.__lock = threading.Lock()
+        self.__pending = len(factories)
+        self.__futures: dict[str, Future] = {name: Future() for name in factories}
+
+        if on_state_change is not None:
+            on_state_change(self.state)
+
+        for name, factory in factories.items():
+            future = self.__futures[name]
+            future.add_done_callback(self.__on_done)
+            threading.Thread(target=self.__create, args=(future, factory), name=f"preload-{name}", daemon=True).start()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == self.READY
+
+    def take(self, name: str, timeout: Union[float, None] = None) -> object:
+        """
+        Takes a created object, waiting until it is created
+        :param name: Name of the object
+        :param timeout: Seconds to wait at most, None to wait until the object is created
+        :return: The object. Raises the exception of its factory if creating it failed, KeyError if taken before.
+        """
+        return self.__futures.pop(name).result(timeout)
+
+    @staticmethod
+    def __create(future: Future, factory: Callable[[], object]):
+        try:
+            future.set_result(factory())
+        except BaseException as e:
+            future.set_exception(e)
+
+    def __on_done(self, future: Future):
+        with self.__lock:
+            if future.exception() is not None and self.error is None:
+                self.error = future.exception()
+            self.__pending -= 1
+            if self.__pending:
+                return
+            self.state = self.READY if self.error is None else self.FAILED
+
+        if self.__on_state_change is not None:
+            self.__on_state_change(self.state)
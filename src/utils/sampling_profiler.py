@@ -0,0 +1,108 @@
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from time import perf_counter, strftime
+from typing import Callable, Union
+
+
+class SamplingProfiler(object):
+    """
+    Wall-clock sampling profiler for selected threads, switched on at runtime. A background thread reads the stacks of
+    all threads with sys._current_frames() every interval and counts those of the selected threads. The profiled
+    threads run unmodified, the overhead is the sampling thread holding the GIL for a few microseconds per sample.
+    The result is written in the collapsed stack format of flamegraph.pl, speedscope and inferno.
+    """
+    def __init__(self, interval: float = 0.01, max_depth: int = 128):
+        """
+        :param interval: Seconds between two samples
+        :param max_depth: Frames kept per stack, counted from the innermost one
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.__thread: Union[threading.Thread, None] = None
+        self.__stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self, duration: float, path: str, thread_names: tuple[str, ...], tags: Union[dict, None] = None,
+              on_done: Union[Callable[[str], None], None] = None):
+        """
+        Starts sampling in a background thread, the file is written once done
+        :param duration: Seconds to sample for
+        :param path: Path of the collapsed stack file, its directory is created if missing
+        :param thread_names: Threads whose name starts with one of these are sampled
+        :param tags: Written to a JSON file next to it together with the sampling details, e.g. the configuration
+        :param on_done: Called with the path from the sampling thread after the file was written
+        :return: None. Raises RuntimeError if already running.
+        """
+        if self.running:
+            raise RuntimeError("Profiler is already running")
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, args=(duration, path, thread_names, tags or {}, on_done),
+                                         name="sampling-profiler", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """ Stops sampling early and waits for the file to be written. """
+        if self.__thread is not None:
+            self.__stop.set()
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self, duration: float, path: str, thread_names: tuple[str, ...], tags: dict,
+              on_done: Union[Callable[[str], None], None]):
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        started_at = strftime("%Y-%m-%d %H:%M:%S")
+        started = perf_counter()
+        end = started + duration
+
+        while perf_counter() < end and not self.__stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                name = names.get(ident)
+                if ident != own_ident and name is not None and name.startswith(thread_names):
+                    stacks[self.__collapse(name, frame)] += 1
+            samples += 1
+
+        details = {"started": started_at,
+                   "duration_s": round(perf_counter() - started, 3),
+                   "interval_ms": self.interval * 1000,
+                   "samples": samples,
+                   **tags}
+        self.write_collapsed(path, stacks, details)
+        if on_done is not None:
+            on_done(path)
+
+    def __collapse(self, thread_name: str, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        names.append(thread_name)
+        return ";".join(reversed(names))
+
+    @staticmethod
+    def write_collapsed(path: str, stacks: dict[str, int], tags: dict):
+        """
+        Writes stacks in the collapsed format, one "root;...;leaf count" line per stack. Flame graph tools read every
+        line ending in a number as a stack, so the tags go to a JSON file with the same name and the .json extension.
+        :param path: Path of the file, its directory is created if missing
+        :param stacks: Number of samples by collapsed stack
+        :param tags: Written to the JSON file
+        :return: None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        with open(os.path.splitext(path)[0] + ".json", "w") as f:
+            json.dump(tags, f, indent=2, default=str)
@@ -0,0 +1,185 @@
+import json
+import threading
+from time import perf_counter, time
+from typing import Union
+
+from .metrics import Histogram
+
+
+class LatencyWindow(object):
+    """
+    Fixed-size ring buffer of the most recent durations of one stage, with percentile summaries.
+    Optionally also counts all durations in a Histogram, for exporting them.
+    """
+    def __init__(self, size: int = 256, histogram_bounds: tuple = ()):
+        self._values: list[float] = [0.0] * size
+        self._size = size
+        self._index = 0
+        self.count = 0  # total number of recorded values
+        self.last = 0.0
+        self.histogram: Union[Histogram, None] = Histogram(histogram_bounds) if histogram_bounds else None
+
+    def add(self, value: float):
+        self._values[self._index] = value
+        self._index = (self._index + 1) % self._size
+        self.count += 1
+        self.last = value
+        if self.histogram is not None:
+            self.histogram.observe(value)
+
+    def percentiles(self, percentiles: tuple = (50, 95, 99)) -> tuple:
+        """
+        Calculates percentiles over the values in the window (nearest-rank method)
+        :param percentiles: Percentiles to be calculated, between 0 and 100
+        :return: Tuple of values, one per percentile. Zeros if nothing was recorded.
+        """
+        n = min(self.count, self._size)
+        if n == 0:
+            return tuple(0.0 for _ in percentiles)
+        values = sorted(self._values[:n])
+        return tuple(values[min(n - 1, int(p / 100 * n))] for p in percentiles)
+
+    def max(self) -> float:
+        n = min(self.count, self._size)
+        return max(self._values[:n]) if n else 0.0
+
+
+class _StageMeasurement(object):
+    """ Reusable context manager measuring one stage """
+    __slots__ = ("_window", "_start")
+
+    def __init__(self, window: LatencyWindow):
+        self._window = window
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._window.add(perf_counter() - self._start)
+        return False
+
+
+class StageTimer(object):
+    """
+    Always-on timing of the stages of the camera loop using monotonic perf_counter() timestamps.
+    Each stage keeps a window of its most recent durations. A stage must only be measured by one thread at a time.
+    """
+    def __init__(self, stages: tuple = (), window_size: int = 256, histogram_bounds: tuple = ()):
+        """
+        :param stages: Names of the stages, defines the order in summaries. Unknown stages are added on first use.
+        :param window_size: Number of durations kept per stage
+        :param histogram_bounds: Bucket bounds in seconds of histograms counting all durations of each stage,
+        empty for no histograms
+        """
+        self.window_size = window_size
+        self.histogram_bounds = histogram_bounds
+        self._windows: dict[str, LatencyWindow] = {}
+        self._measurements: dict[str, _StageMeasurement] = {}
+        for stage in stages:
+            self._add_stage(stage)
+
+        self.__dump_thread: Union[threading.Thread, None] = None
+        self.__dump_stop = threading.Event()
+
+    def _add_stage(self, stage: str) -> LatencyWindow:
+        window = LatencyWindow(self.window_size, self.histogram_bounds)
+        self._windows[stage] = window
+        self._measurements[stage] = _StageMeasurement(window)
+        return window
+
+    @property
+    def stages(self) -> tuple:
+        return tuple(self._windows)
+
+    def measure(self, stage: str) -> _StageMeasurement:
+        """
+        Context manager recording the duration of its body as stage
+        :param stage: Name of the stage
+        :return: Context manager
+        """
+        measurement = self._measurements.get(stage)
+        if measurement is None:
+            self._add_stage(stage)
+            measurement = self._measurements[stage]
+        return measurement
+
+    def record(self, stage: str, duration: float):
+        """
+        Records a duration that was measured elsewhere
+        :param stage: Name of the stage
+        :param duration: Duration in seconds
+        :return: None
+        """
+        window = self._windows.get(stage)
+        if window is None:
+            window = self._add_stage(stage)
+        window.add(duration)
+
+    def get_window(self, stage: str) -> Union[LatencyWindow, None]:
+        return self._windows.get(stage)
+
+    def get_histograms(self) -> dict[str, Histogram]:
+        """
+        Gets the histograms of all stages, empty if created without histogram_bounds
+        :return: Dict stage -> Histogram of all its durations in seconds
+        """
+        return {stage: window.histogram for stage, window in list(self._windows.items())
+                if window.histogram is not None}
+
+    def get_summary(self) -> dict:
+        """
+        Summarizes all stages
+        :return: Dict stage -> dict with count, last, p50, p95, p99 and max duration in milliseconds
+        """
+        summary = {}
+        for stage, window in list(self._windows.items()):
+            p50, p95, p99 = window.percentiles((50, 95, 99))
+            summary[stage] = {"count": window.count,
+                              "last": round(window.last * 1000, 3),
+                              "p50": round(p50 * 1000, 3),
+                              "p95": round(p95 * 1000, 3),
+                              "p99": round(p99 * 1000, 3),
+                              "max": round(window.max() * 1000, 3)}
+        return summary
+
+    def format_summary(self, prefix: str = "t ") -> dict:
+        """
+        Summarizes all stages as short strings for display in the GUI
+        :param prefix: Prefix of the keys
+        :return: Dict "<prefix><stage>" -> "p50 / p95 / p99" in milliseconds
+        """
+        return {f"{prefix}{stage}": f"{s['p50']:.1f} / {s['p95']:.1f} / {s['p99']:.1f}"
+                for stage, s in self.get_summary().items()}
+
+    def start_dump(self, path: str, interval: float = 10):
+        """
+        Starts a background thread appending the summary as one JSON line to a file every interval seconds
+        :param path: Path of the file
+        :param interval: Seconds between two dumps
+        :return: None
+        """
+        self.stop_dump()
+        self.__dump_stop.clear()
+        self.__dump_thread = threading.Thread(target=self.__dump_loop, args=(path, interval), daemon=True)
+        self.__dump_thread.start()
+
+    def stop_dump(self):
+        if self.__dump_thread is not None:
+            self.__dump_stop.set()
+            self.__dump_thread.join()
+            self.__dump_thread = None
+
+    def __dump_loop(self, path: str, interval: float):
+        while not self.__dump_stop.wait(interval):
+            self.dump(path)
+
+    def dump(self, path: str):
+        """
+        Appends the current summary as one JSON line to a file
+        :param path: Path of the file
+        :return: None
+        """
+        with open(path, "a") as f:
+            f.write(json.dumps({"time": time(), "stages": self.get_summary()}) + "\n")
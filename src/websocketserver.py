@@ -1,29 +1,177 @@
+import asyncio
 import json
 import threading
-from websocket_server import WebsocketServer
+from collections import deque
+from time import perf_counter
+from typing import Union
+
+import websockets
+
+from utils import LatestSlot, event_log
+
+
+def _client_address(websocket) -> str:
+    address = websocket.remote_address
+    return f"{address[0]}:{address[1]}" if address else "unknown"
+
+
+class _Client(object):
+    """
+    Connected websocket client with its own bounded message queue.
+    When the queue is full, the oldest message is dropped in favour of the new one.
+    """
+    def __init__(self, websocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: deque = deque(maxlen=queue_size)
+        self.wakeup = asyncio.Event()
+
+        self.sent = 0
+        self.dropped = 0
+        self.last_lag = 0.0  # seconds between publishing a message and it being written to this client
+        self.max_lag = 0.0
+
+    def push(self, published_at: float, payload: str):
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append((published_at, payload))
+        self.wakeup.set()
 
 
 class Server(object):
+    """
+    Websocket server broadcasting the latest interaction state to all connected clients.
+    Runs an asyncio event loop in its own thread. The calling thread only publishes into a LatestSlot,
+    so a slow client can never stall the camera loop.
+    """
 
-    def __init__(self, host="localhost", port=8765):
+    def __init__(self, host="localhost", port=8765, queue_size=4):
         self.host = host
         self.port = port
+        self.queue_size = queue_size
 
-        self.__server = None
+        self.__slot = LatestSlot()
+        self.__clients: set[_Client] = set()
+
+        self.__thread: Union[threading.Thread, None] = None
+        self.__loop: Union[asyncio.AbstractEventLoop, None] = None
+        self.__new_message: Union[asyncio.Event, None] = None
+        self.__stop: Union[asyncio.Event, None] = None
+        self.__startup_error: Union[Exception, None] = None
 
     def open_server(self):
-        self.__server = WebsocketServer(host=self.host, port=self.port)
-        self.__server.set_fn_new_client(_new_client)
-        self.__server.run_forever(True)
+        """
+        Starts the broadcaster thread and waits until the server is listening.
+        :return: None
+        """
+        started = threading.Event()
+        self.__startup_error = None
+        self.__thread = threading.Thread(target=self.__run, args=(started,), daemon=True)
+        self.__thread.start()
+        started.wait()
+        if self.__startup_error is not None:
+            raise self.__startup_error
 
     def close_server(self):
-        self.__server.shutdown_gracefully()
+        """
+        Closes all client connections and stops the broadcaster thread.
+        :return: None
+        """
+        loop = self.__loop
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self.__stop.set)
+        self.__thread.join()
 
     def send_json(self, message: dict):
-        self.__server.send_message_to_all(json.dumps(message))
+        """
+        Publishes a message to all clients. Does not wait for any client.
+        :param message: Message to be sent, must be json serializable
+        :return: None
+        """
+        self.__slot.publish(json.dumps(message))
+        loop = self.__loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.__new_message.set)
+
+    def get_stats(self) -> dict:
+        """
+        Gets backpressure and lag metrics of the broadcaster
+        :return: Dict with number of published messages and per-client queue depth, sent and dropped messages
+        and send lag in milliseconds
+        """
+        clients = [{"queue_depth": len(client.queue),
+                    "sent": client.sent,
+                    "dropped": client.dropped,
+                    "lag_ms": round(client.last_lag * 1000, 2),
+                    "max_lag_ms": round(client.max_lag * 1000, 2)}
+                   for client in list(self.__clients)]
+        return {"published": self.__slot.sequence,
+                "clients": clients}
+
+    def __run(self, started: threading.Event):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.__serve(started))
+        except Exception as e:
+            self.__startup_error = e
+        finally:
+            self.__loop = None
+            started.set()
+            loop.close()
+
+    async def __serve(self, started: threading.Event):
+        self.__new_message = asyncio.Event()
+        self.__stop = asyncio.Event()
+
+        async with websockets.serve(self.__handle_client, self.host, self.port):
+            self.__loop = asyncio.get_running_loop()
+            started.set()
+
+            distributor = asyncio.create_task(self.__distribute())
+            await self.__stop.wait()
+            distributor.cancel()
+
+    async def __distribute(self):
+        """ Moves newly published messages from the slot into every client queue. """
+        last_seq = 0
+        while True:
+            await self.__new_message.wait()
+            self.__new_message.clear()
+
+            seq, published_at, payload = self.__slot.get()
+            if seq == last_seq:
+                continue
+            last_seq = seq
+
+            for client in self.__clients:
+                client.push(published_at, payload)
+
+    async def __handle_client(self, websocket, path=None):
+        client = _Client(websocket, self.queue_size)
+        self.__clients.add(client)
+        event_log.record("websocket_connected", client=_client_address(websocket), clients=len(self.__clients))
+
+        # wake up the send loop when the connection closes, so the handler can finish
+        closed = asyncio.create_task(websocket.wait_closed())
+        closed.add_done_callback(lambda _: client.wakeup.set())
 
-def _new_client(client, server):
-    print("new client")
+        try:
+            while not closed.done():
+                await client.wakeup.wait()
+                client.wakeup.clear()
+                while client.queue:
+                    published_at, payload = client.queue.popleft()
+                    await websocket.send(payload)
+                    client.sent += 1
+                    client.last_lag = perf_counter() - published_at
+                    client.max_lag = max(client.max_lag, client.last_lag)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.__clients.discard(client)
+            event_log.record("websocket_disconnected", client=_client_address(websocket), sent=client.sent,
+                             dropped=client.dropped, clients=len(self.__clients))
 
 # if __name__ == "__main__":
 #     # Simple standalone example of this module sending randomized dummy data